@@ -15,23 +15,48 @@ Renam - Image File Sorter and Renamer
 - gui/: 사용자 인터페이스
 """
 
+import argparse
 import sys
 import customtkinter as ctk
+from core.rename_journal import RenameJournal
 from gui.main_window import RenamMainWindow
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    명령행 옵션 해석
+
+    Args:
+        argv: 옵션 리스트 (None 이면 sys.argv)
+
+    Returns:
+        해석된 옵션
+    """
+    parser = argparse.ArgumentParser(description="Renam - 이미지 파일 정렬 및 일괄 이름 변경 도구")
+    parser.add_argument(
+        "--preview", choices=sorted(RenamMainWindow.PREVIEW_BACKENDS), default="labels",
+        help="미리보기 렌더러 (labels: 기본 위젯 표, tree: ttk.Treeview - 파일이 많은 폴더에 유리)"
+    )
+    parser.add_argument(
+        "--durability", choices=RenameJournal.DURABILITY_MODES, default=RenameJournal.DURABILITY_BATCH,
+        help="이름 변경 저널 내구성 (batch: 묶음 단위 fsync, directory: + 작업 폴더 fsync, none: fsync 없음)"
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """
     애플리케이션 진입점
     책임: 애플리케이션 초기화 및 실행
     """
+    args = parse_args()
     try:
         # CustomTkinter 기본 설정
         ctk.set_appearance_mode("light")  # "light" or "dark"
         ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
         
         root = ctk.CTk()
-        app = RenamMainWindow(root)
+        app = RenamMainWindow(root, preview_backend=args.preview, durability=args.durability)
         app.run()
     except KeyboardInterrupt:
         print("\n프로그램을 종료합니다.")
@@ -0,0 +1,99 @@
+"""
+Background Task Module
+백그라운드 작업 실행 로직 (단일 책임: 작업 스레드와 UI 스레드 사이 진행 상황 전달)
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+
+# 진행 상황 보고 함수: (완료 수, 전체 수)
+ProgressCallback = Callable[[int, int], None]
+
+
+class BackgroundTask:
+    """
+    백그라운드 작업 클래스
+    책임: 작업 함수를 별도 스레드에서 실행하고, 진행 상황/결과를 스레드 안전한 큐로 전달
+
+    작업 함수는 (progress, cancel_event) 를 인자로 받습니다.
+    UI 스레드는 poll() 을 주기적으로(Tk after) 호출하여 상태를 가져가며,
+    Tk 위젯은 작업 스레드에서 절대 건드리지 않습니다.
+    """
+
+    def __init__(self, target: Callable[[ProgressCallback, threading.Event], Any], name: str = ""):
+        """
+        Args:
+            target: 작업 함수 (progress, cancel_event) -> 결과
+            name: 작업 이름 (표시용)
+        """
+        self.target = target
+        self.name = name
+        self.cancel_event = threading.Event()
+
+        self.finished = False
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.progress: Tuple[int, int] = (0, 0)
+
+        self._queue: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """작업 스레드 시작"""
+        self._thread = threading.Thread(target=self._run, name=f"renam-{self.name}", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """취소 요청 (작업 함수가 일관된 지점에서 멈추고 정리)"""
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 요청 여부"""
+        return self.cancel_event.is_set()
+
+    def poll(self) -> bool:
+        """
+        큐에 쌓인 상태 반영 (UI 스레드에서 호출)
+
+        Returns:
+            작업 완료 여부 (완료 시 result / error 사용 가능)
+        """
+        while True:
+            try:
+                kind, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.progress = value
+            elif kind == "done":
+                self.result = value
+                self.finished = True
+            elif kind == "error":
+                self.error = value
+                self.finished = True
+        return self.finished
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        작업 종료 대기 (테스트/종료 처리용)
+
+        Returns:
+            완료 여부
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.poll()
+
+    def _run(self) -> None:
+        try:
+            result = self.target(self._report, self.cancel_event)
+        except BaseException as e:  # 작업 스레드 예외는 UI 스레드에서 처리
+            self._queue.put(("error", e))
+            return
+        self._queue.put(("done", result))
+
+    def _report(self, done: int, total: int) -> None:
+        self._queue.put(("progress", (done, total)))
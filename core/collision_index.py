@@ -0,0 +1,179 @@
+"""
+Collision Index Module
+디스크 파일명 충돌 검사 로직 (단일 책임: 새 파일명과 폴더 내 기존 파일명 충돌 검출/해결)
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+
+class CollisionResult:
+    """
+    충돌 검사 결과 클래스
+    책임: 충돌 인덱스, 해결된 대상 이름, 건너뛴 인덱스 보관
+    """
+
+    def __init__(self, targets: List[str], conflicts: List[int], skipped: List[int]):
+        """
+        Args:
+            targets: 해결 후 대상 파일명 리스트 (건너뛴 항목은 원본 이름)
+            conflicts: 충돌이 발견된 항목 인덱스 리스트
+            skipped: 건너뛴 항목 인덱스 리스트
+        """
+        self.targets = targets
+        self.conflicts = conflicts
+        self.skipped = skipped
+
+    @property
+    def has_conflicts(self) -> bool:
+        """충돌 존재 여부"""
+        return bool(self.conflicts)
+
+
+class CollisionIndex:
+    """
+    디스크 파일명 충돌 인덱스 클래스
+    책임: 디렉토리 목록 1회 조회로 해시 집합을 만들고, 배치 전체 충돌을 O(n) 으로 검사
+
+    대소문자를 구분하지 않는 볼륨(Windows, macOS 기본)은 casefold 키로 흉내 냅니다.
+    """
+
+    # 충돌 해결 전략
+    STRATEGY_ABORT = "abort"    # 충돌이 있으면 아무것도 변경하지 않음
+    STRATEGY_SUFFIX = "suffix"  # 충돌 항목에 " (2)" 형태 번호 자동 부여
+    STRATEGY_SKIP = "skip"      # 충돌 항목은 이름을 바꾸지 않음
+
+    # 대소문자를 구분하지 않는 기본 파일 시스템을 쓰는 플랫폼
+    CASE_INSENSITIVE_PLATFORMS = ('win32', 'darwin')
+
+    def __init__(self, names: Iterable[str], case_insensitive: Optional[bool] = None):
+        """
+        인덱스 초기화
+
+        Args:
+            names: 폴더 내 기존 파일명 목록
+            case_insensitive: 대소문자 무시 여부 (None 이면 플랫폼 기본값)
+        """
+        if case_insensitive is None:
+            case_insensitive = sys.platform in CollisionIndex.CASE_INSENSITIVE_PLATFORMS
+        self.case_insensitive = case_insensitive
+        self._keys: Set[str] = {self.key(name) for name in names}
+
+    @classmethod
+    def from_directory(cls, folder: Path, case_insensitive: Optional[bool] = None) -> "CollisionIndex":
+        """
+        디렉토리 목록 1회 조회로 인덱스 생성
+
+        Args:
+            folder: 대상 폴더
+            case_insensitive: 대소문자 무시 여부 (None 이면 플랫폼 기본값)
+
+        Returns:
+            CollisionIndex
+        """
+        with os.scandir(folder) as entries:
+            names = [entry.name for entry in entries]
+        return cls(names, case_insensitive)
+
+    def key(self, name: str) -> str:
+        """
+        비교용 키 생성
+
+        Args:
+            name: 파일명
+
+        Returns:
+            대소문자 무시 모드면 casefold 된 이름
+        """
+        return name.casefold() if self.case_insensitive else name
+
+    def __contains__(self, name: str) -> bool:
+        return self.key(name) in self._keys
+
+    def resolve(self, sources: List[str], targets: List[str],
+                strategy: str = STRATEGY_ABORT) -> CollisionResult:
+        """
+        배치 이름 변경의 충돌 검사 및 해결
+
+        배치 안의 원본 이름은 이동되므로 충돌로 보지 않으며,
+        배치 밖 파일(이미지가 아닌 파일, 미리보기에서 제거된 파일 등)과
+        대상 이름끼리의 중복을 충돌로 판단합니다.
+
+        Args:
+            sources: 현재 파일명 리스트
+            targets: 대상 파일명 리스트
+            strategy: 충돌 해결 전략 (STRATEGY_ABORT / STRATEGY_SUFFIX / STRATEGY_SKIP)
+
+        Returns:
+            CollisionResult
+        """
+        key = self.key
+        source_keys = {key(name) for name in sources}
+        # 배치 밖에서 이름을 점유하고 있는 파일
+        occupied = self._keys - source_keys
+
+        conflicts = self._find_conflicts(targets, occupied)
+        if not conflicts or strategy == self.STRATEGY_ABORT:
+            return CollisionResult(list(targets), conflicts, [])
+
+        if strategy == self.STRATEGY_SKIP:
+            return self._resolve_skip(sources, targets, occupied, conflicts)
+        if strategy == self.STRATEGY_SUFFIX:
+            return self._resolve_suffix(targets, occupied, conflicts)
+        raise ValueError(f"알 수 없는 충돌 해결 전략: {strategy}")
+
+    def _find_conflicts(self, targets: List[str], occupied: Set[str],
+                        skipped: Set[int] = frozenset()) -> List[int]:
+        """대상 이름 중 점유된 이름 또는 앞선 대상과 중복되는 항목 인덱스 (건너뛴 항목 제외)"""
+        key = self.key
+        seen: Set[str] = set()
+        conflicts = []
+        for i, target in enumerate(targets):
+            if i in skipped:
+                continue
+            k = key(target)
+            if k in occupied or k in seen:
+                conflicts.append(i)
+            seen.add(k)
+        return conflicts
+
+    def _resolve_skip(self, sources: List[str], targets: List[str],
+                      occupied: Set[str], conflicts: List[int]) -> CollisionResult:
+        """충돌 항목을 원래 이름에 남김 (남은 이름이 새 충돌을 만들면 반복)"""
+        key = self.key
+        resolved = list(targets)
+        skipped: Set[int] = set()
+        pending = conflicts
+
+        # 건너뛴 파일은 원래 이름을 계속 점유하므로, 새 충돌이 없을 때까지 반복
+        while pending:
+            for i in pending:
+                skipped.add(i)
+                resolved[i] = sources[i]
+            blocked = occupied | {key(sources[i]) for i in skipped}
+            pending = self._find_conflicts(resolved, blocked, skipped)
+
+        return CollisionResult(resolved, conflicts, sorted(skipped))
+
+    def _resolve_suffix(self, targets: List[str], occupied: Set[str],
+                        conflicts: List[int]) -> CollisionResult:
+        """충돌 항목에 사용 가능한 번호 접미사 부여 (예: 1.jpg → 1 (2).jpg)"""
+        key = self.key
+        resolved = list(targets)
+        conflict_set = set(conflicts)
+        # 충돌하지 않은 대상 이름은 그대로 확정
+        taken = occupied | {key(t) for i, t in enumerate(targets) if i not in conflict_set}
+
+        for i in conflicts:
+            stem, ext = os.path.splitext(targets[i])
+            number = 2
+            candidate = f"{stem} ({number}){ext}"
+            while key(candidate) in taken:
+                number += 1
+                candidate = f"{stem} ({number}){ext}"
+            resolved[i] = candidate
+            taken.add(key(candidate))
+
+        return CollisionResult(resolved, conflicts, [])
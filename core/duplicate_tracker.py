@@ -0,0 +1,121 @@
+"""
+Duplicate Tracker Module
+새 파일명 중복 추적 로직 (단일 책임: 위치별 이름과 이름별 개수를 증분 관리)
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from core.collision_index import CollisionIndex
+
+
+class DuplicateTracker:
+    """
+    새 파일명 중복 추적 클래스
+    책임: 이름별 개수 맵을 유지하여 변경된 위치만으로 중복 여부를 O(변경 수) 로 갱신
+
+    전체 이름 목록을 다시 만드는 대신, 이동/제거/패턴 변경으로 바뀐 구간만
+    update() / remove() 로 반영합니다.
+    이름은 CollisionIndex 와 같은 키로 세므로, 대소문자를 구분하지 않는 볼륨에서는
+    대소문자만 다른 이름도 중복입니다.
+    """
+
+    def __init__(self, case_insensitive: Optional[bool] = None):
+        """
+        Args:
+            case_insensitive: 대소문자 무시 여부 (None 이면 플랫폼 기본값, CollisionIndex 와 같음)
+        """
+        self._key = CollisionIndex((), case_insensitive).key
+        self._names: List[str] = []         # 위치별 새 파일명
+        self._counts: Dict[str, int] = {}   # 비교용 키 -> 개수
+        self._duplicate_keys = 0            # 개수가 2 이상인 이름 수
+        self.active = False                 # 현재 탭과 동기화되어 있는지
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def has_duplicates(self) -> bool:
+        """중복 이름 존재 여부 (O(1))"""
+        return self._duplicate_keys > 0
+
+    def duplicates(self) -> List[str]:
+        """
+        중복된 이름 목록
+
+        Returns:
+            2번 이상 등장하는 이름 리스트 (같은 키의 이름은 처음 나온 것 하나만)
+        """
+        seen = set()
+        result = []
+        for name in self._names:
+            key = self._key(name)
+            if self._counts[key] > 1 and key not in seen:
+                seen.add(key)
+                result.append(name)
+        return result
+
+    def reset(self, names: Iterable[str]) -> None:
+        """
+        전체 이름으로 다시 구성 (패턴/탭 변경 시)
+
+        Args:
+            names: 위치 순서의 새 파일명
+        """
+        self._names = list(names)
+        self._counts = {}
+        self._duplicate_keys = 0
+        for name in self._names:
+            self._add(name)
+        self.active = True
+
+    def clear(self) -> None:
+        """추적 중단 (중복 검사가 필요 없는 패턴)"""
+        self._names = []
+        self._counts = {}
+        self._duplicate_keys = 0
+        self.active = False
+
+    def update(self, start: int, names: Sequence[str]) -> None:
+        """
+        연속 구간의 이름 갱신
+
+        Args:
+            start: 시작 위치
+            names: start 부터의 새 파일명
+        """
+        for offset, name in enumerate(names):
+            position = start + offset
+            old = self._names[position]
+            if old == name:
+                continue
+            self._discard(old)
+            self._add(name)
+            self._names[position] = name
+
+    def remove(self, positions: Iterable[int]) -> None:
+        """
+        위치 제거 (뒤쪽 위치는 앞으로 당겨짐)
+
+        Args:
+            positions: 제거할 위치 목록
+        """
+        for position in sorted(positions, reverse=True):
+            self._discard(self._names[position])
+            del self._names[position]
+
+    def _add(self, name: str) -> None:
+        key = self._key(name)
+        count = self._counts.get(key, 0) + 1
+        self._counts[key] = count
+        if count == 2:
+            self._duplicate_keys += 1
+
+    def _discard(self, name: str) -> None:
+        key = self._key(name)
+        count = self._counts[key] - 1
+        if count == 1:
+            self._duplicate_keys -= 1
+        if count:
+            self._counts[key] = count
+        else:
+            del self._counts[key]
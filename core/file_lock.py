@@ -0,0 +1,159 @@
+"""
+File Lock Module
+프로세스 간 권고 잠금 (단일 책임: 같은 파일/폴더를 다루는 여러 Renam 인스턴스 직렬화)
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+class FileLockTimeout(TimeoutError):
+    """제한 시간 안에 잠금을 얻지 못함 (다른 프로세스가 사용 중)"""
+
+    def __init__(self, path: Path, timeout: float):
+        """
+        Args:
+            path: 잠그려던 경로
+            timeout: 기다린 시간 (초)
+        """
+        super().__init__(f"다른 프로그램이 사용 중입니다 ({timeout:g}초 대기): {path}")
+        self.path = path
+        self.timeout = timeout
+
+
+class FileLock:
+    """
+    프로세스 간 권고 잠금 클래스
+    책임: 파일 또는 폴더에 배타 잠금을 걸고, 잠겨 있으면 제한 시간까지 주기적으로 재시도
+
+    POSIX 는 fcntl.flock (폴더는 디렉토리 fd 자체를 잠금 → 잠금 파일을 만들지 않음),
+    Windows 는 msvcrt.locking (파일만 지원, 폴더 잠금은 생략) 을 사용합니다.
+    같은 스레드는 다시 잠가도 되며(중첩 횟수 관리), 같은 객체를 쓰는 다른 스레드는 해제될 때까지
+    기다립니다. 잠금은 프로세스가 끝나면 커널이 풉니다.
+    """
+
+    POLL_INTERVAL = 0.05  # 재시도 간격 (초)
+
+    def __init__(self, path: Path, timeout: float = 10.0):
+        """
+        Args:
+            path: 잠글 파일(없으면 생성) 또는 폴더
+            timeout: 잠금 대기 제한 시간 (초, 0 이면 한 번만 시도)
+        """
+        self.path = path
+        self.timeout = timeout
+
+        self._fd: Optional[int] = None
+        self._depth = 0
+        self._thread_lock = threading.RLock()  # 같은 프로세스 안의 스레드 간 잠금 (잡은 동안 유지)
+
+    @staticmethod
+    def supported() -> bool:
+        """
+        프로세스 간 잠금 지원 여부
+
+        Returns:
+            fcntl 또는 msvcrt 사용 가능 여부
+        """
+        return fcntl is not None or msvcrt is not None
+
+    def acquire(self) -> None:
+        """
+        잠금 획득 (이미 잡고 있으면 중첩 횟수만 증가)
+
+        Raises:
+            FileLockTimeout: 제한 시간 안에 잠금을 얻지 못함
+            OSError: 잠글 파일을 열 수 없음
+        """
+        deadline = time.monotonic() + self.timeout
+        if not self._thread_lock.acquire(timeout=self.timeout):
+            raise FileLockTimeout(self.path, self.timeout)
+        if self._depth:
+            self._depth += 1
+            return
+
+        try:
+            fd = self._open()
+            if fd is not None:
+                while not self._try_lock(fd):
+                    if time.monotonic() >= deadline:
+                        os.close(fd)
+                        raise FileLockTimeout(self.path, self.timeout)
+                    time.sleep(self.POLL_INTERVAL)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        self._fd = fd
+        self._depth = 1
+
+    def release(self) -> None:
+        """잠금 해제 (중첩된 경우 마지막 해제에서만 실제로 풂)"""
+        if not self._depth:
+            return
+        self._depth -= 1
+        try:
+            if not self._depth and self._fd is not None:
+                try:
+                    self._unlock(self._fd)
+                finally:
+                    os.close(self._fd)
+                    self._fd = None
+        finally:
+            self._thread_lock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    # ==================== 플랫폼별 ====================
+
+    def _open(self) -> Optional[int]:
+        """잠금용 fd 열기 (잠글 수 없는 대상이면 None - 잠금 생략)"""
+        if self.path.is_dir():
+            if fcntl is None:
+                return None  # Windows 는 폴더를 열어 잠글 수 없음
+            return os.open(self.path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        if not self.supported():
+            return None
+        return os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    @staticmethod
+    def _try_lock(fd: int) -> bool:
+        """잠금 한 번 시도 (다른 프로세스가 잡고 있으면 False)"""
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            return True
+
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _unlock(fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
@@ -3,10 +3,43 @@ File Operations Module
 파일 시스템 작업 로직 (단일 책임: 파일 입출력)
 """
 
+import os
 from pathlib import Path
-from typing import List, Tuple
-from models.file_item import FileItem
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from models.file_item import FileItem, Anchors
 from core.name_generator import NameGenerator
+from core.collision_index import CollisionIndex
+from core.name_rules import NameRules
+from core.rename_planner import RenamePlanner, RenamePlan, RenameStep
+from core.rename_journal import RenameJournal, JournalEntry
+from core.rename_engine import RenameEngine, PathRenameEngine
+from core.file_lock import FileLock, FileLockTimeout
+from core.background_task import ProgressCallback
+from core.snapshot import SnapshotReport, VerificationReport
+
+
+class RenameExecutionError(OSError):
+    """
+    계획 실행 중 이름 변경 실패
+    실행된 단계는 역순으로 되돌린 뒤 발생하며, 모두 되돌렸는지 함께 전달합니다.
+    """
+
+    def __init__(self, cause: OSError, unrestored: int):
+        """
+        Args:
+            cause: 원인이 된 OSError
+            unrestored: 되돌리지 못한 단계 수 (0 이면 원래 상태로 완전히 복구됨)
+        """
+        super().__init__(str(cause))
+        self.cause = cause
+        self.unrestored = unrestored
+
+    @property
+    def rolled_back(self) -> bool:
+        """폴더가 실행 전 상태로 완전히 돌아왔는지"""
+        return self.unrestored == 0
 
 
 class FileOperations:
@@ -15,6 +48,21 @@ class FileOperations:
     책임: 파일 스캔, 읽기, 이름 변경 등 파일 시스템 작업
     """
 
+    # 진행 상황 보고 간격 (단계 수)
+    PROGRESS_INTERVAL = 256
+
+    # 여러 폴더를 동시에 처리할 때의 최대 작업 스레드 수
+    MAX_FOLDER_WORKERS = 4
+
+    # 한 폴더 안에서 독립된 체인을 동시에 실행할 작업 스레드 수 (네트워크 드라이브 지연 숨김)
+    PIPELINE_WORKERS = 8
+
+    # 쓸 수 없는 파일명 오류 메시지에 표시할 최대 행 수
+    INVALID_NAMES_SHOWN = 5
+
+    # 다른 Renam 인스턴스가 같은 폴더를 처리 중일 때 기다리는 최대 시간 (초)
+    FOLDER_LOCK_TIMEOUT = 30.0
+
     @staticmethod
     def scan_folder(folder_path: Path) -> List[FileItem]:
         """
@@ -57,37 +105,45 @@ class FileOperations:
         return filepath.suffix.lower() in NameGenerator.IMAGE_EXTENSIONS
 
     @staticmethod
-    def rename_files(folder: Path, items: List[FileItem]) -> Tuple[bool, str]:
+    def rename_files(folder: Path, items: List[FileItem],
+                     collision_strategy: str = CollisionIndex.STRATEGY_ABORT,
+                     journal: Optional[RenameJournal] = None,
+                     progress: Optional[ProgressCallback] = None,
+                     cancel_event: Optional[threading.Event] = None,
+                     workers: int = 1) -> Tuple[bool, str]:
         """
-        파일명 일괄 변경 (충돌 방지를 위한 2단계 처리)
+        파일명 일괄 변경 (순환만 임시 이름으로 끊는 최소 변경 계획)
+
+        이름을 바꾸기 전에 폴더 내 기존 파일과의 충돌을 검사하므로,
+        배치 밖 파일과 이름이 겹쳐 중간에 실패하는 일이 없습니다.
+        실행 후에는 폴더 목록 1회 조회로 결과를 검증합니다.
+        충돌 검사부터 검증까지 폴더 잠금을 잡아, 다른 인스턴스의 작업과 섞이지 않습니다.
 
         Args:
             folder: 대상 폴더
-            items: 파일 아이템 리스트
+            items: 파일 아이템 리스트 (new_name 이 충돌 해결 결과로 갱신될 수 있음)
+            collision_strategy: 충돌 해결 전략 (CollisionIndex.STRATEGY_*)
+            journal: 선기록 저널 (지정 시 계획/진행 상황을 기록, 성공 시 Undo 기록 후 journal.finish 필요)
+            progress: 진행 상황 보고 함수 (완료 단계 수, 전체 단계 수)
+            cancel_event: 설정되면 단계 사이에서 멈추고 실행된 단계를 되돌림
+            workers: 독립된 체인을 동시에 실행할 스레드 수 (1 이면 순차 실행)
 
         Returns:
-            (성공 여부, 오류 메시지)
+            (성공 여부, 오류 메시지) - 성공했지만 검증에서 문제가 발견되면 메시지에 검증 결과 요약
         """
-        temp_names = []
-
         try:
-            # 1단계: 임시 이름으로 변경 (충돌 방지)
-            for i, item in enumerate(items):
-                temp_name = f"__renam_temp_{i}__" + item.ext
-                temp_path = folder / temp_name
-                item.original_path.rename(temp_path)
-                temp_names.append(temp_path)
-
-            # 2단계: 실제 이름으로 변경
-            for temp_path, item in zip(temp_names, items):
-                new_path = folder / item.new_name
-                temp_path.rename(new_path)
-                # 아이템 정보 업데이트
-                item.original_path = new_path
-                item.original_name = item.new_name
-
-            return (True, "")
-
+            with FileOperations._folder_lock(folder), RenameEngine.open(folder) as engine:
+                return FileOperations._rename_files(engine, items, collision_strategy, journal,
+                                                    progress, cancel_event, workers)
+
+        except FileLockTimeout as e:
+            return (False, str(e))
+        except RenameExecutionError as e:
+            reason = FileOperations._describe_error(e.cause)
+            if e.rolled_back:
+                return (False, f"{reason}\n변경된 파일을 모두 원래 이름으로 되돌렸습니다.")
+            return (False, f"{reason}\n{e.unrestored}개 파일을 원래 이름으로 되돌리지 못했습니다. "
+                           "폴더를 확인하세요.")
         except PermissionError as e:
             return (False, f"권한 오류: {str(e)}")
         except OSError as e:
@@ -96,31 +152,641 @@ class FileOperations:
             return (False, f"예상치 못한 오류: {str(e)}")
 
     @staticmethod
-    def restore_files(folder: Path, before_names: List[str],
-                     after_names: List[str]) -> Tuple[bool, str]:
+    def rename_folders(jobs: List[Tuple[Path, List[FileItem]]],
+                       collision_strategy: str = CollisionIndex.STRATEGY_ABORT,
+                       journal: Optional[RenameJournal] = None,
+                       progress: Optional[ProgressCallback] = None,
+                       cancel_event: Optional[threading.Event] = None,
+                       max_workers: int = MAX_FOLDER_WORKERS,
+                       workers: int = 1) -> List[Tuple[bool, str]]:
+        """
+        여러 폴더 파일명 일괄 변경 (폴더끼리는 독립이므로 제한된 스레드 풀에서 병렬 실행)
+
+        폴더마다 rename_files 와 같은 계획/저널/롤백이 적용되며,
+        한 폴더의 실패가 다른 폴더의 결과에 영향을 주지 않습니다.
+
+        Args:
+            jobs: (폴더, 파일 아이템 리스트) 리스트
+            collision_strategy: 충돌 해결 전략 (CollisionIndex.STRATEGY_*)
+            journal: 선기록 저널 (성공한 폴더별로 journal.finish 필요)
+            progress: 전체 진행 상황 보고 함수 (모든 폴더 합산)
+            cancel_event: 설정되면 실행 중인 폴더는 되돌리고, 시작 전인 폴더는 건너뜀
+            max_workers: 최대 동시 실행 폴더 수
+            workers: 폴더 하나 안에서 체인을 동시에 실행할 스레드 수
+
+        Returns:
+            jobs 와 같은 순서의 (성공 여부, 오류 메시지) 리스트
+        """
+        report = FileOperations._combined_progress(len(jobs), progress)
+
+        def run(position: int) -> Tuple[bool, str]:
+            folder, items = jobs[position]
+            return FileOperations.rename_files(
+                folder, items, collision_strategy, journal,
+                (lambda done, total: report(position, done, total)) if report else None,
+                cancel_event, workers)
+
+        return FileOperations._run_parallel(len(jobs), run, max_workers)
+
+    @staticmethod
+    def restore_folders(jobs: List[Tuple[Path, List[str], List[str], Optional[Anchors]]],
+                        progress: Optional[ProgressCallback] = None,
+                        cancel_event: Optional[threading.Event] = None,
+                        max_workers: int = MAX_FOLDER_WORKERS,
+                        workers: int = 1) -> List[Tuple[bool, str]]:
+        """
+        여러 폴더 파일명 복구 (그룹 Undo, 폴더별 병렬 실행)
+
+        Args:
+            jobs: (폴더, 원래 파일명 리스트, 현재 파일명 리스트, 기준 inode) 리스트 (restore_files 인자)
+            progress: 전체 진행 상황 보고 함수 (모든 폴더 합산)
+            cancel_event: 설정되면 실행 중인 폴더는 복구 전 상태로 되돌리고, 시작 전인 폴더는 건너뜀
+            max_workers: 최대 동시 실행 폴더 수
+            workers: 폴더 하나 안에서 체인을 동시에 실행할 스레드 수
+
+        Returns:
+            jobs 와 같은 순서의 (성공 여부, 오류 메시지) 리스트
+        """
+        report = FileOperations._combined_progress(len(jobs), progress)
+
+        def run(position: int) -> Tuple[bool, str]:
+            return FileOperations.restore_files(
+                *jobs[position],
+                progress=(lambda done, total: report(position, done, total)) if report else None,
+                cancel_event=cancel_event, workers=workers)
+
+        return FileOperations._run_parallel(len(jobs), run, max_workers)
+
+    @staticmethod
+    def _resolve_anchors(listing: List[Tuple[str, int]], after_names: List[str],
+                         inodes: List[int]) -> List[Optional[str]]:
+        """
+        기록된 inode 로 현재 파일명 찾기 (기록 후 다른 프로그램이 바꾼 이름 반영)
+
+        inode 를 못 찾은 파일(내용을 새로 써서 inode 가 바뀐 경우 등)은 기록된 이름을 쓰되,
+        그 이름을 기록에 있는 다른 파일이 차지하고 있으면 건너뜁니다.
+
+        Args:
+            listing: 폴더 (파일명, inode) 목록
+            after_names: 기록된 현재 파일명 리스트
+            inodes: 파일별 inode 리스트 (after_names 와 같은 순서)
+
+        Returns:
+            파일별 현재 파일명 리스트 (찾지 못하면 None)
+        """
+        names_by_inode = {inode: name for name, inode in listing}
+        inode_by_name = dict(listing)
+        recorded = set(inodes)
+
+        result = []
+        for after, inode in zip(after_names, inodes):
+            current = names_by_inode.get(inode)
+            if current is None and inode_by_name.get(after) not in recorded:
+                current = after
+            result.append(current)
+        return result
+
+    @staticmethod
+    def _run_parallel(count: int, run: Callable[[int], Tuple[bool, str]],
+                      max_workers: int) -> List[Tuple[bool, str]]:
+        """작업 count 개를 스레드 풀에서 실행하고 입력 순서대로 결과 반환"""
+        if count == 0:
+            return []
+        if count == 1 or max_workers <= 1:
+            return [run(position) for position in range(count)]
+        with ThreadPoolExecutor(max_workers=min(max_workers, count),
+                                thread_name_prefix="renam-folder") as pool:
+            return list(pool.map(run, range(count)))
+
+    @staticmethod
+    def _combined_progress(count: int, progress: Optional[ProgressCallback]
+                           ) -> Optional[Callable[[int, int, int], None]]:
+        """작업별 진행 상황을 합산해 하나의 progress 로 보고하는 함수 생성"""
+        if progress is None:
+            return None
+        lock = threading.Lock()
+        state: Dict[int, Tuple[int, int]] = {}
+
+        def report(position: int, done: int, total: int) -> None:
+            with lock:
+                state[position] = (done, total)
+                progress(sum(d for d, _ in state.values()), sum(t for _, t in state.values()))
+
+        return report
+
+    @staticmethod
+    def _rename_files(engine: PathRenameEngine, items: List[FileItem], collision_strategy: str,
+                      journal: Optional[RenameJournal], progress: Optional[ProgressCallback],
+                      cancel_event: Optional[threading.Event], workers: int) -> Tuple[bool, str]:
+        """rename_files 본체 (열린 엔진 하나로 목록 조회부터 실행까지 처리)"""
+        folder = engine.folder
+        entry = None
+        try:
+            # 0단계: 파일명으로 쓸 수 없는 이름 검사 ('/' 가 들어가면 하위 폴더로 이동해 버림)
+            invalid = NameRules.find_invalid([item.new_name for item in items])
+            if invalid:
+                return (False, FileOperations._describe_invalid_names(items, invalid))
+
+            # 디스크 이름 충돌 검사 (디렉토리 목록 1회 조회)
+            index = CollisionIndex(engine.listdir())
+            sources = [item.original_name for item in items]
+            result = index.resolve(sources, [item.new_name for item in items], collision_strategy)
+            if result.has_conflicts and collision_strategy == CollisionIndex.STRATEGY_ABORT:
+                first = items[result.conflicts[0]].new_name
+                more = len(result.conflicts) - 1
+                return (False, f"폴더 내 다른 파일과 이름이 겹칩니다: {first}"
+                               + (f" 외 {more}개" if more else ""))
+            for item, target in zip(items, result.targets):
+                item.new_name = target
+
+            # 1단계: 변경 계획 (고정점 제외, 체인은 직접 변경, 순환만 임시 이름)
+            plan = RenamePlanner.plan(sources, result.targets, index.key, index)
+
+            # 2단계: 계획을 저널에 먼저 기록한 뒤 실행
+            entry = journal.begin(folder, sources, result.targets, plan) if journal else None
+            FileOperations.apply_plan(folder, plan, entry, engine, progress, cancel_event, workers)
+            if entry is not None:
+                entry.commit(engine)
+
+            # 아이템 정보 업데이트 (실행한 계획 그대로 반영, 재스캔 불필요)
+            for item in items:
+                item.set_name(item.new_name)
+
+            # 3단계: 목록 1회 조회로 결과 검증 (실행은 끝났으므로 문제는 경고로만 전달)
+            report = FileOperations._verify(engine, result.targets, sources, index.key)
+            return (True, report.summary())
+        except RenameExecutionError as e:
+            if entry is not None:
+                if e.rolled_back:
+                    # 원래 상태로 돌아왔으므로 복구할 작업 없음
+                    journal.finish(folder)
+                else:
+                    journal.abandon(folder)
+            raise
+        except Exception:
+            # 실패한 작업은 Undo 기록이 저장되지 않으므로 journal.finish 를 기다리지 않음
+            if entry is not None:
+                journal.abandon(folder)
+            raise
+        finally:
+            if entry is not None:
+                entry.close()
+
+    @staticmethod
+    def _folder_lock(folder: Path) -> FileLock:
+        """폴더 작업 잠금 (다른 Renam 인스턴스와 같은 폴더를 동시에 바꾸지 않도록)"""
+        return FileLock(folder, FileOperations.FOLDER_LOCK_TIMEOUT)
+
+    @staticmethod
+    def _describe_invalid_names(items: List[FileItem], invalid: List[Tuple[int, str]]) -> str:
+        """파일명으로 쓸 수 없는 행 목록 메시지 (앞쪽 몇 개만 표시)"""
+        shown = FileOperations.INVALID_NAMES_SHOWN
+        lines = [f"  {items[position].original_name} → {items[position].new_name!r} ({reason})"
+                 for position, reason in invalid[:shown]]
+        if len(invalid) > shown:
+            lines.append(f"  외 {len(invalid) - shown}개")
+        return "파일명으로 쓸 수 없는 이름이 있어 변경하지 않았습니다:\n" + "\n".join(lines)
+
+    @staticmethod
+    def _describe_error(error: OSError) -> str:
+        """OSError 종류별 사용자 메시지"""
+        if isinstance(error, InterruptedError):
+            return "작업이 취소되었습니다."
+        if isinstance(error, PermissionError):
+            return f"권한 오류: {str(error)}"
+        return f"파일 시스템 오류: {str(error)}"
+
+    @staticmethod
+    def apply_plan(folder: Path, plan: RenamePlan, entry: Optional[JournalEntry] = None,
+                   engine: Optional[PathRenameEngine] = None,
+                   progress: Optional[ProgressCallback] = None,
+                   cancel_event: Optional[threading.Event] = None,
+                   workers: int = 1) -> None:
+        """
+        이름 변경 계획 실행 (체인 순서대로, 실패 시 실행된 단계를 역순으로 되돌림)
+
+        체인끼리는 서로의 이름을 건드리지 않으므로, workers > 1 이면 체인 단위로
+        여러 스레드에서 동시에 실행합니다. (체인 안의 순서는 항상 유지)
+        호출마다 왕복 지연이 있는 네트워크 드라이브(SMB/NFS)에서 지연을 겹쳐 숨깁니다.
+
+        Args:
+            folder: 대상 폴더
+            plan: RenamePlanner.plan 결과
+            entry: 단계별 체크포인트를 기록할 저널 (선택)
+            engine: 이미 열린 폴더 엔진 (없으면 새로 열고 닫음)
+            progress: 진행 상황 보고 함수 (완료 단계 수, 전체 단계 수)
+            cancel_event: 설정되면 다음 단계 전에 멈춤 (InterruptedError 로 롤백)
+            workers: 체인을 동시에 실행할 스레드 수 (1 이면 순차 실행)
+
+        Raises:
+            RenameExecutionError: 이름 변경 실패 또는 취소 (롤백 결과 포함)
+        """
+        if engine is None:
+            with RenameEngine.open(folder) as engine:
+                FileOperations.apply_plan(folder, plan, entry, engine, progress, cancel_event, workers)
+            return
+
+        if workers > 1 and len(plan.chains) > 1:
+            FileOperations._apply_pipelined(engine, plan, entry, progress, cancel_event, workers)
+            return
+
+        steps = plan.steps
+        total = len(steps)
+        interval = FileOperations.PROGRESS_INTERVAL
+        applied: List[int] = []
+        try:
+            for step, (source, target) in enumerate(steps):
+                # 단계 사이(모든 이름이 온전한 지점)에서만 취소
+                if cancel_event is not None and cancel_event.is_set():
+                    raise InterruptedError("사용자가 작업을 취소했습니다.")
+                engine.rename(source, target)
+                applied.append(step)
+                if entry is not None:
+                    entry.mark_done(step)
+                if progress is not None and step % interval == 0:
+                    progress(step + 1, total)
+            if progress is not None:
+                progress(total, total)
+        except OSError as e:
+            unrestored = FileOperations._rollback(engine, steps, applied, entry)
+            raise RenameExecutionError(e, unrestored) from e
+
+    @staticmethod
+    def _apply_pipelined(engine: PathRenameEngine, plan: RenamePlan, entry: Optional[JournalEntry],
+                         progress: Optional[ProgressCallback],
+                         cancel_event: Optional[threading.Event], workers: int) -> None:
+        """
+        체인 단위 병렬 실행 (apply_plan 의 workers > 1 경로)
+
+        각 스레드는 아직 시작되지 않은 체인을 하나씩 가져가 순서대로 실행합니다.
+        한 스레드라도 실패하면 나머지는 다음 단계 전에 멈추고,
+        모두 멈춘 뒤 실행된 단계를 실행 역순으로 되돌립니다.
+        """
+        chains = plan.chains
+        steps = plan.steps
+        total = len(steps)
+        interval = FileOperations.PROGRESS_INTERVAL
+
+        # 체인별 첫 단계의 steps 기준 인덱스 (저널 체크포인트용)
+        offsets = []
+        position = 0
+        for chain in chains:
+            offsets.append(position)
+            position += len(chain)
+
+        lock = threading.Lock()
+        stop = threading.Event()
+        applied: List[int] = []      # 실행 순서 (롤백은 이 역순)
+        errors: List[OSError] = []
+        pending = iter(range(len(chains)))
+
+        def run_chains() -> None:
+            while not stop.is_set():
+                with lock:
+                    index = next(pending, None)
+                if index is None:
+                    return
+                first = offsets[index]
+                for step in range(first, first + len(chains[index])):
+                    try:
+                        # 단계 사이(모든 이름이 온전한 지점)에서만 멈춤
+                        if stop.is_set():
+                            return
+                        if cancel_event is not None and cancel_event.is_set():
+                            raise InterruptedError("사용자가 작업을 취소했습니다.")
+                        source, target = steps[step]
+                        engine.rename(source, target)
+                        with lock:
+                            applied.append(step)
+                            count = len(applied)
+                            if progress is not None and (count - 1) % interval == 0:
+                                progress(count, total)
+                        if entry is not None:
+                            entry.mark_done(step)
+                    except OSError as e:
+                        with lock:
+                            errors.append(e)
+                        stop.set()
+                        return
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(chains)),
+                                thread_name_prefix="renam-pipeline") as pool:
+            for future in [pool.submit(run_chains) for _ in range(min(workers, len(chains)))]:
+                future.result()
+
+        if errors:
+            unrestored = FileOperations._rollback(engine, steps, applied, entry)
+            raise RenameExecutionError(errors[0], unrestored) from errors[0]
+        if progress is not None:
+            progress(total, total)
+
+    @staticmethod
+    def _rollback(engine: PathRenameEngine, steps: List[RenameStep], applied: List[int],
+                  entry: Optional[JournalEntry] = None) -> int:
+        """
+        실행된 단계를 역순으로 되돌림
+
+        되돌리기에 실패하면 앞선 단계가 그 이름에 의존할 수 있으므로 즉시 멈춥니다.
+        (덮어쓰기 방지)
+
+        Returns:
+            되돌리지 못한 단계 수
+        """
+        for position in range(len(applied) - 1, -1, -1):
+            step = applied[position]
+            source, target = steps[step]
+            try:
+                engine.rename(target, source)
+            except OSError:
+                return position + 1
+            if entry is not None:
+                try:
+                    entry.mark_undone(step)
+                except OSError:
+                    pass  # 저널 기록 실패는 롤백 자체를 막지 않음
+        return 0
+
+    @staticmethod
+    def recover_journal(entry: JournalEntry) -> Tuple[str, str]:
+        """
+        중단된 작업 복구 (가능하면 남은 단계 실행, 아니면 실행된 단계 되돌리기)
+
+        체크포인트 직전에 중단된 단계는 폴더 목록으로 실행 여부를 판단합니다.
+
+        Args:
+            entry: RenameJournal.pending() 결과
+
+        Returns:
+            (복구 결과 RenameJournal.ROLLED_* / RECOVERED_COMMITTED / RECOVERY_FAILED, 메시지)
+        """
+        if entry.committed:
+            return (RenameJournal.RECOVERED_COMMITTED, "")
+
+        try:
+            with FileOperations._folder_lock(entry.folder):
+                if not entry.path.exists():
+                    # 기다리는 동안 작업 중이던 다른 인스턴스가 끝내고 저널을 지움
+                    return (RenameJournal.RECOVERED_COMMITTED, "")
+                with RenameEngine.open(entry.folder) as engine:
+                    return FileOperations._recover_journal(engine, entry)
+        except FileLockTimeout as e:
+            return (RenameJournal.RECOVERY_FAILED, str(e))
+        except OSError as e:
+            return (RenameJournal.RECOVERY_FAILED, f"폴더를 읽을 수 없습니다: {str(e)}")
+
+    @staticmethod
+    def _recover_journal(engine: PathRenameEngine, entry: JournalEntry) -> Tuple[str, str]:
+        """recover_journal 본체 (열린 엔진으로 목록 조회 및 이름 변경)"""
+        names = set(engine.listdir())
+        index = CollisionIndex(names)
+
+        steps = entry.plan.steps
+        done = set(entry.done)
+        # 기록되지 않았지만 실제로는 끝난 단계 (원본은 없고 대상만 있음)
+        for step, (source, target) in enumerate(steps):
+            if step not in done and source not in names and target in names:
+                done.add(step)
+
+        key = index.key
+        present = {key(name) for name in names}
+        remaining = [s for i, s in enumerate(steps) if i not in done]
+        applied = [(target, source) for i, (source, target) in reversed(list(enumerate(steps)))
+                   if i in done]
+
+        try:
+            if FileOperations._can_apply(present, remaining, key):
+                FileOperations._rename_steps(engine, remaining)
+                return (RenameJournal.ROLLED_FORWARD, "")
+            if FileOperations._can_apply(present, applied, key):
+                FileOperations._rename_steps(engine, applied)
+                return (RenameJournal.ROLLED_BACK, "")
+        except OSError as e:
+            return (RenameJournal.RECOVERY_FAILED, f"파일 시스템 오류: {str(e)}")
+
+        return (RenameJournal.RECOVERY_FAILED, "중단된 작업 이후 폴더 내용이 바뀌어 자동 복구할 수 없습니다.")
+
+    @staticmethod
+    def _can_apply(present: Set[str], steps: List[RenameStep], key: Callable[[str], str]) -> bool:
+        """단계를 순서대로 적용할 수 있는지 이름 집합으로 미리 확인 (원본 존재, 대상 비어 있음)"""
+        present = set(present)
+        for source, target in steps:
+            source_key, target_key = key(source), key(target)
+            if source_key not in present:
+                return False
+            if target_key in present and target_key != source_key:
+                return False
+            present.discard(source_key)
+            present.add(target_key)
+        return True
+
+    @staticmethod
+    def _rename_steps(engine: PathRenameEngine, steps: List[RenameStep]) -> None:
+        """단계 목록 순서대로 이름 변경"""
+        for source, target in steps:
+            engine.rename(source, target)
+
+    @staticmethod
+    def restore_files(folder: Path, before_names: List[str], after_names: List[str],
+                     anchors: Optional[Anchors] = None,
+                     progress: Optional[ProgressCallback] = None,
+                     cancel_event: Optional[threading.Event] = None,
+                     workers: int = 1) -> Tuple[bool, str]:
         """
         파일명 복구 (Undo)
 
+        폴더 목록 1회 조회로 남아 있는 파일만 골라, 변경과 같은 계획으로 되돌립니다.
+        기준 inode 가 있으면 같은 조회에서 inode -> 현재 이름을 만들어, 변경 후 다른 프로그램이
+        이름을 바꾼 파일도 찾아 되돌립니다 (장치가 다르면 이름으로만 찾음).
+        배치 밖 파일이 원래 이름을 차지하고 있으면 아무것도 바꾸지 않습니다.
+
         Args:
             folder: 대상 폴더
             before_names: 원래 파일명 리스트
             after_names: 현재 파일명 리스트
+            anchors: (장치 번호, 파일별 inode 리스트) - after_names 와 같은 순서 (없으면 이름으로만 찾음)
+            progress: 진행 상황 보고 함수 (완료 단계 수, 전체 단계 수)
+            cancel_event: 설정되면 단계 사이에서 멈추고 실행된 단계를 되돌림 (복구 전 상태)
+            workers: 독립된 체인을 동시에 실행할 스레드 수 (1 이면 순차 실행)
 
         Returns:
             (성공 여부, 오류 메시지)
         """
         try:
-            for before, after in zip(before_names, after_names):
-                after_path = folder / after
-                before_path = folder / before
+            with FileOperations._folder_lock(folder), RenameEngine.open(folder) as engine:
+                return FileOperations._restore_files(engine, before_names, after_names, anchors,
+                                                     progress, cancel_event, workers)
+
+        except FileLockTimeout as e:
+            return (False, str(e))
+        except RenameExecutionError as e:
+            state = ("변경된 파일을 모두 되돌려 복구 전 상태입니다." if e.rolled_back
+                     else f"{e.unrestored}개 파일이 중간 상태로 남았습니다. 폴더를 확인하세요.")
+            return (False, f"복구 중 오류 발생: {str(e)}\n{state}")
+        except Exception as e:
+            return (False, f"복구 중 오류 발생: {str(e)}")
+
+    @staticmethod
+    def _restore_files(engine: PathRenameEngine, before_names: List[str], after_names: List[str],
+                       anchors: Optional[Anchors], progress: Optional[ProgressCallback],
+                       cancel_event: Optional[threading.Event], workers: int) -> Tuple[bool, str]:
+        """restore_files 본체 (열린 엔진으로 목록 조회 및 이름 변경)"""
+        if anchors is not None and anchors[0] == engine.device():
+            listing = engine.listdir_inodes()
+            index = CollisionIndex([name for name, _ in listing])
+            after_names = FileOperations._resolve_anchors(listing, after_names, anchors[1])
+        else:
+            index = CollisionIndex(engine.listdir())
+
+        # 이미 사라진 파일은 건너뜀
+        pairs = [(after, before) for before, after in zip(before_names, after_names)
+                 if after is not None and after in index]
+        sources = [after for after, _ in pairs]
+        targets = [before for _, before in pairs]
+
+        result = index.resolve(sources, targets)
+        if result.has_conflicts:
+            first = targets[result.conflicts[0]]
+            return (False, f"복구할 이름을 다른 파일이 사용 중입니다: {first}")
+
+        plan = RenamePlanner.plan(sources, targets, index.key, index)
+        FileOperations.apply_plan(engine.folder, plan, None, engine, progress, cancel_event, workers)
+
+        report = FileOperations._verify(engine, targets, sources, index.key)
+        if not report.ok:
+            return (False, f"복구 후 확인 결과가 기록과 다릅니다:\n{report.summary()}")
+        return (True, "")
 
-                if after_path.exists():
-                    after_path.rename(before_path)
+    @staticmethod
+    def validate_snapshot(folder: Path, items: List[FileItem]) -> SnapshotReport:
+        """
+        스캔 이후 폴더가 바뀌었는지 검증 (낙관적 동시성 검사)
 
-            return (True, "")
+        폴더를 엔진으로 한 번 열어, 디렉토리 목록 1회 조회와 쓰기 권한 확인 1회로 각 아이템의
+        스캔 시점 지문(inode, 크기, 수정 시각)과 현재 상태를 비교합니다.
+        목록/stat/권한 확인은 모두 같은 디렉토리 fd 기준입니다 (조회 중 상위 폴더 이름이 바뀌어도 같은 폴더).
 
-        except Exception as e:
-            return (False, f"복구 중 오류 발생: {str(e)}")
+        Args:
+            folder: 대상 폴더
+            items: 스캔 시점 파일 아이템 리스트
+
+        Returns:
+            SnapshotReport (report.names 는 충돌 검사에 재사용 가능)
+
+        Raises:
+            OSError: 폴더를 읽을 수 없음
+        """
+        with RenameEngine.open(folder) as engine:
+            return FileOperations._validate_snapshot(engine, items)
+
+    @staticmethod
+    def _validate_snapshot(engine: PathRenameEngine, items: List[FileItem]) -> SnapshotReport:
+        """validate_snapshot 본체 (열린 엔진으로 목록/stat 조회)"""
+        folder = engine.folder
+        expected = {item.original_name: position for position, item in enumerate(items)}
+        current = {}       # 파일명 -> 지문 (목록에 있던 이름 + 새 이미지 파일)
+        names = []
+        report_stats = {}
+        with engine.scandir() as entries:
+            for entry in entries:
+                names.append(entry.name)
+                known = entry.name in expected
+                if not known and not FileOperations._is_image_file(Path(entry.name)):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue  # 조회 도중 사라진 파일
+                # Windows 의 scandir stat 은 inode 가 0 이므로 entry.inode() 로 보충
+                fingerprint = (stat.st_ino or entry.inode(), stat.st_size, stat.st_mtime_ns)
+                current[entry.name] = fingerprint
+                report_stats[entry.name] = stat
+
+        report = SnapshotReport(folder, names, engine.writable())
+        report.stats = report_stats
+
+        # 이름별 비교
+        gone = []
+        for name, position in expected.items():
+            fingerprint = current.get(name)
+            old = items[position].fingerprint
+            if fingerprint is None:
+                gone.append(position)
+            elif fingerprint[0] != old[0]:
+                report.replaced.append(position)
+            elif fingerprint != old:
+                report.modified.append(position)
+
+        # 사라진 파일이 같은 지문으로 다른 이름에 있으면 이름 변경으로 분류
+        gone_by_fingerprint = {items[position].fingerprint: position for position in gone}
+        for name, fingerprint in current.items():
+            if name in expected:
+                continue
+            position = gone_by_fingerprint.pop(fingerprint, None)
+            if position is not None:
+                report.moved[position] = name
+            else:
+                report.added.append(name)
+
+        report.missing = sorted(set(gone) - set(report.moved))
+        report.replaced.sort()
+        report.modified.sort()
+        report.added.sort()
+        return report
+
+    @staticmethod
+    def verify_folder(folder: Path, expected: List[str],
+                      replaced: Optional[List[str]] = None) -> VerificationReport:
+        """
+        작업 후 폴더 검증 (디렉토리 목록 1회 조회 + 집합 비교, O(n))
+
+        Args:
+            folder: 대상 폴더
+            expected: 있어야 할 최종 파일명 리스트
+            replaced: 사라져야 할 원래 파일명 리스트 (최종 이름과 겹치는 이름은 무시)
+
+        Returns:
+            VerificationReport
+
+        Raises:
+            OSError: 폴더를 읽을 수 없음
+        """
+        with RenameEngine.open(folder) as engine:
+            return FileOperations._verify(engine, expected, replaced or [],
+                                          CollisionIndex([]).key)
+
+    @staticmethod
+    def _verify(engine: PathRenameEngine, expected: List[str], replaced: List[str],
+                key: Callable[[str], str]) -> VerificationReport:
+        """verify_folder 본체 (열린 엔진으로 목록 조회, 이름 비교는 key 기준)"""
+        names = engine.listdir()
+        present = {key(name) for name in names}
+        expected_keys = {key(name) for name in expected}
+
+        missing = [name for name in expected if key(name) not in present]
+        leftover = [name for name in replaced
+                    if key(name) in present and key(name) not in expected_keys]
+        temp = sorted(name for name in names if RenamePlanner.is_temp_name(name))
+        return VerificationReport(missing, leftover, temp)
+
+    @staticmethod
+    def folder_stamp(folder: Path) -> Optional[int]:
+        """
+        폴더 변경 여부를 싸게 확인하기 위한 디렉토리 수정 시각 (stat 1회)
+
+        항목이 추가/삭제/이름 변경되면 디렉토리 수정 시각이 바뀝니다.
+
+        Args:
+            folder: 대상 폴더
+
+        Returns:
+            디렉토리 수정 시각 (ns) 또는 None (조회 실패)
+        """
+        try:
+            return os.stat(folder).st_mtime_ns
+        except OSError:
+            return None
 
     @staticmethod
     def validate_folder(folder_path: Path) -> Tuple[bool, str]:
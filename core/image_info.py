@@ -0,0 +1,147 @@
+"""
+Image Info Module
+이미지 메타데이터 조회 로직 (단일 책임: 이미지 헤더 파싱)
+"""
+
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from models.file_item import FileItem
+
+
+class ImageInfo:
+    """
+    이미지 헤더 파서 클래스
+    책임: 외부 라이브러리 없이 이미지 크기(가로, 세로) 조회
+    """
+
+    # 헤더 파싱에 읽는 최대 바이트 수 (JPEG 는 마커를 따라 추가로 읽음)
+    HEADER_SIZE = 64
+
+    # 일괄 조회 시 동시에 여는 최대 파일 수
+    MAX_WORKERS = 8
+
+    @staticmethod
+    def read_size(filepath: Path) -> Optional[Tuple[int, int]]:
+        """
+        이미지 크기 조회
+
+        Args:
+            filepath: 이미지 파일 경로
+
+        Returns:
+            (가로, 세로) 튜플 또는 None (지원하지 않는 형식/손상된 파일)
+        """
+        try:
+            with open(filepath, 'rb') as f:
+                head = f.read(ImageInfo.HEADER_SIZE)
+
+                if head.startswith(b'\x89PNG\r\n\x1a\n') and len(head) >= 24:
+                    return struct.unpack('>II', head[16:24])
+
+                if head[:6] in (b'GIF87a', b'GIF89a') and len(head) >= 10:
+                    return struct.unpack('<HH', head[6:10])
+
+                if head.startswith(b'BM') and len(head) >= 26:
+                    width, height = struct.unpack('<ii', head[18:26])
+                    return (width, abs(height))
+
+                if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+                    return ImageInfo._webp_size(head)
+
+                if head[:4] in (b'II*\x00', b'MM\x00*'):
+                    return ImageInfo._tiff_size(f)
+
+                if head.startswith(b'\xff\xd8'):
+                    return ImageInfo._jpeg_size(f)
+        except (OSError, struct.error, IndexError):
+            return None
+
+        return None
+
+    @staticmethod
+    def load_dimensions(items: List[FileItem]) -> None:
+        """
+        여러 파일의 이미지 크기를 일괄 조회하여 FileItem.dimensions 에 캐시
+
+        이미 조회된 아이템은 건너뛰며, 파일 I/O 는 스레드 풀에서 병렬로 처리합니다.
+
+        Args:
+            items: 파일 아이템 리스트 (in-place 수정)
+        """
+        pending = [item for item in items if item.dimensions is None]
+        if not pending:
+            return
+
+        if len(pending) == 1:
+            pending[0].dimensions = ImageInfo.read_size(pending[0].original_path) or (0, 0)
+            return
+
+        with ThreadPoolExecutor(max_workers=ImageInfo.MAX_WORKERS) as executor:
+            sizes = executor.map(lambda item: ImageInfo.read_size(item.original_path), pending)
+            for item, size in zip(pending, sizes):
+                item.dimensions = size or (0, 0)
+
+    @staticmethod
+    def _webp_size(head: bytes) -> Optional[Tuple[int, int]]:
+        """WebP (VP8 / VP8L / VP8X) 헤더에서 크기 추출"""
+        chunk = head[12:16]
+        if chunk == b'VP8 ' and len(head) >= 30:
+            width, height = struct.unpack('<HH', head[26:30])
+            return (width & 0x3FFF, height & 0x3FFF)
+        if chunk == b'VP8L' and len(head) >= 25:
+            bits = struct.unpack('<I', head[21:25])[0]
+            return ((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+        if chunk == b'VP8X' and len(head) >= 30:
+            width = int.from_bytes(head[24:27], 'little') + 1
+            height = int.from_bytes(head[27:30], 'little') + 1
+            return (width, height)
+        return None
+
+    @staticmethod
+    def _jpeg_size(f) -> Optional[Tuple[int, int]]:
+        """JPEG SOF 마커를 찾아 크기 추출"""
+        f.seek(2)
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                return None
+            code = marker[1]
+            # 패딩 바이트 (0xFF 연속) 건너뛰기
+            while code == 0xFF:
+                code = f.read(1)[0]
+            length = struct.unpack('>H', f.read(2))[0]
+            # SOF0 ~ SOF15 (DHT/JPG/DAC 제외)
+            if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>xHH', f.read(5))
+                return (width, height)
+            f.seek(length - 2, 1)
+
+    @staticmethod
+    def _tiff_size(f) -> Optional[Tuple[int, int]]:
+        """TIFF 첫 번째 IFD 에서 ImageWidth/ImageLength 태그 추출"""
+        f.seek(0)
+        order = '<' if f.read(2) == b'II' else '>'
+        f.seek(4)
+        offset = struct.unpack(order + 'I', f.read(4))[0]
+        f.seek(offset)
+        count = struct.unpack(order + 'H', f.read(2))[0]
+
+        width = height = None
+        for _ in range(count):
+            tag, field_type, _, value = struct.unpack(order + 'HHI4s', f.read(12))
+            if tag not in (256, 257):
+                continue
+            # SHORT(3) 또는 LONG(4)
+            fmt = 'H' if field_type == 3 else 'I'
+            number = struct.unpack(order + fmt, value[:struct.calcsize(fmt)])[0]
+            if tag == 256:
+                width = number
+            else:
+                height = number
+
+        if width is None or height is None:
+            return None
+        return (width, height)
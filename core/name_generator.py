@@ -3,8 +3,12 @@ Name Generator Module
 파일명 패턴 생성 로직 (단일 책임: 파일명 생성)
 """
 
-import re
-from typing import Set
+from functools import lru_cache
+from typing import Optional, Set, Union
+
+from core.collision_index import CollisionIndex
+from core.name_template import NameTemplate
+from core.name_substitution import NameSubstitution
 
 
 class NameGenerator:
@@ -40,22 +44,34 @@ class NameGenerator:
             >>> NameGenerator.generate(10, "{00}", ".jpg")
             "10.jpg"
         """
-        result = pattern
+        return NameGenerator._compile_template(pattern).render_index(index - 1, extension)
 
-        # {000}, {00}, {0} 형태의 제로 패딩 처리
-        zero_patterns = re.findall(r'\{(0+)\}', result)
-        for zp in zero_patterns:
-            width = len(zp)
-            result = result.replace(f'{{{zp}}}', str(index).zfill(width))
+    @staticmethod
+    def compile(pattern: str) -> Union[NameTemplate, NameSubstitution]:
+        """
+        패턴을 템플릿 또는 치환식으로 컴파일 (같은 패턴은 캐시 재사용)
 
-        # {n} 처리
-        result = result.replace('{n}', str(index))
+        Args:
+            pattern: 파일명 패턴 또는 sed 스타일 치환식 (s/찾기/바꾸기/플래그)
 
-        # 확장자 추가 (확장자가 없으면 원본 확장자 사용)
-        if not NameGenerator._has_extension(result):
-            result += extension
+        Returns:
+            컴파일된 NameTemplate 또는 NameSubstitution
+        """
+        if NameSubstitution.is_expression(pattern):
+            return NameGenerator._compile_substitution(pattern)
+        return NameGenerator._compile_template(pattern)
 
-        return result
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _compile_template(pattern: str) -> NameTemplate:
+        """토큰 패턴 컴파일 (캐시)"""
+        return NameTemplate(pattern, NameGenerator.IMAGE_EXTENSIONS)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _compile_substitution(expression: str) -> NameSubstitution:
+        """치환식 컴파일 (캐시)"""
+        return NameSubstitution(expression)
 
     @staticmethod
     def _has_extension(filename: str) -> bool:
@@ -85,22 +101,30 @@ class NameGenerator:
         if not pattern or not pattern.strip():
             return False
 
-        # 최소한 {n} 또는 {0...} 패턴이 있어야 함
-        has_pattern = bool(re.search(r'\{(n|0+)\}', pattern))
-        return has_pattern
+        # 치환식은 컴파일 오류가 없으면 유효
+        if NameSubstitution.is_expression(pattern):
+            return NameGenerator.compile(pattern).error is None
+
+        # 알 수 없는 토큰/금지 문자가 없고, 순번({n}, {000} 등) 또는 {orig} 토큰이 있어야 함
+        template = NameGenerator.compile(pattern)
+        if template.unknown_tokens or template.error is not None:
+            return False
+        return template.has_counter or template.uses_original
 
     @staticmethod
-    def check_duplicates(filenames: list) -> bool:
+    def check_duplicates(filenames: list, case_insensitive: Optional[bool] = None) -> bool:
         """
-        중복 파일명 검사
+        중복 파일명 검사 (디스크 충돌 검사와 같은 키로 비교)
 
         Args:
             filenames: 파일명 리스트
+            case_insensitive: 대소문자 무시 여부 (None 이면 플랫폼 기본값, CollisionIndex 와 같음)
 
         Returns:
             중복 존재 여부
         """
-        return len(filenames) != len(set(filenames))
+        key = CollisionIndex((), case_insensitive).key
+        return len(filenames) != len({key(name) for name in filenames})
 
     @staticmethod
     def get_pattern_examples() -> str:
@@ -110,4 +134,6 @@ class NameGenerator:
         Returns:
             패턴 예시 설명
         """
-        return "예시: {n} → 1, 2, 3 | {000} → 001, 002 | IMG_{00} → IMG_01, IMG_02"
+        return ("예시: {n} → 1, 2, 3 | {000} → 001, 002 | IMG_{00} → IMG_01, IMG_02\n"
+                "토큰: {n:10:2} 시작/증가 | {gn} 확장자별 순번 | {parent} {orig} {ext} "
+                "{date:%Y%m%d} {w}x{h}")
@@ -0,0 +1,93 @@
+"""
+Name Rules Module
+파일명 규칙 검사 (단일 책임: 새 파일명이 같은 폴더 안의 파일 이름으로 쓸 수 있는지 판단)
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+
+class NameRules:
+    """
+    파일명 규칙 클래스
+    책임: 경로 구분자/예약 문자/빈 이름처럼 파일을 다른 폴더로 옮기거나 실패하게 만드는 이름 검출
+
+    치환식이나 날짜 형식에 '/' 가 들어가면 이름 변경이 하위 폴더로의 이동이 되므로,
+    패턴 검증과 실행 직전 두 곳에서 같은 규칙으로 막습니다.
+    """
+
+    # 어느 플랫폼에서도 파일명에 쓸 수 없는 문자 (경로 구분자, NUL)
+    INVALID_CHARS = frozenset({'/', '\0', os.sep} | ({os.altsep} if os.altsep else set()))
+
+    # Windows 예약 문자 (Windows 에서만 검사)
+    WINDOWS_RESERVED_CHARS = frozenset('<>:"\\|?*')
+
+    @staticmethod
+    def invalid_chars() -> frozenset:
+        """
+        현재 플랫폼에서 파일명에 쓸 수 없는 문자 집합
+
+        Returns:
+            문자 집합
+        """
+        if os.name == 'nt':
+            return NameRules.INVALID_CHARS | NameRules.WINDOWS_RESERVED_CHARS
+        return NameRules.INVALID_CHARS
+
+    @staticmethod
+    def find_invalid_char(text: str) -> Optional[str]:
+        """
+        문자열에 들어 있는 첫 번째 금지 문자 찾기 (패턴 리터럴 검사용)
+
+        Args:
+            text: 검사할 문자열
+
+        Returns:
+            금지 문자 또는 None
+        """
+        invalid = NameRules.invalid_chars()
+        for ch in text:
+            if ch in invalid:
+                return ch
+        return None
+
+    @staticmethod
+    def invalid_reason(name: str) -> Optional[str]:
+        """
+        파일명으로 쓸 수 없는 이유
+
+        Args:
+            name: 새 파일명
+
+        Returns:
+            사용자용 이유 또는 None (사용 가능)
+        """
+        if name in ('', '.', '..'):
+            return "빈 이름"
+        ch = NameRules.find_invalid_char(name)
+        if ch is not None:
+            return f"사용할 수 없는 문자 {NameRules.describe_char(ch)}"
+        return None
+
+    @staticmethod
+    def find_invalid(names: List[str]) -> List[Tuple[int, str]]:
+        """
+        쓸 수 없는 이름의 위치와 이유 목록
+
+        Args:
+            names: 새 파일명 리스트
+
+        Returns:
+            (위치, 이유) 리스트
+        """
+        result = []
+        for position, name in enumerate(names):
+            reason = NameRules.invalid_reason(name)
+            if reason is not None:
+                result.append((position, reason))
+        return result
+
+    @staticmethod
+    def describe_char(ch: str) -> str:
+        """금지 문자 표시용 문자열 (NUL 은 이름으로)"""
+        return "NUL" if ch == '\0' else f"'{ch}'"
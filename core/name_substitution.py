@@ -0,0 +1,401 @@
+"""
+Name Substitution Module
+정규식 찾아 바꾸기 로직 (단일 책임: sed 스타일 치환식으로 파일명 변환)
+"""
+
+import os
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from models.file_item import FileItem
+from core.name_rules import NameRules
+
+
+class _StemMatcher:
+    """
+    찾기 정규식 + 파일명별 매칭 결과 캐시
+    바꾸기 문자열만 바뀌는 경우 정규식 매칭을 다시 하지 않도록 결과를 보관합니다.
+    """
+
+    # 매칭 결과를 보관할 최대 파일명 수 (넘으면 가장 오래 쓰지 않은 것부터 버림)
+    CACHE_SIZE = 50000
+
+    def __init__(self, find: str, flags: str):
+        self.regex = re.compile(find, re.IGNORECASE if 'i' in flags else 0)
+        self.count = 0 if 'g' in flags else 1
+        # 파일명(확장자 제외) -> (매칭 사이 리터럴 조각들, 매칭별 그룹 튜플들)
+        self._cache: 'OrderedDict[str, Tuple[List[str], List[tuple]]]' = OrderedDict()
+
+    def split(self, stem: str) -> Tuple[List[str], List[tuple]]:
+        """
+        파일명을 매칭 구간 기준으로 분해 (결과 캐시)
+
+        Args:
+            stem: 확장자를 제외한 파일명
+
+        Returns:
+            (리터럴 조각 리스트, 그룹 튜플 리스트) - 조각 수 = 매칭 수 + 1
+        """
+        cached = self._cache.get(stem)
+        if cached is not None:
+            self._cache.move_to_end(stem)
+            return cached
+
+        pieces = []
+        groups = []
+        pos = 0
+        for match in self.regex.finditer(stem):
+            pieces.append(stem[pos:match.start()])
+            groups.append((match.group(0),) + match.groups())
+            pos = match.end()
+            if self.count and len(groups) >= self.count:
+                break
+        pieces.append(stem[pos:])
+
+        result = (pieces, groups)
+        self._cache[stem] = result
+        if len(self._cache) > _StemMatcher.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+
+class NameSubstitution:
+    """
+    sed 스타일 치환식 클래스
+    책임: s/찾기/바꾸기/플래그 식을 한 번 컴파일하여 탭 전체 파일명에 일괄 적용
+
+    바꾸기 문자열 문법:
+        \\1 ~ \\9, &       캡처 그룹 / 전체 매칭
+        \\g<이름>, \\g<1>   이름/번호 그룹
+        \\g<1:03>          숫자 그룹 제로 패딩 (format 스펙)
+        \\U \\L \\E         이후 대문자 / 소문자 / 변환 종료
+        \\u \\l             다음 한 글자 대문자 / 소문자
+    플래그: g (모두 바꾸기), i (대소문자 무시)
+    치환은 확장자를 제외한 파일명에만 적용됩니다.
+    """
+
+    CASE_ESCAPES = 'ULEul'
+    FLAGS = 'gi'
+    # 허용 구분자 ('_', '-', '.' 처럼 파일명 패턴에 흔한 문자는 제외)
+    DELIMITERS = '/|#!,;:@%~'
+
+    def __init__(self, expression: str):
+        """
+        치환식 컴파일
+
+        Args:
+            expression: sed 스타일 치환식 (예: s/_final_v\\d+//g)
+        """
+        self.expression = expression
+        self.error: Optional[str] = None  # 컴파일 오류 메시지
+        self.needs = set()                # 추가 메타데이터 불필요
+        self.has_counter = False
+        self.uses_original = True
+        self.unique_by_construction = False  # 서로 다른 이름이 같은 결과가 될 수 있음
+
+        self._matcher: Optional[_StemMatcher] = None
+        self._ops: List[tuple] = []
+
+        try:
+            find, replace, flags = NameSubstitution.split(expression)
+            if not find:
+                raise ValueError("찾을 패턴이 비어 있습니다.")
+            self._matcher = NameSubstitution._get_matcher(find, flags)
+            self._ops = self._compile_replacement(replace)
+        except (ValueError, re.error) as e:
+            self.error = str(e)
+
+    # ==================== 파싱 ====================
+
+    @staticmethod
+    def is_expression(pattern: str) -> bool:
+        """
+        패턴이 sed 스타일 치환식인지 확인
+        구분자가 세 번 나오는 s<d>찾기<d>바꾸기<d>[플래그] 전체 형식일 때만 치환식으로 봅니다.
+        ('s#{n}', 's_{000}' 처럼 s 로 시작하는 일반 패턴은 템플릿)
+
+        Args:
+            pattern: 파일명 패턴
+
+        Returns:
+            치환식 여부
+        """
+        parts = NameSubstitution._split_parts(pattern)
+        # 플래그 자리는 영문자만 (지원 여부는 split 에서 오류로 보고)
+        return parts is not None and (parts[2] == '' or parts[2].isascii() and parts[2].isalpha())
+
+    @staticmethod
+    def split(expression: str) -> Tuple[str, str, str]:
+        """
+        치환식을 (찾기, 바꾸기, 플래그) 로 분리
+        이스케이프된 구분자(\\/)는 그대로 유지합니다.
+
+        Args:
+            expression: sed 스타일 치환식
+
+        Returns:
+            (찾기 정규식, 바꾸기 문자열, 플래그)
+
+        Raises:
+            ValueError: 형식이 올바르지 않음
+        """
+        if not NameSubstitution.is_expression(expression):
+            raise ValueError("치환식은 s/찾기/바꾸기/플래그 형식이어야 합니다.")
+
+        find, replace, flags = NameSubstitution._split_parts(expression)
+        if any(flag not in NameSubstitution.FLAGS for flag in flags):
+            raise ValueError(f"지원하지 않는 플래그: {flags}")
+        return (find, replace, flags)
+
+    @staticmethod
+    def _split_parts(expression: str) -> Optional[List[str]]:
+        """
+        이스케이프되지 않은 구분자 기준으로 세 부분 분리
+
+        Args:
+            expression: 치환식 후보 문자열
+
+        Returns:
+            [찾기, 바꾸기, 플래그] 또는 None (형식 아님)
+        """
+        if len(expression) < 4 or expression[0] != 's' or expression[1] not in NameSubstitution.DELIMITERS:
+            return None
+
+        delimiter = expression[1]
+        parts = []
+        current = []
+        i = 2
+        while i < len(expression):
+            ch = expression[i]
+            if ch == '\\' and i + 1 < len(expression):
+                current.append(expression[i:i + 2])
+                i += 2
+                continue
+            if ch == delimiter:
+                parts.append(''.join(current))
+                current = []
+            else:
+                current.append(ch)
+            i += 1
+        parts.append(''.join(current))
+
+        return parts if len(parts) == 3 else None
+
+    @staticmethod
+    def escape(text: str, delimiter: str = '/') -> str:
+        """
+        입력란 문자열을 치환식의 찾기/바꾸기 부분으로 변환 (unescape 의 역변환)
+
+        구분자는 \\<구분자> 로 바꾸고, 구분자 바로 앞이나 문자열 끝의 역슬래시는
+        두 배로 늘려 구분자를 삼키지 않게 합니다. 그 밖의 이스케이프(\\d 등)는 그대로 둡니다.
+
+        Args:
+            text: 입력란 문자열
+            delimiter: 치환식 구분자
+
+        Returns:
+            치환식 부분 문자열
+        """
+        out = []
+        run = 0  # 이어진 역슬래시 수
+        for ch in text:
+            if ch == '\\':
+                run += 1
+                continue
+            if ch == delimiter:
+                out.append('\\' * (2 * run + 1) + ch)
+            else:
+                out.append('\\' * run + ch)
+            run = 0
+        out.append('\\' * (2 * run))
+        return ''.join(out)
+
+    @staticmethod
+    def unescape(part: str, delimiter: str = '/') -> str:
+        """
+        치환식의 찾기/바꾸기 부분을 입력란 문자열로 변환 (escape 의 역변환)
+
+        Args:
+            part: split 결과의 찾기 또는 바꾸기 문자열
+            delimiter: escape 에 쓴 구분자
+
+        Returns:
+            입력란 문자열
+        """
+        out = []
+        run = 0
+        for ch in part:
+            if ch == '\\':
+                run += 1
+                continue
+            if ch == delimiter:
+                out.append('\\' * (run // 2) + ch)
+            else:
+                out.append('\\' * run + ch)
+            run = 0
+        out.append('\\' * (run // 2))
+        return ''.join(out)
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _get_matcher(find: str, flags: str) -> _StemMatcher:
+        """찾기 정규식별 매처 (바꾸기 문자열이 바뀌어도 매칭 결과 재사용)"""
+        return _StemMatcher(find, flags)
+
+    def _compile_replacement(self, replace: str) -> List[tuple]:
+        """
+        바꾸기 문자열을 연산 리스트로 변환
+
+        Args:
+            replace: 바꾸기 문자열
+
+        Returns:
+            ('lit', 텍스트, '') / ('grp', 그룹번호, 포맷) / ('case', 변환, '') 튜플 리스트
+
+        Raises:
+            ValueError: 잘못된 그룹 참조 또는 파일명에 쓸 수 없는 문자
+        """
+        regex = self._matcher.regex
+        ops: List[tuple] = []
+        literal: List[str] = []
+
+        def flush():
+            if literal:
+                ops.append(('lit', ''.join(literal), ''))
+                literal.clear()
+
+        def group_op(ref: str, spec: str = '') -> tuple:
+            if ref.isdigit():
+                index = int(ref)
+            elif ref in regex.groupindex:
+                index = regex.groupindex[ref]
+            else:
+                raise ValueError(f"알 수 없는 그룹: {ref}")
+            if index > regex.groups:
+                raise ValueError(f"잘못된 그룹 참조: {ref}")
+            if spec:
+                format(0, spec)  # 잘못된 포맷 스펙은 여기서 ValueError
+            return ('grp', index, spec)
+
+        i = 0
+        while i < len(replace):
+            ch = replace[i]
+            if ch == '&':
+                flush()
+                ops.append(group_op('0'))
+                i += 1
+            elif ch == '\\' and i + 1 < len(replace):
+                nxt = replace[i + 1]
+                if nxt.isdigit():
+                    flush()
+                    ops.append(group_op(nxt))
+                    i += 2
+                elif nxt == 'g' and replace[i + 2:i + 3] == '<':
+                    end = replace.find('>', i + 3)
+                    if end < 0:
+                        raise ValueError("\\g<...> 가 닫히지 않았습니다.")
+                    ref, _, spec = replace[i + 3:end].partition(':')
+                    flush()
+                    ops.append(group_op(ref, spec))
+                    i = end + 1
+                elif nxt in self.CASE_ESCAPES:
+                    flush()
+                    ops.append(('case', nxt, ''))
+                    i += 2
+                else:
+                    # \\&, \\\\, \\/ 등은 문자 그대로
+                    literal.append(nxt)
+                    i += 2
+            else:
+                literal.append(ch)
+                i += 1
+        flush()
+
+        # 그룹 값은 파일명에서 오므로, 금지 문자는 리터럴에서만 생길 수 있음 (예: s/_/\//)
+        for kind, value, _ in ops:
+            ch = NameRules.find_invalid_char(value) if kind == 'lit' else None
+            if ch is not None:
+                raise ValueError(f"바꾸기 문자열에 파일명에 쓸 수 없는 문자 {NameRules.describe_char(ch)} 가 있습니다.")
+        return ops
+
+    # ==================== 렌더링 ====================
+
+    def _expand(self, groups: tuple) -> str:
+        """매칭 하나에 대해 바꾸기 문자열 전개"""
+        out = []
+        mode = None  # 'U' / 'L' / None
+        once = None  # 'u' / 'l' / None
+        for kind, value, spec in self._ops:
+            if kind == 'case':
+                if value in 'ul':
+                    once = value
+                else:
+                    mode = None if value == 'E' else value
+                continue
+
+            if kind == 'lit':
+                text = value
+            else:
+                text = groups[value] or ''
+                if spec and text.isdigit():
+                    text = format(int(text), spec)
+
+            if mode == 'U':
+                text = text.upper()
+            elif mode == 'L':
+                text = text.lower()
+            if once and text:
+                head = text[0].upper() if once == 'u' else text[0].lower()
+                text = head + text[1:]
+                once = None
+            out.append(text)
+        return ''.join(out)
+
+    def prepare(self, items: List[FileItem]) -> None:
+        """NameTemplate 과 동일한 인터페이스 (조회할 메타데이터 없음)"""
+
+    def group_indices(self, items: List[FileItem]) -> List[int]:
+        """NameTemplate 과 동일한 인터페이스 (그룹 순번 미사용)"""
+        return [0] * len(items)
+
+    def render(self, item: FileItem, index: int = 0, group_index: int = 0) -> str:
+        """
+        아이템 하나의 새 파일명 생성
+
+        Args:
+            item: 파일 아이템
+            index: 사용하지 않음 (NameTemplate 호환)
+            group_index: 사용하지 않음 (NameTemplate 호환)
+
+        Returns:
+            새 파일명 (치환식 오류 시 원본 파일명)
+        """
+        if self.error:
+            return item.original_name
+
+        stem, ext = os.path.splitext(item.original_name)
+        pieces, groups = self._matcher.split(stem)
+        if not groups:
+            return item.original_name
+
+        out = [pieces[0]]
+        for piece, match_groups in zip(pieces[1:], groups):
+            out.append(self._expand(match_groups))
+            out.append(piece)
+        return ''.join(out) + ext
+
+    def render_all(self, items: List[FileItem], offset: int = 0) -> List[str]:
+        """
+        탭 전체 파일명에 치환식 일괄 적용
+
+        Args:
+            items: 파일 아이템 리스트
+            offset: 사용하지 않음 (NameTemplate 호환)
+
+        Returns:
+            새 파일명 리스트
+        """
+        render = self.render
+        return [render(item) for item in items]
@@ -0,0 +1,316 @@
+"""
+Name Template Module
+파일명 템플릿 컴파일 로직 (단일 책임: 토큰 패턴을 포맷터로 변환)
+"""
+
+import os
+import re
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from models.file_item import FileItem
+from core.image_info import ImageInfo
+from core.name_rules import NameRules
+
+
+# 아이템별 필드 값 생성 함수: (아이템, 전체 순번(0부터), 그룹 내 순번(0부터)) -> 값
+FieldGetter = Callable[[FileItem, int, int], object]
+
+
+class NameTemplate:
+    """
+    컴파일된 파일명 템플릿 클래스
+    책임: 패턴을 한 번만 해석하여 아이템마다 str.format 한 번으로 이름 생성
+
+    지원 토큰:
+        {n}, {000}          전체 순번 (제로 패딩 폭 = 0 개수)
+        {n:10}, {000:1:5}   시작값 / 증가값 지정
+        {gn}, {g000}        그룹(확장자)별 순번
+        {parent}            상위 폴더명
+        {orig}              원본 파일명 (확장자 제외)
+        {ext}               원본 확장자 (점 제외)
+        {date}, {date:%Y-%m-%d}  수정 날짜 (기본 %Y%m%d)
+        {w}, {h}            이미지 가로/세로 크기
+    """
+
+    TOKEN_PATTERN = re.compile(r'\{([^{}]*)\}')
+    COUNTER_PATTERN = re.compile(r'^(g?)(n|0+)(?::(-?\d+))?(?::(-?\d+))?$')
+    DEFAULT_DATE_FORMAT = '%Y%m%d'
+
+    def __init__(self, pattern: str, extensions: Iterable[str] = ()):
+        """
+        템플릿 컴파일
+
+        Args:
+            pattern: 파일명 패턴
+            extensions: 이미 포함되어 있으면 확장자를 덧붙이지 않을 확장자 목록
+        """
+        self.pattern = pattern
+        self.extensions: Tuple[str, ...] = tuple(extensions)
+
+        self.unknown_tokens: List[str] = []  # 해석하지 못한 토큰 (리터럴로 유지)
+        self.error: Optional[str] = None     # 파일명으로 쓸 수 없는 이름을 만드는 패턴이면 이유
+        self.needs: Set[str] = set()         # 필요한 메타데이터 ('dimensions', 'groups')
+        self.has_counter = False             # 순번 토큰 포함 여부
+        self.uses_original = False           # {orig} 토큰 포함 여부
+        self.unique_by_construction = False  # 전체 계산 없이 중복이 없음을 보장할 수 있는지
+
+        # 세그먼트 종류 기록 ('lit', 'counter', 'const', 'var') - 중복 불가 판정용
+        self._segments: List[Tuple[str, str]] = []
+
+        self._getters: List[FieldGetter] = []
+        self._format = ""        # 아이템용 포맷 문자열
+        self._index_format = ""  # 순번만 사용하는 포맷 문자열 (아이템 토큰은 빈 문자열)
+        self._index_getters: List[FieldGetter] = []
+        self._compile()
+
+    # ==================== 컴파일 ====================
+
+    def _compile(self) -> None:
+        """패턴을 위치 기반 포맷 문자열 + 필드 함수 리스트로 변환"""
+        parts: List[str] = []
+        index_parts: List[str] = []
+        pos = 0
+
+        for match in self.TOKEN_PATTERN.finditer(self.pattern):
+            self._add_literal(self.pattern[pos:match.start()])
+            literal = self._escape(self.pattern[pos:match.start()])
+            parts.append(literal)
+            index_parts.append(literal)
+            pos = match.end()
+
+            field = self._compile_token(match.group(1))
+            if field is None:
+                # 알 수 없는 토큰은 기존 동작처럼 그대로 남김
+                self.unknown_tokens.append(match.group(1))
+                self._add_literal(match.group(0))
+                parts.append(self._escape(match.group(0)))
+                index_parts.append(self._escape(match.group(0)))
+                continue
+
+            spec, getter, is_counter = field
+            parts.append('{%d%s}' % (len(self._getters), spec))
+            self._getters.append(getter)
+            if is_counter:
+                index_parts.append('{%d%s}' % (len(self._index_getters), spec))
+                self._index_getters.append(getter)
+
+        self._add_literal(self.pattern[pos:])
+        literal = self._escape(self.pattern[pos:])
+        parts.append(literal)
+        index_parts.append(literal)
+
+        self._format = ''.join(parts)
+        self._index_format = ''.join(index_parts)
+        self.unique_by_construction = self._check_unique()
+
+        for kind, text in self._segments:
+            ch = NameRules.find_invalid_char(text) if kind == 'lit' else None
+            if ch is not None and self.error is None:
+                self.error = f"패턴에 파일명에 쓸 수 없는 문자 {NameRules.describe_char(ch)} 가 있습니다."
+
+    def _check_unique(self) -> bool:
+        """
+        중복 불가 판정
+
+        첫 전체 순번 앞이 모두 고정값(리터럴, {parent})이고 순번 바로 뒤가 숫자가 아닌
+        문자(리터럴 또는 덧붙는 확장자)이면, 순번 문자열을 이름에서 되찾을 수 있으므로
+        서로 다른 순번은 항상 서로 다른 이름을 만듭니다.
+
+        Returns:
+            중복 불가 보장 여부
+        """
+        for pos, (kind, text) in enumerate(self._segments):
+            if kind == 'counter':
+                if text == '0':  # 증가값 0 은 모두 같은 번호
+                    return False
+                if pos + 1 == len(self._segments):
+                    return True
+                next_kind, next_text = self._segments[pos + 1]
+                return next_kind == 'lit' and not next_text[0].isdigit()
+            if kind not in ('lit', 'const'):
+                return False
+        return False
+
+    def _add_literal(self, text: str) -> None:
+        """리터럴 세그먼트 기록 (연속 리터럴은 병합)"""
+        if not text:
+            return
+        if self._segments and self._segments[-1][0] == 'lit':
+            self._segments[-1] = ('lit', self._segments[-1][1] + text)
+        else:
+            self._segments.append(('lit', text))
+
+    def _compile_token(self, token: str) -> Optional[Tuple[str, FieldGetter, bool]]:
+        """
+        토큰 하나를 (포맷 스펙, 필드 함수, 순번 여부) 로 변환
+
+        Args:
+            token: 중괄호 안의 토큰 문자열
+
+        Returns:
+            변환 결과 또는 None (알 수 없는 토큰)
+        """
+        counter = self.COUNTER_PATTERN.match(token)
+        if counter:
+            grouped, digits, start, step = counter.groups()
+            self.has_counter = True
+            spec = ':d' if digits == 'n' else ':0%dd' % len(digits)
+            step_value = int(step or 1)
+            getter = self._counter_getter(int(start or 1), step_value, bool(grouped))
+            if grouped:
+                self.needs.add('groups')
+                self._segments.append(('var', token))
+            else:
+                self._segments.append(('counter', str(step_value)))
+            return (spec, getter, not grouped)
+
+        name, _, arg = token.partition(':')
+        if name == 'parent' and not arg:
+            # 한 배치(폴더) 안에서는 고정값
+            self._segments.append(('const', token))
+            return ('', lambda item, i, g: item.original_path.parent.name, False)
+
+        self._segments.append(('var', token))
+        field = self._compile_item_token(name, arg)
+        if field is None:
+            self._segments.pop()
+        return field
+
+    def _compile_item_token(self, name: str, arg: str) -> Optional[Tuple[str, FieldGetter, bool]]:
+        """
+        아이템마다 값이 달라지는 토큰 변환
+
+        Args:
+            name: 토큰 이름
+            arg: ':' 뒤 인자
+
+        Returns:
+            (포맷 스펙, 필드 함수, False) 또는 None (알 수 없는 토큰)
+        """
+        if name == 'orig' and not arg:
+            self.uses_original = True
+            return ('', lambda item, i, g: os.path.splitext(item.original_name)[0], False)
+        if name == 'ext' and not arg:
+            return ('', lambda item, i, g: item.ext[1:], False)
+        if name == 'date':
+            spec = ':' + (arg or self.DEFAULT_DATE_FORMAT)
+            self._check_date_format(spec[1:])
+            return (spec, lambda item, i, g: datetime.fromtimestamp(item.stat.st_mtime), False)
+        if name in ('w', 'h') and not arg:
+            axis = 0 if name == 'w' else 1
+            self.needs.add('dimensions')
+            return ('', lambda item, i, g: item.dimensions[axis], False)
+        return None
+
+    def _check_date_format(self, date_format: str) -> None:
+        """날짜 형식이 '/' 등 파일명에 쓸 수 없는 문자를 만들면 오류 기록 (예: %Y/%m)"""
+        try:
+            sample = format(datetime(2000, 12, 31, 23, 59, 58), date_format)
+        except ValueError:
+            sample = ""
+        ch = NameRules.find_invalid_char(sample)
+        if ch is not None and self.error is None:
+            self.error = (f"날짜 형식 '{date_format}' 이 파일명에 쓸 수 없는 문자 "
+                          f"{NameRules.describe_char(ch)} 를 만듭니다.")
+
+    @staticmethod
+    def _counter_getter(start: int, step: int, grouped: bool) -> FieldGetter:
+        """순번 필드 함수 생성 (시작값/증가값 고정)"""
+        if grouped:
+            return lambda item, i, g: start + step * g
+        return lambda item, i, g: start + step * i
+
+    @staticmethod
+    def _escape(literal: str) -> str:
+        """str.format 용 리터럴 이스케이프"""
+        return literal.replace('{', '{{').replace('}', '}}')
+
+    # ==================== 렌더링 ====================
+
+    def prepare(self, items: List[FileItem]) -> None:
+        """
+        템플릿이 사용하는 메타데이터만 일괄 조회
+
+        Args:
+            items: 파일 아이템 리스트
+        """
+        if 'dimensions' in self.needs:
+            ImageInfo.load_dimensions(items)
+
+    def group_indices(self, items: List[FileItem]) -> List[int]:
+        """
+        그룹(확장자)별 순번 계산
+
+        Args:
+            items: 파일 아이템 리스트 (현재 순서)
+
+        Returns:
+            각 아이템의 그룹 내 순번 리스트 (0부터)
+        """
+        counts = {}
+        result = []
+        for item in items:
+            g = counts.get(item.ext, 0)
+            counts[item.ext] = g + 1
+            result.append(g)
+        return result
+
+    def render(self, item: FileItem, index: int, group_index: int = 0) -> str:
+        """
+        아이템 하나의 새 파일명 생성 (prepare 가 선행되어야 함)
+
+        Args:
+            item: 파일 아이템
+            index: 전체 순번 (0부터, 오프셋 포함)
+            group_index: 그룹 내 순번 (0부터)
+
+        Returns:
+            새 파일명
+        """
+        name = self._format.format(*[get(item, index, group_index) for get in self._getters])
+        if not name.endswith(self.extensions):
+            name += item.ext
+        return name
+
+    def render_all(self, items: List[FileItem], offset: int = 0) -> List[str]:
+        """
+        아이템 전체의 새 파일명 일괄 생성
+
+        Args:
+            items: 파일 아이템 리스트 (현재 순서)
+            offset: 전체 순번 시작 오프셋 (폴더 간 연속 번호용)
+
+        Returns:
+            새 파일명 리스트
+        """
+        self.prepare(items)
+        groups = self.group_indices(items) if 'groups' in self.needs else None
+        fmt = self._format.format
+        getters = self._getters
+        extensions = self.extensions
+
+        names = []
+        for i, item in enumerate(items):
+            g = groups[i] if groups else 0
+            name = fmt(*[get(item, offset + i, g) for get in getters])
+            if not name.endswith(extensions):
+                name += item.ext
+            names.append(name)
+        return names
+
+    def render_index(self, index: int, extension: str) -> str:
+        """
+        아이템 없이 순번만으로 파일명 생성 (아이템 토큰은 빈 문자열)
+
+        Args:
+            index: 전체 순번 (0부터)
+            extension: 덧붙일 확장자
+
+        Returns:
+            새 파일명
+        """
+        name = self._index_format.format(*[get(None, index, index) for get in self._index_getters])
+        if not name.endswith(self.extensions):
+            name += extension
+        return name
@@ -0,0 +1,105 @@
+"""
+Name View Module
+새 파일명 지연 계산 뷰 (단일 책임: 필요한 행만 새 파일명 생성)
+"""
+
+from typing import Dict, List, Optional, Sequence, Union
+
+from models.file_item import FileItem
+from core.name_template import NameTemplate
+from core.name_substitution import NameSubstitution
+
+
+class NameView(Sequence):
+    """
+    새 파일명 지연 계산 뷰 클래스
+    책임: 표시/실행에 필요한 행만 새 파일명을 계산하고 결과를 캐시
+
+    뷰 생성은 O(1) 이며, 화면에 보이는 행은 인덱스 접근으로,
+    실행/중복 검사 시에는 materialize() 로 전체를 계산합니다.
+    """
+
+    # 메타데이터가 필요한 템플릿에서 한 번에 미리 조회할 행 수 (스크롤 방향 기준)
+    PREFETCH_ROWS = 64
+
+    def __init__(self, renamer: Union[NameTemplate, NameSubstitution],
+                 items: List[FileItem], offset: int = 0):
+        """
+        뷰 초기화 (이름은 아직 계산하지 않음)
+
+        Args:
+            renamer: 컴파일된 템플릿 또는 치환식 (NameGenerator.compile 결과)
+            items: 파일 아이템 리스트 (현재 순서)
+            offset: 전체 순번 시작 오프셋 (폴더 간 연속 번호용)
+        """
+        self.renamer = renamer
+        self.items = items
+        self.offset = offset
+
+        self._cache: Dict[int, str] = {}
+        self._groups: Optional[List[int]] = None  # 그룹 순번 (필요할 때 한 번 계산)
+        self._names: Optional[List[str]] = None   # 전체 계산 결과
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.window(*index.indices(len(self.items))[:2])
+
+        if self._names is not None:
+            return self._names[index]
+
+        if index < 0:
+            index += len(self.items)
+        name = self._cache.get(index)
+        if name is None:
+            item = self.items[index]
+            if self.renamer.needs:
+                self.renamer.prepare(self.items[index:index + self.PREFETCH_ROWS])
+            name = self.renamer.render(item, self.offset + index, self._group_index(index))
+            self._cache[index] = name
+        return name
+
+    def _group_index(self, index: int) -> int:
+        """그룹(확장자)별 순번 조회 (템플릿이 사용할 때만 계산)"""
+        if 'groups' not in self.renamer.needs:
+            return 0
+        if self._groups is None:
+            self._groups = self.renamer.group_indices(self.items)
+        return self._groups[index]
+
+    def window(self, start: int, stop: int) -> List[str]:
+        """
+        연속 구간의 새 파일명 계산 (표시 영역용)
+        구간 내 메타데이터는 한 번에 조회합니다.
+
+        Args:
+            start: 시작 인덱스
+            stop: 끝 인덱스 (미포함)
+
+        Returns:
+            새 파일명 리스트
+        """
+        if self._names is not None:
+            return self._names[start:stop]
+
+        pending = [i for i in range(start, min(stop, len(self.items))) if i not in self._cache]
+        if pending:
+            self.renamer.prepare([self.items[i] for i in pending])
+        return [self[i] for i in range(start, min(stop, len(self.items)))]
+
+    def materialize(self) -> List[str]:
+        """
+        전체 새 파일명을 계산하고 FileItem.new_name 에 반영 (실행/중복 검사용)
+
+        Returns:
+            새 파일명 리스트
+        """
+        if self._names is None:
+            self._names = self.renamer.render_all(self.items, self.offset)
+            self._cache.clear()
+
+        for item, name in zip(self.items, self._names):
+            item.new_name = name
+        return self._names
@@ -0,0 +1,227 @@
+"""
+Rename Engine Module
+폴더 단위 이름 변경 실행 로직 (단일 책임: 한 폴더 안의 rename/목록/fsync 시스템 호출)
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+
+class PathRenameEngine:
+    """
+    경로 기반 이름 변경 엔진 클래스
+    책임: dir_fd 를 지원하지 않는 플랫폼(Windows)에서 폴더 경로 + 파일명으로 시스템 호출
+    """
+
+    def __init__(self, folder: Path):
+        """
+        Args:
+            folder: 대상 폴더
+        """
+        self.folder = folder
+
+    def __enter__(self) -> "PathRenameEngine":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """열린 자원 정리 (경로 기반은 없음)"""
+
+    def rename(self, source: str, target: str) -> None:
+        """
+        폴더 안에서 이름 변경
+
+        Args:
+            source: 현재 파일명
+            target: 새 파일명
+
+        Raises:
+            OSError: 이름 변경 실패
+        """
+        os.rename(self.folder / source, self.folder / target)
+
+    def scandir(self) -> Iterator[os.DirEntry]:
+        """
+        폴더 항목 조회 (with 문으로 사용, 항목의 stat() 도 같은 폴더 기준)
+
+        Returns:
+            os.scandir 반복자
+        """
+        return os.scandir(self.folder)
+
+    def listdir(self) -> List[str]:
+        """
+        폴더 내 파일명 목록 (1회 조회)
+
+        Returns:
+            파일명 리스트
+        """
+        with self.scandir() as entries:
+            return [entry.name for entry in entries]
+
+    def listdir_inodes(self) -> List[Tuple[str, int]]:
+        """
+        폴더 내 (파일명, inode) 목록 (1회 조회, POSIX 에서는 항목별 stat 없음)
+
+        Returns:
+            (파일명, inode) 리스트
+        """
+        with self.scandir() as entries:
+            return [(entry.name, entry.inode()) for entry in entries]
+
+    def writable(self) -> bool:
+        """
+        폴더 쓰기 권한 여부 (이름 변경 가능 여부)
+
+        Returns:
+            쓰기 가능 여부
+        """
+        return os.access(self.folder, os.W_OK)
+
+    def device(self) -> int:
+        """
+        폴더가 있는 장치 번호 (inode 가 유효한 범위)
+
+        Returns:
+            st_dev
+        """
+        return os.stat(self.folder).st_dev
+
+    def sync(self) -> None:
+        """디렉토리 항목 fsync (지원하지 않는 플랫폼에서는 무시)"""
+        try:
+            fd = os.open(self.folder, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class DirFdRenameEngine(PathRenameEngine):
+    """
+    디렉토리 fd 기반 이름 변경 엔진 클래스
+    책임: 폴더를 한 번만 열고 renameat/fstatat 으로 배치 전체를 처리
+
+    파일명만 커널에 넘기므로 호출마다 전체 경로를 해석하지 않고,
+    배치 도중 상위 폴더 이름이 바뀌어도 같은 폴더를 계속 가리킵니다.
+    """
+
+    def __init__(self, folder: Path):
+        """
+        폴더 열기
+
+        Args:
+            folder: 대상 폴더
+
+        Raises:
+            OSError: 폴더를 열 수 없음
+        """
+        super().__init__(folder)
+        self._fd = os.open(folder, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+
+    def close(self) -> None:
+        """디렉토리 fd 닫기"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def rename(self, source: str, target: str) -> None:
+        os.rename(source, target, src_dir_fd=self._fd, dst_dir_fd=self._fd)
+
+    def scandir(self) -> Iterator[os.DirEntry]:
+        # scandir 은 fd 를 내부에서 복제하므로 self._fd 는 그대로 유지됨 (항목 stat 은 fstatat)
+        return os.scandir(self._fd)
+
+    def writable(self) -> bool:
+        if os.access not in os.supports_dir_fd:
+            return super().writable()
+        return os.access(".", os.W_OK, dir_fd=self._fd)
+
+    def device(self) -> int:
+        return os.fstat(self._fd).st_dev
+
+    def sync(self) -> None:
+        try:
+            os.fsync(self._fd)
+        except OSError:
+            pass
+
+
+class LatencyInjectingEngine(PathRenameEngine):
+    """
+    지연 주입 엔진 클래스 (테스트/측정용)
+    책임: 다른 엔진을 감싸 rename 호출마다 고정 지연을 추가 (네트워크 드라이브 왕복 흉내)
+
+    실제 NAS 없이 병렬 실행(FileOperations.apply_plan workers)의 효과를 측정할 때 사용합니다.
+    """
+
+    def __init__(self, inner: PathRenameEngine, latency: float):
+        """
+        Args:
+            inner: 실제 시스템 호출을 수행할 엔진
+            latency: rename 호출마다 추가할 지연 (초)
+        """
+        super().__init__(inner.folder)
+        self.inner = inner
+        self.latency = latency
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def rename(self, source: str, target: str) -> None:
+        time.sleep(self.latency)
+        self.inner.rename(source, target)
+
+    def scandir(self) -> Iterator[os.DirEntry]:
+        return self.inner.scandir()
+
+    def writable(self) -> bool:
+        return self.inner.writable()
+
+    def device(self) -> int:
+        return self.inner.device()
+
+    def sync(self) -> None:
+        self.inner.sync()
+
+
+class RenameEngine:
+    """
+    이름 변경 엔진 선택 클래스
+    책임: 플랫폼 지원 여부에 따라 dir_fd 엔진 또는 경로 엔진 생성
+    """
+
+    @staticmethod
+    def supports_dir_fd() -> bool:
+        """
+        renameat/fstatat/fd 목록 조회 지원 여부
+
+        Returns:
+            dir_fd 엔진 사용 가능 여부
+        """
+        return (os.rename in os.supports_dir_fd
+                and os.stat in os.supports_dir_fd
+                and os.scandir in os.supports_fd)
+
+    @staticmethod
+    def open(folder: Path) -> PathRenameEngine:
+        """
+        폴더용 엔진 열기 (with 문으로 사용)
+
+        Args:
+            folder: 대상 폴더
+
+        Returns:
+            DirFdRenameEngine 또는 PathRenameEngine
+        """
+        if RenameEngine.supports_dir_fd():
+            return DirFdRenameEngine(folder)
+        return PathRenameEngine(folder)
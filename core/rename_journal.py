@@ -0,0 +1,374 @@
+"""
+Rename Journal Module
+이름 변경 선기록(WAL) 로직 (단일 책임: 변경 계획/진행 상황 기록 및 중단 작업 조회)
+"""
+
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from core.file_lock import FileLock, FileLockTimeout
+from core.rename_engine import PathRenameEngine
+from core.rename_planner import RenamePlan
+
+
+class JournalEntry:
+    """
+    작업 하나의 저널 클래스
+    책임: 이름을 바꾸기 전 계획을 기록하고, 실행된 단계를 체크포인트로 추가
+
+    파일 형식 (JSON Lines):
+        {"type": "begin", "folder": ..., "before": [...], "after": [...], "chains": [...]}
+        {"type": "done", "step": 3}          # 실행 완료된 단계 (steps 기준 인덱스)
+        {"type": "undone", "step": 3}        # 실패 후 되돌린 단계
+        {"type": "commit"}                   # 전체 단계 완료
+
+    저널을 쓰거나 복구하는 동안에는 옆의 잠금 파일(<저널>.lock)을 잡고 있어,
+    다른 Renam 인스턴스는 진행 중인 작업을 중단된 작업으로 오인하지 않습니다.
+    """
+
+    def __init__(self, path: Path, folder: Path, before: List[str], after: List[str],
+                 plan: RenamePlan, durability: str):
+        """
+        Args:
+            path: 저널 파일 경로
+            folder: 작업 폴더
+            before: 변경 전 파일명 리스트
+            after: 변경 후 파일명 리스트
+            plan: 이름 변경 계획
+            durability: 내구성 모드 (RenameJournal.DURABILITY_*)
+        """
+        self.path = path
+        self.folder = folder
+        self.before = before
+        self.after = after
+        self.plan = plan
+        self.durability = durability
+        self.done: Set[int] = set()
+        self.committed = False
+        self.timestamp = datetime.now().isoformat()
+
+        self._file = None
+        self._lock = threading.Lock()  # 병렬 실행 시 여러 작업 스레드가 체크포인트 기록
+        self._owner: Optional[FileLock] = None  # 저널 소유 잠금 (프로세스 간)
+        self._unsynced = 0  # 마지막 fsync 이후 기록한 체크포인트 수
+
+    # ==================== 기록 ====================
+
+    def begin(self) -> None:
+        """
+        계획 기록 (어떤 이름도 바꾸기 전에 호출)
+
+        Raises:
+            FileLockTimeout: 저널 잠금을 얻지 못함
+        """
+        # 저널 파일이 보이기 전에 잠가 두어야 다른 인스턴스가 건너뜀
+        self._owner = JournalEntry.claim(self.path)
+        if self._owner is None:
+            raise FileLockTimeout(JournalEntry.lock_path(self.path), 0)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._write({
+            "type": "begin",
+            "folder": str(self.folder),
+            "before": self.before,
+            "after": self.after,
+            "chains": self.plan.chains,
+            "unchanged": self.plan.unchanged,
+            "timestamp": self.timestamp
+        })
+        if self.durability != RenameJournal.DURABILITY_NONE:
+            self._sync()
+        if self.durability == RenameJournal.DURABILITY_DIRECTORY:
+            # 저널 파일 자체의 디렉토리 항목도 디스크에 반영
+            PathRenameEngine(self.path.parent).sync()
+
+    def mark_done(self, step: int) -> None:
+        """
+        단계 실행 완료 체크포인트
+
+        Args:
+            step: plan.steps 기준 단계 인덱스
+        """
+        with self._lock:
+            self.done.add(step)
+            self._write({"type": "done", "step": step})
+            self._checkpoint()
+
+    def mark_undone(self, step: int) -> None:
+        """
+        단계 되돌림 체크포인트 (실패 후 롤백 중)
+
+        Args:
+            step: plan.steps 기준 단계 인덱스
+        """
+        with self._lock:
+            self.done.discard(step)
+            self._write({"type": "undone", "step": step})
+            self._checkpoint()
+
+    def commit(self, engine: PathRenameEngine) -> None:
+        """
+        전체 단계 완료 기록
+
+        Args:
+            engine: 이름 변경에 쓴 엔진 (directory 모드에서 같은 디렉토리 fd 로 fsync)
+        """
+        if self.durability == RenameJournal.DURABILITY_DIRECTORY:
+            # 이름 변경 결과가 디스크에 반영된 뒤에만 완료로 기록
+            engine.sync()
+        self._write({"type": "commit"})
+        if self.durability != RenameJournal.DURABILITY_NONE:
+            self._sync()
+        self.committed = True
+
+    def close(self) -> None:
+        """파일 핸들 닫기 (저널과 소유 잠금은 유지 - Undo 기록 전까지 다른 인스턴스가 건드리지 않음)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def release(self) -> None:
+        """파일 핸들을 닫고 소유 잠금 해제 (저널은 남겨 둠 - 다음 실행이나 다른 인스턴스가 복구)"""
+        self.close()
+        if self._owner is not None:
+            self._owner.release()
+            self._owner = None
+
+    def discard(self) -> None:
+        """작업이 끝나(또는 복구되어) 더 이상 필요 없는 저널 삭제"""
+        self.close()
+        owner, self._owner = self._owner, None
+        JournalEntry.remove(self.path, owner)
+
+    def _write(self, record: Dict) -> None:
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        # 프로세스가 죽어도 남도록 OS 버퍼까지는 항상 내보냄
+        self._file.flush()
+
+    def _checkpoint(self) -> None:
+        """체크포인트 묶음 단위 fsync (batch/directory 모드에서 CHECKPOINT_SYNC_STEPS 개마다)"""
+        if self.durability == RenameJournal.DURABILITY_NONE:
+            return
+        self._unsynced += 1
+        if self._unsynced >= RenameJournal.CHECKPOINT_SYNC_STEPS:
+            self._sync()
+
+    def _sync(self) -> None:
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    # ==================== 소유 잠금 ====================
+
+    @staticmethod
+    def lock_path(path: Path) -> Path:
+        """저널 파일의 잠금 파일 경로 (*.jsonl.lock - 저널 목록 조회에 걸리지 않음)"""
+        return path.with_name(path.name + RenameJournal.LOCK_SUFFIX)
+
+    @staticmethod
+    def claim(path: Path) -> Optional[FileLock]:
+        """
+        저널 소유 잠금 시도 (기다리지 않음)
+
+        Args:
+            path: 저널 파일 경로
+
+        Returns:
+            잡은 FileLock 또는 None (다른 인스턴스가 사용 중이거나 잠금 파일을 열 수 없음)
+        """
+        lock = FileLock(JournalEntry.lock_path(path), timeout=0)
+        try:
+            lock.acquire()
+        except (FileLockTimeout, OSError):
+            return None
+        return lock
+
+    @staticmethod
+    def remove(path: Path, owner: Optional[FileLock]) -> None:
+        """
+        저널과 잠금 파일 삭제 후 잠금 해제
+
+        저널을 먼저 지우므로, 그 사이 잠금을 새로 잡은 인스턴스는 저널이 없어 건너뜁니다.
+
+        Args:
+            path: 저널 파일 경로
+            owner: 잡고 있는 소유 잠금 (없으면 저널만 삭제)
+        """
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        if owner is None:
+            return
+        try:
+            JournalEntry.lock_path(path).unlink()
+        except FileNotFoundError:
+            pass
+        owner.release()
+
+    # ==================== 조회 ====================
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["JournalEntry"]:
+        """
+        저널 파일 읽기 (마지막 줄이 잘렸으면 그 줄은 무시)
+
+        Args:
+            path: 저널 파일 경로
+
+        Returns:
+            JournalEntry 또는 None (계획 기록 전에 중단된 파일)
+        """
+        entry = None
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                kind = record.get("type")
+                if kind == "begin":
+                    plan = RenamePlan([[tuple(step) for step in chain] for chain in record["chains"]],
+                                      record.get("unchanged", 0))
+                    entry = cls(path, Path(record["folder"]), record["before"], record["after"],
+                                plan, RenameJournal.DURABILITY_NONE)
+                    entry.timestamp = record.get("timestamp", entry.timestamp)
+                elif entry is None:
+                    break
+                elif kind == "done":
+                    entry.done.add(record["step"])
+                elif kind == "undone":
+                    entry.done.discard(record["step"])
+                elif kind == "commit":
+                    entry.committed = True
+        return entry
+
+
+class RenameJournal:
+    """
+    이름 변경 선기록 관리 클래스
+    책임: 작업별 저널 파일 생성, 내구성 모드 관리, 중단된 작업 목록 조회
+
+    내구성 모드:
+        batch      계획 기록 후 / 체크포인트 CHECKPOINT_SYNC_STEPS 개마다 / 완료 기록 시 저널 fsync (기본값)
+        directory  batch + 작업 폴더 fsync 후 완료 기록 (전원 차단에도 결과 보장)
+        none       fsync 없음 (프로세스 종료에는 안전, 전원 차단에는 보장 없음)
+
+    전원 차단 시 마지막 fsync 이후의 체크포인트(최대 CHECKPOINT_SYNC_STEPS - 1 개)는 잃을 수 있습니다.
+    이런 단계는 복구 시 폴더 목록(원본 없음 + 대상 있음)으로 실행 여부를 다시 판단합니다.
+    """
+
+    DURABILITY_BATCH = "batch"
+    DURABILITY_DIRECTORY = "directory"
+    DURABILITY_NONE = "none"
+    DURABILITY_MODES = (DURABILITY_BATCH, DURABILITY_DIRECTORY, DURABILITY_NONE)
+
+    # batch/directory 모드에서 fsync 없이 쌓아 두는 최대 체크포인트 수
+    CHECKPOINT_SYNC_STEPS = 64
+
+    # 중단된 작업 복구 결과
+    RECOVERED_COMMITTED = "committed"  # 이름 변경은 끝났고 Undo 기록만 남음
+    ROLLED_FORWARD = "forward"         # 남은 단계를 마저 실행
+    ROLLED_BACK = "backward"           # 실행된 단계를 되돌려 원래 상태로 복구
+    RECOVERY_FAILED = "failed"         # 어느 쪽으로도 일관되게 맞출 수 없음 (저널 유지)
+
+    SUFFIX = ".jsonl"
+    LOCK_SUFFIX = ".lock"
+
+    def __init__(self, directory: Path = Path("rename_journal"),
+                 durability: str = DURABILITY_BATCH):
+        """
+        RenameJournal 초기화
+
+        Args:
+            directory: 저널 파일을 보관할 폴더
+            durability: 내구성 모드 (DURABILITY_*)
+        """
+        if durability not in self.DURABILITY_MODES:
+            raise ValueError(f"알 수 없는 내구성 모드: {durability}")
+        self.directory = directory
+        self.durability = durability
+        self._active: Dict[str, JournalEntry] = {}  # 폴더 경로 -> 완료 대기 중인 저널
+
+    def begin(self, folder: Path, before: List[str], after: List[str],
+              plan: RenamePlan) -> JournalEntry:
+        """
+        새 작업 저널 시작 (계획 기록까지 완료한 뒤 반환)
+
+        Args:
+            folder: 작업 폴더
+            before: 변경 전 파일명 리스트
+            after: 변경 후 파일명 리스트
+            plan: 이름 변경 계획
+
+        Returns:
+            JournalEntry
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{uuid.uuid4().hex}{self.SUFFIX}"
+        entry = JournalEntry(path, folder, before, after, plan, self.durability)
+        entry.begin()
+        self._active[str(folder)] = entry
+        return entry
+
+    def finish(self, folder: Path) -> None:
+        """
+        작업 마무리 (Undo 기록까지 저장된 뒤 호출) - 저널 삭제
+
+        Args:
+            folder: 작업 폴더
+        """
+        entry = self._active.pop(str(folder), None)
+        if entry is not None:
+            entry.discard()
+
+    def abandon(self, folder: Path) -> None:
+        """
+        실패한 작업을 완료 대기 목록에서 빼고 소유 잠금 해제 (저널은 남겨 다음 실행이나 다른 인스턴스가 복구)
+
+        Args:
+            folder: 작업 폴더
+        """
+        entry = self._active.pop(str(folder), None)
+        if entry is not None:
+            entry.release()
+
+    def pending(self) -> List[JournalEntry]:
+        """
+        중단된(삭제되지 않은) 작업 목록
+
+        다른 인스턴스가 잠그고 있는 저널(진행 중이거나 복구 중)은 기다리지 않고 건너뜁니다.
+        반환된 저널은 소유 잠금을 잡은 상태이므로 discard() 또는 release() 로 마무리해야 합니다.
+
+        Returns:
+            JournalEntry 리스트 (오래된 순)
+        """
+        if not self.directory.is_dir():
+            return []
+
+        active = {entry.path for entry in self._active.values()}
+        entries = []
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            if path in active:
+                continue
+            owner = JournalEntry.claim(path)
+            if owner is None:
+                continue
+            try:
+                entry = JournalEntry.load(path)
+            except (OSError, ValueError, KeyError):
+                # 잠그는 사이 소유자가 끝내고 지웠거나 읽을 수 없는 파일
+                owner.release()
+                continue
+            if entry is None:
+                # 계획 기록 전에 중단 → 바뀐 이름 없음
+                JournalEntry.remove(path, owner)
+                continue
+            entry._owner = owner
+            entries.append(entry)
+        return sorted(entries, key=lambda e: e.timestamp)
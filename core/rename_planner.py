@@ -0,0 +1,163 @@
+"""
+Rename Planner Module
+이름 변경 순서 계획 로직 (단일 책임: 치환 그래프를 최소 이름 변경 단계로 분해)
+"""
+
+import os
+from typing import Callable, Container, Dict, List, Optional, Tuple
+
+
+# 이름 변경 한 단계: (현재 이름, 새 이름)
+RenameStep = Tuple[str, str]
+
+
+class RenamePlan:
+    """
+    이름 변경 계획 클래스
+    책임: 서로 독립적인 변경 체인(lane) 목록과 건너뛴 항목 수 보관
+
+    체인 안의 단계는 순서대로 실행해야 하지만, 체인끼리는 서로 다른 이름만 다루므로
+    어떤 순서로 실행해도 결과가 같습니다.
+    """
+
+    def __init__(self, chains: List[List[RenameStep]], unchanged: int = 0):
+        """
+        Args:
+            chains: 독립 체인 리스트 (각 체인은 실행 순서대로 정렬된 단계 리스트)
+            unchanged: 이름이 그대로라 건너뛴 항목 수
+        """
+        self.chains = chains
+        self.unchanged = unchanged
+
+    @property
+    def steps(self) -> List[RenameStep]:
+        """전체 단계 (체인 순서대로 이어 붙인 실행 순서)"""
+        return [step for chain in self.chains for step in chain]
+
+    def __len__(self) -> int:
+        return sum(len(chain) for chain in self.chains)
+
+    def __bool__(self) -> bool:
+        return bool(self.chains)
+
+
+class RenamePlanner:
+    """
+    이름 변경 계획 클래스
+    책임: 원본 → 대상 이름 대응을 치환 그래프로 보고 직접 변경 순서를 계산
+
+    - 이름이 그대로인 항목(고정점)은 건너뜀
+    - 대상이 비어 있는 이름에서 시작하는 체인은 끝에서부터 직접 변경
+    - 순환(a→b, b→a)만 임시 이름 하나로 끊음
+    일반적인 번호 다시 매기기에서는 2단계 처리보다 시스템 호출이 약 절반으로 줄어듭니다.
+    """
+
+    TEMP_PREFIX = "__renam_temp_"
+
+    @staticmethod
+    def plan(sources: List[str], targets: List[str],
+             key: Optional[Callable[[str], str]] = None,
+             occupied: Container[str] = frozenset()) -> RenamePlan:
+        """
+        이름 변경 계획 생성
+
+        Args:
+            sources: 현재 파일명 리스트
+            targets: 대상 파일명 리스트 (서로 겹치지 않아야 함)
+            key: 이름 비교용 키 함수 (대소문자 무시 볼륨은 CollisionIndex.key)
+            occupied: 임시 이름으로 쓰면 안 되는 이름 (키 기준, 폴더 목록 등)
+
+        Returns:
+            RenamePlan
+
+        Raises:
+            ValueError: 대상 이름 중복 또는 그대로 남는 파일과 이름이 겹침
+        """
+        if key is None:
+            key = RenamePlanner._identity
+
+        moves: List[RenameStep] = []
+        unchanged_keys = set()
+        for source, target in zip(sources, targets):
+            if source == target:
+                unchanged_keys.add(key(source))
+            else:
+                moves.append((source, target))
+
+        # 현재 이름 키 -> 항목, 대상 이름 키 -> 그 이름을 원하는 항목
+        by_source: Dict[str, int] = {}
+        by_target: Dict[str, int] = {}
+        for i, (source, target) in enumerate(moves):
+            by_source[key(source)] = i
+            target_key = key(target)
+            if target_key in by_target or target_key in unchanged_keys:
+                raise ValueError(f"대상 파일명이 중복됩니다: {target}")
+            by_target[target_key] = i
+
+        chains: List[List[RenameStep]] = []
+        visited = [False] * len(moves)
+
+        # 1) 체인: 대상 이름이 비어 있는 항목부터 거꾸로 따라감
+        for i, (source, target) in enumerate(moves):
+            target_key = key(target)
+            # 대소문자만 바뀌는 변경은 자기 자신을 가리키므로 바로 실행 가능
+            if target_key in by_source and target_key != key(source):
+                continue
+            chain = []
+            current = i
+            while True:
+                visited[current] = True
+                chain.append(moves[current])
+                previous = by_target.get(key(moves[current][0]))
+                if previous is None or visited[previous]:
+                    break
+                current = previous
+            chains.append(chain)
+
+        # 2) 남은 항목은 모두 순환 → 임시 이름 하나로 끊음
+        temp_counter = 0
+        for i, (source, target) in enumerate(moves):
+            if visited[i]:
+                continue
+            temp_name, temp_counter = RenamePlanner._temp_name(
+                os.path.splitext(source)[1], temp_counter, key, occupied, by_source
+            )
+            chain = [(source, temp_name)]
+            visited[i] = True
+            current = by_target[key(source)]
+            while current != i:
+                visited[current] = True
+                chain.append(moves[current])
+                current = by_target[key(moves[current][0])]
+            chain.append((temp_name, target))
+            chains.append(chain)
+
+        return RenamePlan(chains, len(unchanged_keys))
+
+    @staticmethod
+    def is_temp_name(name: str) -> bool:
+        """
+        계획이 만든 임시 이름인지 확인
+
+        Args:
+            name: 파일명
+
+        Returns:
+            임시 이름 여부
+        """
+        return name.startswith(RenamePlanner.TEMP_PREFIX)
+
+    @staticmethod
+    def _temp_name(ext: str, counter: int, key: Callable[[str], str],
+                   occupied: Container[str], reserved: Container[str]) -> Tuple[str, int]:
+        """사용 중이지 않은 임시 이름 생성 (다음 번호와 함께 반환)"""
+        while True:
+            name = f"{RenamePlanner.TEMP_PREFIX}{counter}__{ext}"
+            counter += 1
+            name_key = key(name)
+            if name_key not in occupied and name_key not in reserved:
+                return name, counter
+
+    @staticmethod
+    def _identity(name: str) -> str:
+        return name
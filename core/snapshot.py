@@ -0,0 +1,159 @@
+"""
+Snapshot Module
+폴더 상태 검증 결과 (단일 책임: 실행 전 변경 감지 / 실행 후 결과 확인 보고)
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List
+
+from models.file_item import FileItem
+
+
+class SnapshotReport:
+    """
+    폴더 스냅샷 검증 결과 클래스
+    책임: 스캔 이후 바뀐 항목 분류, 요약 메시지 생성, 전체 재스캔 없이 목록 보정
+
+    항목 분류 (인덱스는 검증에 사용한 파일 아이템 리스트 기준):
+        missing   파일이 사라짐
+        moved     같은 파일(지문 일치)이 다른 이름으로 바뀜 → 새 이름
+        modified  같은 파일(inode 일치)의 크기/수정 시각이 바뀜
+        replaced  같은 이름의 다른 파일(inode 불일치)로 바뀜
+        added     목록에 없던 이미지 파일이 생김 (파일명)
+    """
+
+    def __init__(self, folder: Path, names: List[str], writable: bool):
+        """
+        Args:
+            folder: 검증한 폴더
+            names: 폴더 내 전체 파일명 (검증에 사용한 목록 조회 결과, 충돌 검사에 재사용)
+            writable: 폴더 쓰기 가능 여부
+        """
+        self.folder = folder
+        self.names = names
+        self.writable = writable
+
+        self.missing: List[int] = []
+        self.moved: Dict[int, str] = {}
+        self.modified: List[int] = []
+        self.replaced: List[int] = []
+        self.added: List[str] = []
+
+        # 보정 시 다시 조회하지 않도록 검증 중 얻은 파일 정보 보관 (파일명 -> stat)
+        self.stats: Dict[str, os.stat_result] = {}
+
+    @property
+    def has_drift(self) -> bool:
+        """스캔 이후 바뀐 항목이 있는지"""
+        return bool(self.missing or self.moved or self.modified or self.replaced or self.added)
+
+    def summary(self, limit: int = 3) -> str:
+        """
+        사용자에게 보여줄 변경 내역 요약
+
+        Args:
+            limit: 분류별로 표시할 최대 파일명 수
+
+        Returns:
+            줄 단위 요약 문자열 (변경 없으면 빈 문자열)
+        """
+        def names(items: List[str]) -> str:
+            more = len(items) - limit
+            return ", ".join(items[:limit]) + (f" 외 {more}개" if more > 0 else "")
+
+        lines = []
+        if self.missing:
+            lines.append(f"삭제됨 {len(self.missing)}개")
+        if self.moved:
+            lines.append(f"이름 바뀜 {len(self.moved)}개: {names(list(self.moved.values()))}")
+        if self.modified:
+            lines.append(f"내용 바뀜 {len(self.modified)}개")
+        if self.replaced:
+            lines.append(f"다른 파일로 교체됨 {len(self.replaced)}개")
+        if self.added:
+            lines.append(f"새 파일 {len(self.added)}개: {names(self.added)}")
+        return "\n".join(lines)
+
+    def apply(self, items: List[FileItem]) -> List[FileItem]:
+        """
+        변경 내역을 파일 목록에 반영 (전체 재스캔 없이)
+
+        기존 순서를 유지하고, 사라진 항목은 빼고, 새 파일은 끝에 추가합니다.
+
+        Args:
+            items: 검증에 사용한 파일 아이템 리스트
+
+        Returns:
+            보정된 파일 아이템 리스트
+        """
+        missing = set(self.missing)
+        refreshed = set(self.modified) | set(self.replaced)
+
+        result = []
+        for position, item in enumerate(items):
+            if position in missing:
+                continue
+            if position in self.moved:
+                item.set_name(self.moved[position])
+            elif position in refreshed:
+                fresh = FileItem(item.original_path, self.stats.get(item.original_name))
+                fresh.new_name = item.new_name
+                fresh.order = item.order
+                item = fresh
+            result.append(item)
+
+        for name in self.added:
+            result.append(FileItem(self.folder / name, self.stats.get(name)))
+        return result
+
+
+class VerificationReport:
+    """
+    실행 후 검증 결과 클래스
+    책임: 작업이 끝난 폴더 목록과 기대한 최종 이름을 비교한 결과 보관
+
+    항목 분류:
+        missing    기대한 최종 이름이 폴더에 없음
+        leftover   사라져야 할 원래 이름이 아직 남아 있음
+        temp       순환 처리용 임시 이름이 남아 있음
+    """
+
+    def __init__(self, missing: List[str], leftover: List[str], temp: List[str]):
+        """
+        Args:
+            missing: 없는 최종 파일명 리스트
+            leftover: 남아 있는 원래 파일명 리스트
+            temp: 남아 있는 임시 파일명 리스트
+        """
+        self.missing = missing
+        self.leftover = leftover
+        self.temp = temp
+
+    @property
+    def ok(self) -> bool:
+        """기대한 대로 끝났는지"""
+        return not (self.missing or self.leftover or self.temp)
+
+    def summary(self, limit: int = 3) -> str:
+        """
+        사용자에게 보여줄 검증 결과 요약
+
+        Args:
+            limit: 분류별로 표시할 최대 파일명 수
+
+        Returns:
+            줄 단위 요약 문자열 (문제 없으면 빈 문자열)
+        """
+        def names(items: List[str]) -> str:
+            more = len(items) - limit
+            return ", ".join(items[:limit]) + (f" 외 {more}개" if more > 0 else "")
+
+        lines = []
+        if self.missing:
+            lines.append(f"없는 파일 {len(self.missing)}개: {names(self.missing)}")
+        if self.leftover:
+            lines.append(f"바뀌지 않고 남은 파일 {len(self.leftover)}개: {names(self.leftover)}")
+        if self.temp:
+            lines.append(f"임시 이름으로 남은 파일 {len(self.temp)}개: {names(self.temp)}")
+        return "\n".join(lines)
@@ -0,0 +1,247 @@
+"""
+Undo Codec Module
+Undo 기록 압축 인코딩 (단일 책임: 파일명 리스트 <-> 압축 표현 변환)
+"""
+
+import base64
+import os
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from models.file_item import Anchors
+from core.name_generator import NameGenerator
+
+
+class _NameOnlyItem:
+    """패턴 재현용 최소 아이템 (파일명만 사용하는 토큰만 렌더링 가능)"""
+
+    __slots__ = ('original_path', 'original_name', 'ext')
+
+    def __init__(self, path: Path):
+        self.original_path = path
+        self.original_name = path.name
+        self.ext = path.suffix.lower()
+
+
+class UndoCodec:
+    """
+    Undo 기록 압축 클래스
+    책임: 변경 전/후 파일명 리스트를 작게 저장하고, 되돌릴 때만 원래 리스트로 복원
+
+    압축 형식 ({"packed": {...}, "count": 파일 수}):
+        names    변경 전 파일명을 정렬해 앞 이름과 겹치는 접두사를 길이로 바꾼 뒤(front coding) zlib + base64
+        order    정렬된 이름 -> 실행 순서 순열 (앞 값과의 차이를 packed int 배열로, zlib + base64,
+                 정렬 순서 그대로면 생략)
+        pattern  패턴을 파일명만으로 다시 적용했을 때 변경 후 이름이 그대로 나오면 패턴과 오프셋만 저장
+        after    그렇지 않으면 변경 후 파일명 (실행 순서, front coding + zlib + base64)
+        inodes   파일별 inode (실행 순서, 앞 값과의 차이를 8바이트 packed 배열로, zlib + base64)
+
+    inode 를 저장할 때는 항목에 장치 번호 "dev" 를 함께 둡니다 (압축하지 않는 형식은 "inodes" 리스트).
+
+    파일 수가 COMPACT_MIN_NAMES 미만이면 기존처럼 리스트를 그대로 저장합니다.
+    """
+
+    COMPACT_MIN_NAMES = 16
+    SEPARATOR = '\0'  # 파일명에 쓸 수 없는 문자
+
+    @staticmethod
+    def encode(folder: Path, before: List[str], after: List[str],
+               pattern: Optional[str] = None, offset: int = 0,
+               anchors: Optional[Anchors] = None) -> Dict:
+        """
+        변경 전/후 파일명 리스트를 기록용 필드로 변환
+
+        Args:
+            folder: 작업 폴더 ({parent} 토큰 재현용)
+            before: 변경 전 파일명 리스트 (실행 순서)
+            after: 변경 후 파일명 리스트 (같은 순서)
+            pattern: 실행에 사용한 패턴 (재현 가능할 때만 저장)
+            offset: 전체 순번 시작 오프셋
+            anchors: (장치 번호, 파일별 inode 리스트) - 이름이 바뀌어도 파일을 찾기 위한 기준
+
+        Returns:
+            기록에 합칠 필드 ({"before", "after"} 또는 {"packed", "count"}, 기준이 있으면 "dev"/"inodes")
+        """
+        if len(before) < UndoCodec.COMPACT_MIN_NAMES:
+            fields = {"before": before, "after": after}
+            if anchors is not None:
+                fields["dev"], fields["inodes"] = anchors[0], list(anchors[1])
+            return fields
+
+        names = sorted(before)
+        position = {name: index for index, name in enumerate(names)}
+        order = [position[name] for name in before]
+
+        packed = {"names": UndoCodec._pack_names(names)}
+        if order != list(range(len(order))):
+            packed["order"] = UndoCodec._pack_order(order)
+        if pattern is not None and UndoCodec._render(folder, before, pattern, offset) == after:
+            packed["pattern"] = pattern
+            packed["offset"] = offset
+        else:
+            packed["after"] = UndoCodec._pack_names(after)
+
+        fields = {"packed": packed, "count": len(before)}
+        if anchors is not None:
+            fields["dev"] = anchors[0]
+            packed["inodes"] = UndoCodec._pack_deltas(anchors[1], 'Q')
+        return fields
+
+    @staticmethod
+    def decode(folder: Path, member: Dict) -> Tuple[List[str], List[str]]:
+        """
+        기록 항목의 변경 전/후 파일명 리스트 복원
+
+        Args:
+            folder: 작업 폴더
+            member: 기록 항목 ({"before", "after"} 또는 {"packed", "count"})
+
+        Returns:
+            (변경 전 파일명 리스트, 변경 후 파일명 리스트)
+
+        Raises:
+            ValueError: 압축 데이터가 손상된 경우
+        """
+        packed = member.get("packed")
+        if packed is None:
+            return member["before"], member["after"]
+
+        try:
+            names = UndoCodec._unpack_names(packed["names"])
+            if "order" in packed:
+                before = [names[index] for index in UndoCodec._unpack_order(packed["order"], len(names))]
+            else:
+                before = names
+            if "pattern" in packed:
+                after = UndoCodec._render(folder, before, packed["pattern"], packed.get("offset", 0))
+            else:
+                after = UndoCodec._unpack_names(packed["after"])
+        except (KeyError, IndexError, ValueError, zlib.error) as e:
+            raise ValueError(f"Undo 기록이 손상되었습니다: {str(e)}")
+
+        if after is None or len(after) != len(before):
+            raise ValueError("Undo 기록이 손상되었습니다: 파일 수가 맞지 않습니다")
+        return before, after
+
+    @staticmethod
+    def decode_anchors(member: Dict) -> Optional[Anchors]:
+        """
+        기록 항목의 (장치 번호, 파일별 inode 리스트) 복원
+
+        Args:
+            member: 기록 항목
+
+        Returns:
+            (장치 번호, inode 리스트) 또는 None (기준 없이 저장된 기록 / 손상된 기록)
+        """
+        if "dev" not in member:
+            return None
+        try:
+            if "packed" in member:
+                inodes = UndoCodec._unpack_deltas(member["packed"]["inodes"], 'Q', member["count"])
+            else:
+                inodes = member["inodes"]
+        except (KeyError, IndexError, ValueError, zlib.error):
+            return None  # 이름으로만 찾음
+        return (member["dev"], inodes)
+
+    @staticmethod
+    def is_packed(member: Dict) -> bool:
+        """
+        압축 형식 여부
+
+        Args:
+            member: 기록 항목
+
+        Returns:
+            압축 형식인지
+        """
+        return "packed" in member
+
+    # ==================== 내부 ====================
+
+    @staticmethod
+    def _render(folder: Path, before: List[str], pattern: str, offset: int) -> Optional[List[str]]:
+        """
+        파일명만으로 패턴 다시 적용 (날짜/이미지 크기 등 파일 정보가 필요한 패턴은 None)
+        """
+        renamer = NameGenerator.compile(pattern)
+        if renamer.needs - {'groups'}:
+            return None
+        items = [_NameOnlyItem(folder / name) for name in before]
+        try:
+            return renamer.render_all(items, offset)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _pack_names(names: List[str]) -> str:
+        """front coding: 각 이름을 (앞 이름과 겹치는 길이 + 1) 문자 하나 + 나머지로 표현"""
+        parts = []
+        previous = ""
+        for name in names:
+            common = len(os.path.commonprefix((previous, name)))
+            parts.append(chr(common + 1) + name[common:])
+            previous = name
+        data = UndoCodec.SEPARATOR.join(parts).encode('utf-8')
+        return base64.b64encode(zlib.compress(data, 9)).decode('ascii')
+
+    @staticmethod
+    def _unpack_names(text: str) -> List[str]:
+        data = zlib.decompress(base64.b64decode(text)).decode('utf-8')
+        if not data:
+            return []
+        names = []
+        previous = ""
+        for part in data.split(UndoCodec.SEPARATOR):
+            common = ord(part[0]) - 1
+            previous = previous[:common] + part[1:]
+            names.append(previous)
+        return names
+
+    @staticmethod
+    def _order_type(count: int) -> str:
+        """파일 수에 맞는 부호 있는 정수 배열 형식 (2바이트 또는 4바이트)"""
+        return 'h' if count <= 0x7FFF else 'i'
+
+    @staticmethod
+    def _pack_order(order: List[int]) -> str:
+        # 차이값으로 저장하면 거의 정렬된 순서(날짜순 등)는 같은 값이 반복되어 잘 압축됨
+        return UndoCodec._pack_deltas(order, UndoCodec._order_type(len(order)))
+
+    @staticmethod
+    def _unpack_order(text: str, count: int) -> List[int]:
+        return UndoCodec._unpack_deltas(text, UndoCodec._order_type(count), count)
+
+    @staticmethod
+    def _pack_deltas(values: List[int], typecode: str) -> str:
+        """정수 리스트를 앞 값과의 차이(부호 없는 형식은 2^bits 나머지)로 packed 배열 + zlib + base64"""
+        deltas = array(typecode)
+        modulus = 1 << (8 * deltas.itemsize) if typecode.isupper() else None
+        previous = -1
+        for value in values:
+            delta = value - previous
+            deltas.append(delta % modulus if modulus else delta)
+            previous = value
+        if sys.byteorder == 'big':
+            deltas.byteswap()  # 파일에는 항상 little-endian 으로 저장
+        return base64.b64encode(zlib.compress(deltas.tobytes(), 9)).decode('ascii')
+
+    @staticmethod
+    def _unpack_deltas(text: str, typecode: str, count: int) -> List[int]:
+        deltas = array(typecode)
+        deltas.frombytes(zlib.decompress(base64.b64decode(text)))
+        if sys.byteorder == 'big':
+            deltas.byteswap()
+        if len(deltas) != count:
+            raise IndexError("배열 길이가 파일 수와 다릅니다")
+        modulus = 1 << (8 * deltas.itemsize) if typecode.isupper() else None
+        values = []
+        value = -1
+        for delta in deltas:
+            value = (value + delta) % modulus if modulus else value + delta
+            values.append(value)
+        return values
@@ -3,30 +3,50 @@ Undo Manager Module
 실행 취소 관리 로직 (단일 책임: Undo 기록 관리)
 """
 
-import json
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+from models.file_item import Anchors
+from core.undo_codec import UndoCodec
+from core.undo_store import UndoStore
+
 
 class UndoManager:
     """
     파일명 변경 작업의 Undo 기능 관리 클래스
-    책임: Undo 로그 저장, 로드, 관리
+    책임: Undo 기록 저장/조회/제거, 폴더별 색인 관리
+
+    기록은 추가 전용 저장소(UndoStore)에 두고, 폴더 경로 -> 기록 ID 색인으로
+    폴더별 최근 기록을 전체 기록을 훑지 않고 찾습니다.
+    조회할 때마다 로그 파일의 (수정 시각, 크기)만 확인하고, 다른 프로세스가 파일을
+    바꾼 경우에만 다시 읽어 색인을 새로 만듭니다.
+    파일이 많은 작업은 파일명 리스트를 압축해 저장하며(UndoCodec), 되돌릴 때 get_names 로 복원합니다.
     """
 
-    def __init__(self, log_file: Path = Path("undo_log.json"), max_logs: int = 10):
+    def __init__(self, log_file: Path = Path("undo_log.json"), max_logs: Optional[int] = 10,
+                 max_age: Optional[timedelta] = None, max_bytes: Optional[int] = None):
         """
         UndoManager 초기화
 
         Args:
-            log_file: 로그 파일 경로
-            max_logs: 보관할 최대 로그 개수
+            log_file: 로그 파일 경로 (예전 JSON 배열 형식이면 처음 열 때 변환)
+            max_logs: 보관할 최대 로그 개수 (None 이면 제한 없음)
+            max_age: 보관 기간 (None 이면 제한 없음)
+            max_bytes: 보관할 기록의 총 크기 상한 (None 이면 제한 없음)
         """
         self.log_file = log_file
         self.max_logs = max_logs
+        self.store = UndoStore(log_file, max_logs, max_age, max_bytes)
 
-    def save_operation(self, folder: Path, before: List[str], after: List[str]) -> None:
+        self._by_folder: Dict[str, List[str]] = {}  # 폴더 경로 -> 기록 ID (오래된 순)
+        self._groups: Dict[str, List[str]] = {}     # 부모 폴더 경로 -> 그룹 기록 ID (오래된 순)
+        self._generation = -1                       # 색인을 만든 시점의 저장소 세대
+        self._sync()
+
+    def save_operation(self, folder: Path, before: List[str], after: List[str],
+                       pattern: Optional[str] = None, offset: int = 0,
+                       anchors: Optional[Anchors] = None) -> str:
         """
         파일명 변경 작업 저장
 
@@ -34,21 +54,324 @@ class UndoManager:
             folder: 작업 폴더
             before: 변경 전 파일명 리스트
             after: 변경 후 파일명 리스트
+            pattern: 실행에 사용한 패턴 (변경 후 이름을 재현할 수 있으면 이름 대신 저장)
+            offset: 전체 순번 시작 오프셋
+            anchors: (장치 번호, 파일별 inode 리스트) - 되돌릴 때 이름이 바뀐 파일도 찾기 위한 기준
+
+        Returns:
+            기록 ID
+        """
+        undo_data = {"folder": str(folder)}
+        undo_data.update(UndoCodec.encode(folder, before, after, pattern, offset, anchors))
+        undo_data["timestamp"] = datetime.now().isoformat()
+        return self._append(undo_data)
+
+    def save_group(self, parent: Path, members: List[Tuple[Path, List[str], List[str]]],
+                   patterns: Optional[List[Tuple[Optional[str], int]]] = None,
+                   anchors: Optional[List[Optional[Anchors]]] = None) -> Optional[str]:
+        """
+        여러 폴더를 한 번에 변경한 작업을 하나의 그룹 기록으로 저장
+
+        형식: {"folder": 부모 폴더, "group": [{"folder", "before", "after"}, ...], "timestamp"}
+        (항목의 파일명 리스트는 UndoCodec 압축 형식일 수 있음)
+
+        Args:
+            parent: 부모 폴더 (그룹 전체를 되돌릴 때의 기준)
+            members: (폴더, 변경 전 파일명 리스트, 변경 후 파일명 리스트) 리스트
+            patterns: 항목별 (패턴, 전체 순번 시작 오프셋) 리스트 (members 와 같은 순서)
+            anchors: 항목별 (장치 번호, 파일별 inode 리스트) 리스트 (members 와 같은 순서)
+
+        Returns:
+            기록 ID (저장할 항목이 없으면 None)
         """
+        if not members:
+            return None
+
+        group = []
+        for position, (folder, before, after) in enumerate(members):
+            pattern, offset = patterns[position] if patterns else (None, 0)
+            member = {"folder": str(folder)}
+            member.update(UndoCodec.encode(folder, before, after, pattern, offset,
+                                           anchors[position] if anchors else None))
+            group.append(member)
+
         undo_data = {
-            "folder": str(folder),
-            "before": before,
-            "after": after,
+            "folder": str(parent),
+            "group": group,
             "timestamp": datetime.now().isoformat()
         }
+        return self._append(undo_data)
+
+    @staticmethod
+    def is_group(operation: Dict) -> bool:
+        """
+        그룹 기록 여부
+
+        Args:
+            operation: 작업 기록
+
+        Returns:
+            여러 폴더를 묶은 기록인지
+        """
+        return "group" in operation
+
+    @staticmethod
+    def get_members(operation: Dict) -> List[Dict]:
+        """
+        작업 기록의 폴더별 항목 ({"folder", "before", "after"})
+
+        Args:
+            operation: 작업 기록 (단일 또는 그룹)
+
+        Returns:
+            폴더별 항목 리스트 (단일 기록은 자기 자신 하나, 그룹 항목에는 timestamp 포함)
+        """
+        if "group" not in operation:
+            return [operation]
+        return [dict(member, timestamp=operation["timestamp"]) for member in operation["group"]]
+
+    @staticmethod
+    def get_names(member: Dict) -> Tuple[List[str], List[str]]:
+        """
+        기록 항목의 변경 전/후 파일명 리스트 (압축 형식이면 이때 복원)
+
+        Args:
+            member: 폴더 항목 (단일 기록 또는 get_members 결과)
+
+        Returns:
+            (변경 전 파일명 리스트, 변경 후 파일명 리스트)
+
+        Raises:
+            ValueError: 압축 데이터가 손상된 경우
+        """
+        return UndoCodec.decode(Path(member["folder"]), member)
+
+    @staticmethod
+    def get_anchors(member: Dict) -> Optional[Anchors]:
+        """
+        기록 항목의 파일 식별 기준 (restore_files 의 anchors 인자)
+
+        Args:
+            member: 폴더 항목
+
+        Returns:
+            (장치 번호, 파일별 inode 리스트) 또는 None (이름으로만 찾음)
+        """
+        return UndoCodec.decode_anchors(member)
+
+    @staticmethod
+    def count_files(member: Dict) -> int:
+        """
+        기록 항목의 파일 수 (파일명 리스트를 복원하지 않음)
+
+        Args:
+            member: 폴더 항목
+
+        Returns:
+            파일 수
+        """
+        return member["count"] if UndoCodec.is_packed(member) else len(member["before"])
+
+    @staticmethod
+    def compose(saved: List[Tuple[List[str], List[str]]]) -> Tuple[List[str], List[str]]:
+        """
+        연속된 여러 작업을 되돌리는 하나의 순 변경으로 합성
+
+        최신 작업부터 (변경 전, 변경 후) 를 따라가며 현재 이름 -> 가장 오래된 작업 이전 이름을
+        계산합니다. 결국 같은 이름으로 돌아오는 파일은 결과에서 뺍니다.
+
+        Args:
+            saved: 작업별 (변경 전 파일명 리스트, 변경 후 파일명 리스트) (최신 순)
+
+        Returns:
+            (되돌릴 원래 파일명 리스트, 현재 파일명 리스트) - restore_files 인자와 같은 형식
+
+        Raises:
+            ValueError: 기록끼리 이어지지 않는 경우 (중간에 다른 프로그램이 바꾼 이름 등)
+        """
+        net, _ = UndoManager._trace(saved)
+        pairs = [(target, current) for current, target in net.items() if target != current]
+        return [target for target, _ in pairs], [current for _, current in pairs]
+
+    @staticmethod
+    def compose_anchors(saved: List[Tuple[List[str], List[str]]], anchors: List[Optional[Anchors]],
+                        after_names: List[str]) -> Optional[Anchors]:
+        """
+        합성한 순 변경의 파일 식별 기준 (compose 결과의 after_names 순서로 inode 재배열)
+
+        파일의 inode 는 이름이 바뀌어도 그대로이므로, 각 기록의 inode 를 그 파일의 현재 이름에 연결합니다.
+
+        Args:
+            saved: 작업별 (변경 전 파일명 리스트, 변경 후 파일명 리스트) (최신 순, compose 와 같은 인자)
+            anchors: 작업별 get_anchors 결과 (saved 와 같은 순서)
+            after_names: compose 가 반환한 현재 파일명 리스트
+
+        Returns:
+            (장치 번호, inode 리스트) 또는 None (기준이 없는 파일이 있거나 장치가 다름 → 이름으로만 찾음)
+
+        Raises:
+            ValueError: 기록끼리 이어지지 않는 경우
+        """
+        _, currents = UndoManager._trace(saved)
+        device = None
+        inodes: Dict[str, int] = {}
+        for anchor, names in zip(anchors, currents):
+            if anchor is None:
+                continue
+            if device is None:
+                device = anchor[0]
+            elif anchor[0] != device:
+                return None
+            for current, inode in zip(names, anchor[1]):
+                if current is not None:
+                    inodes.setdefault(current, inode)  # 최신 기록 우선
+
+        if device is None or any(name not in inodes for name in after_names):
+            return None
+        return (device, [inodes[name] for name in after_names])
+
+    @staticmethod
+    def _trace(saved: List[Tuple[List[str], List[str]]]) -> Tuple[Dict[str, str], List[List[Optional[str]]]]:
+        """
+        최신 작업부터 파일별 현재 이름 추적 (compose 본체)
+
+        Returns:
+            (현재 이름 -> 되돌릴 이름, 작업별로 각 파일의 현재 이름 리스트 - 이름이 그대로인 항목은 None)
+
+        Raises:
+            ValueError: 기록끼리 이어지지 않는 경우
+        """
+        net: Dict[str, str] = {}    # 현재 이름 -> 되돌릴 이름
+        owner: Dict[str, str] = {}  # 되돌릴 이름 -> 현재 이름 (역색인)
+        currents: List[List[Optional[str]]] = []
+        for before, after in saved:
+            # 한 작업 안의 변경은 동시에 일어난 것으로 보고 (순환 포함) 조회를 먼저 끝낸 뒤 반영
+            updates = []
+            names: List[Optional[str]] = []
+            for original, renamed in zip(before, after):
+                if original == renamed:
+                    names.append(None)
+                    continue
+                current = owner.get(renamed)
+                if current is None:
+                    # 이후 작업에서 바뀌지 않은 파일 - 현재도 같은 이름
+                    if renamed in net:
+                        raise ValueError(f"기록이 서로 이어지지 않습니다: {renamed}")
+                    current = renamed
+                updates.append((current, renamed, original))
+                names.append(current)
+
+            for _, renamed, _ in updates:
+                owner.pop(renamed, None)
+            for current, _, original in updates:
+                net[current] = original
+                owner[original] = current
+            currents.append(names)
+
+        return net, currents
+
+    def history(self, folder: Path) -> List[Tuple[str, Dict]]:
+        """
+        폴더에 대한 되돌릴 수 있는 기록 전체 (그룹 기록의 항목 포함)
+
+        Args:
+            folder: 작업 폴더
+
+        Returns:
+            (기록 ID, 폴더 항목) 리스트 (최신 순)
+        """
+        self._sync()
+        key = str(folder)
+        result = []
+        for operation_id in reversed(self._by_folder.get(key, [])):
+            operation = self.store.get(operation_id)
+            if operation is None:
+                continue
+            for member in self.get_members(operation):
+                if member["folder"] == key:
+                    result.append((operation_id, member))
+                    break
+        return result
+
+    def operations_since(self, folder: Path, timestamp: str) -> List[Tuple[str, Dict]]:
+        """
+        특정 시점 이후 폴더 기록 (그 시점의 기록 포함)
+
+        Args:
+            folder: 작업 폴더
+            timestamp: 기준 시각 (기록의 timestamp, ISO 형식)
+
+        Returns:
+            (기록 ID, 폴더 항목) 리스트 (최신 순)
+        """
+        return [(operation_id, member) for operation_id, member in self.history(folder)
+                if member["timestamp"] >= timestamp]
+
+    def last_operation(self, folder: Path) -> Optional[Tuple[str, Dict]]:
+        """
+        폴더에 대한 가장 최근 기록 찾기 (그룹 기록의 항목 포함)
 
-        logs = self._load_logs()
-        logs.append(undo_data)
+        Args:
+            folder: 작업 폴더
+
+        Returns:
+            (기록 ID, 폴더 항목) 또는 None
+        """
+        self._sync()
+        key = str(folder)
+        ids = self._by_folder.get(key)
+        while ids:
+            operation = self.store.get(ids[-1])
+            if operation is not None:
+                for member in self.get_members(operation):
+                    if member["folder"] == key:
+                        return (ids[-1], member)
+            # 삭제되었거나 이 폴더 항목이 빠진 기록은 색인에서 정리
+            ids.pop()
+        return None
+
+    def has_undo(self, folder: Path) -> bool:
+        """
+        폴더에 되돌릴 수 있는 기록이 있는지 확인
+
+        Args:
+            folder: 작업 폴더
+
+        Returns:
+            기록 존재 여부
+        """
+        return self.last_operation(folder) is not None
+
+    def find_last_group(self, parent: Path) -> Optional[Tuple[str, Dict]]:
+        """
+        부모 폴더 기준 가장 최근 그룹 기록 찾기
+
+        Args:
+            parent: 부모 폴더
+
+        Returns:
+            (기록 ID, 그룹 기록) 또는 None
+        """
+        self._sync()
+        ids = self._groups.get(str(parent))
+        while ids:
+            operation = self.store.get(ids[-1])
+            if operation is not None:
+                return (ids[-1], operation)
+            ids.pop()
+        return None
 
-        # 최대 개수 유지
-        logs = logs[-self.max_logs:]
+    def remove_operation(self, operation_id: str, folders: Optional[List[Path]] = None) -> None:
+        """
+        기록 제거 (삭제 표시만 덧붙임, 그룹 기록은 지정한 폴더 항목만 제거 가능)
+
+        그룹의 항목이 모두 제거되면 그룹 기록 자체를 삭제합니다.
 
-        self._save_logs(logs)
+        Args:
+            operation_id: 기록 ID (last_operation / find_last_group 결과)
+            folders: 제거할 폴더 항목 (None 이면 기록 전체)
+        """
+        self.store.remove(operation_id, [str(folder) for folder in folders] if folders is not None else None)
 
     def get_last_operation(self) -> Optional[Dict]:
         """
@@ -57,8 +380,8 @@ class UndoManager:
         Returns:
             마지막 작업 데이터 또는 None
         """
-        logs = self._load_logs()
-        return logs[-1] if logs else None
+        self.store.refresh()
+        return self.store.last()
 
     def remove_last_operation(self) -> bool:
         """
@@ -67,12 +390,12 @@ class UndoManager:
         Returns:
             제거 성공 여부
         """
-        logs = self._load_logs()
-        if not logs:
+        self.store.refresh()
+        last = self.store.last()
+        if last is None:
             return False
 
-        logs.pop()
-        self._save_logs(logs)
+        self.store.remove(last["id"])
         return True
 
     def get_all_operations(self) -> List[Dict]:
@@ -80,9 +403,10 @@ class UndoManager:
         모든 작업 기록 가져오기
 
         Returns:
-            작업 기록 리스트
+            작업 기록 리스트 (오래된 순)
         """
-        return self._load_logs()
+        self.store.refresh()
+        return self.store.records()
 
     def has_operations(self) -> bool:
         """
@@ -91,38 +415,41 @@ class UndoManager:
         Returns:
             작업 존재 여부
         """
-        return len(self._load_logs()) > 0
+        self.store.refresh()
+        return len(self.store) > 0
 
-    def _load_logs(self) -> List[Dict]:
-        """
-        로그 파일 로드
-
-        Returns:
-            로그 데이터 리스트
-        """
-        if not self.log_file.exists():
-            return []
+    def _append(self, undo_data: Dict) -> str:
+        """기록 추가 후 폴더 색인 갱신"""
+        operation_id = self.store.append(undo_data)
+        if self._generation != self.store.generation:
+            # 추가 직전에 다른 프로세스의 기록을 다시 읽었으면 색인 전체를 새로 만듦
+            self._sync()
+            return operation_id
+        operation = self.store.get(operation_id)
+        if operation is not None:
+            self._index(operation)
+        return operation_id
 
-        try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return []
+    def _sync(self) -> None:
+        """로그 파일이 바뀌었으면 다시 읽고 폴더 색인 재구성"""
+        self.store.refresh()
+        if self._generation == self.store.generation:
+            return
+        self._by_folder.clear()
+        self._groups.clear()
+        for operation in self.store.records():
+            self._index(operation)
+        self._generation = self.store.generation
 
-    def _save_logs(self, logs: List[Dict]) -> None:
-        """
-        로그 파일 저장
-
-        Args:
-            logs: 저장할 로그 데이터 리스트
-        """
-        try:
-            with open(self.log_file, 'w', encoding='utf-8') as f:
-                json.dump(logs, f, ensure_ascii=False, indent=2)
-        except IOError as e:
-            raise IOError(f"로그 저장 실패: {str(e)}")
+    def _index(self, operation: Dict) -> None:
+        """기록을 폴더별 색인에 추가"""
+        for member in self.get_members(operation):
+            self._by_folder.setdefault(member["folder"], []).append(operation["id"])
+        if self.is_group(operation):
+            self._groups.setdefault(operation["folder"], []).append(operation["id"])
 
     def clear_all(self) -> None:
         """모든 로그 삭제"""
-        if self.log_file.exists():
-            self.log_file.unlink()
+        self.store.clear()
+        self._by_folder.clear()
+        self._groups.clear()
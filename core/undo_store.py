@@ -0,0 +1,415 @@
+"""
+Undo Store Module
+Undo 기록 저장소 (단일 책임: 추가 전용 로그 파일 입출력, 삭제 표시, 압축, 보존 정책)
+"""
+
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from core.file_lock import FileLock
+
+
+class UndoStore:
+    """
+    추가 전용(JSON Lines) Undo 기록 저장소 클래스
+    책임: 기록 추가/삭제를 파일 끝에 한 줄씩 덧붙이고, 쌓인 삭제분은 백그라운드에서 압축
+
+    파일 형식 (한 줄에 레코드 하나):
+        {"type": "op", "id": ..., "folder": ..., "before": [...], "after": [...], "timestamp": ...}
+        {"type": "op", "id": ..., "folder": 부모 폴더, "group": [{"folder", "before", "after"}], ...}
+        {"type": "remove", "id": ...}                      # 기록 전체 삭제 (tombstone)
+        {"type": "remove", "id": ..., "folders": [...]}    # 그룹 기록의 일부 폴더 항목만 삭제
+
+    추가/삭제는 O(1) (파일 끝에 덧붙이기) 이며, 기존 내용을 다시 쓰는 것은 압축할 때뿐입니다.
+    예전 형식(JSON 배열 전체를 다시 쓰던 undo_log.json)은 처음 열 때 한 번 변환합니다.
+    읽은 기록은 메모리에 두고, 파일 (inode, 수정 시각, 크기)가 자신이 마지막으로 본 값과 다를 때만
+    (다른 프로세스가 기록한 경우) 다시 읽습니다.
+
+    여러 프로세스가 같은 파일을 쓰는 경우를 위해, 파일을 읽고 쓰는 구간은 옆의 잠금 파일
+    (<로그 파일>.lock, 압축으로 로그 파일 자체가 교체되므로 별도 파일)에 배타 잠금을 겁니다.
+    """
+
+    # 죽은 레코드가 이 크기 이상이고 살아 있는 레코드보다 많아지면 압축
+    COMPACT_MIN_BYTES = 1024 * 1024
+    # 다른 프로세스가 잠금을 잡고 있을 때 기다리는 최대 시간 (초)
+    LOCK_TIMEOUT = 10.0
+
+    def __init__(self, path: Path, max_logs: Optional[int] = 10,
+                 max_age: Optional[timedelta] = None, max_bytes: Optional[int] = None):
+        """
+        저장소 열기 (파일 전체를 한 번 읽어 메모리 색인 구성)
+
+        Args:
+            path: 로그 파일 경로
+            max_logs: 보관할 최대 기록 수 (None 이면 제한 없음)
+            max_age: 이보다 오래된 기록은 삭제 (None 이면 제한 없음)
+            max_bytes: 살아 있는 기록의 총 크기 상한 (None 이면 제한 없음, 최신 기록 1개는 항상 유지)
+        """
+        self.path = path
+        self.max_logs = max_logs
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+
+        self._lock = threading.RLock()
+        self._records: Dict[str, Dict] = {}   # id -> 기록 (추가 순서 유지)
+        self._sizes: Dict[str, int] = {}      # id -> 파일에서 차지하는 바이트 수
+        self._live_bytes = 0
+        self._dead_bytes = 0
+        self._compacting: Optional[threading.Thread] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None  # 마지막으로 본 파일 (inode, 수정 시각 ns, 크기)
+        self.generation = 0  # 파일을 다시 읽을 때마다 증가 (외부 색인 무효화용)
+        self._file_lock = FileLock(path.with_name(path.name + ".lock"), self.LOCK_TIMEOUT)
+
+        with self._file_lock:
+            self._load()
+            self._stamp = self._file_stamp()
+
+    def refresh(self) -> bool:
+        """
+        다른 프로세스가 파일을 바꿨으면 다시 읽기 (바뀌지 않았으면 stat 1회, 잠금 없음)
+
+        Returns:
+            다시 읽었는지
+
+        Raises:
+            FileLockTimeout: 다른 프로세스가 잠금을 오래 잡고 있음
+        """
+        if self._file_stamp() == self._stamp:
+            return False
+        with self._lock, self._file_lock:
+            return self._reload_if_changed()
+
+    # ==================== 조회 ====================
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._records
+
+    def get(self, record_id: str) -> Optional[Dict]:
+        """
+        기록 조회
+
+        Args:
+            record_id: 기록 ID
+
+        Returns:
+            기록 또는 None (삭제됨)
+        """
+        return self._records.get(record_id)
+
+    def records(self) -> List[Dict]:
+        """
+        살아 있는 기록 전체 (오래된 순)
+
+        Returns:
+            기록 리스트
+        """
+        with self._lock:
+            return list(self._records.values())
+
+    def last(self) -> Optional[Dict]:
+        """
+        가장 최근 기록
+
+        Returns:
+            기록 또는 None
+        """
+        with self._lock:
+            return next(reversed(self._records.values()), None)
+
+    # ==================== 기록 ====================
+
+    def append(self, record: Dict) -> str:
+        """
+        기록 추가 (파일 끝에 한 줄 덧붙임)
+
+        Args:
+            record: 기록 데이터 (id 가 없으면 새로 부여)
+
+        Returns:
+            기록 ID
+        """
+        record = dict(record, type="op")
+        record.setdefault("id", uuid.uuid4().hex)
+        with self._lock, self._file_lock:
+            self._reload_if_changed()
+            size = self._write(record)
+            self._records[record["id"]] = record
+            self._sizes[record["id"]] = size
+            self._live_bytes += size
+            self._enforce_retention()
+        self._maybe_compact()
+        return record["id"]
+
+    def remove(self, record_id: str, folders: Optional[List[str]] = None) -> None:
+        """
+        기록 삭제 표시 (tombstone 한 줄 덧붙임)
+
+        Args:
+            record_id: 기록 ID
+            folders: 그룹 기록에서 지울 폴더 항목 (None 이면 기록 전체, 항목이 모두 지워지면 기록 전체)
+        """
+        with self._lock, self._file_lock:
+            self._reload_if_changed()
+            if record_id not in self._records:
+                return
+            tombstone = {"type": "remove", "id": record_id}
+            if folders is not None:
+                tombstone["folders"] = folders
+            self._dead_bytes += self._write(tombstone)
+            self._apply_remove(tombstone)
+        self._maybe_compact()
+
+    def clear(self) -> None:
+        """모든 기록과 파일 삭제"""
+        self.wait_compaction()
+        with self._lock, self._file_lock:
+            self._records.clear()
+            self._sizes.clear()
+            self._live_bytes = 0
+            self._dead_bytes = 0
+            if self.path.exists():
+                self.path.unlink()
+            self._stamp = None
+
+    # ==================== 압축 ====================
+
+    def compact(self) -> None:
+        """
+        살아 있는 기록만 새 파일에 쓰고 교체 (쓰는 동안 추가된 줄은 이어 붙임)
+
+        새 파일 쓰기는 잠금 밖에서 하므로, 압축 중에도 추가/삭제가 막히지 않습니다.
+        그 사이 다른 프로세스가 먼저 압축해 파일을 교체했으면 이번 압축은 버립니다.
+        """
+        with self._lock, self._file_lock:
+            # 다른 프로세스의 기록까지 반영한 상태를 스냅샷으로 사용
+            self._reload_if_changed()
+            snapshot = list(self._records.values())
+            offset = self._file_size()
+            identity = self._file_stamp()
+            dead_at_snapshot = self._dead_bytes
+
+        # 임시 파일은 프로세스마다 따로 (잠금 밖에서 쓰므로 다른 인스턴스와 겹치지 않게)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.compact")
+        sizes = {}
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for record in snapshot:
+                line = self._encode(record)
+                f.write(line)
+                sizes[record["id"]] = len(line.encode('utf-8'))
+
+        with self._lock, self._file_lock:
+            current = self._file_stamp()
+            if current is None or identity is None or current[0] != identity[0]:
+                # 다른 프로세스가 이미 압축(교체)함
+                os.remove(temp_path)
+                self._compacting = None
+                return
+
+            # 압축하는 동안 덧붙은 줄을 그대로 옮긴 뒤 교체
+            with open(self.path, 'r', encoding='utf-8') as src, open(temp_path, 'a', encoding='utf-8') as dst:
+                src.seek(offset)
+                dst.write(src.read())
+            os.replace(temp_path, self.path)
+            # 덧붙은 줄에 다른 프로세스의 기록이 있으면 다음 조회에서 다시 읽음
+            self._stamp = self._file_stamp() if current == self._stamp else None
+
+            for record_id, size in sizes.items():
+                if record_id in self._sizes:
+                    self._sizes[record_id] = size
+            self._live_bytes = sum(self._sizes.values())
+            # 스냅샷 이전의 죽은 줄은 사라지고, 압축하는 동안 생긴 것만 남음
+            self._dead_bytes -= dead_at_snapshot
+            self._compacting = None
+
+    def wait_compaction(self) -> None:
+        """진행 중인 백그라운드 압축 종료 대기"""
+        thread = self._compacting
+        if thread is not None:
+            thread.join()
+
+    def _maybe_compact(self) -> None:
+        """죽은 레코드가 충분히 쌓였으면 백그라운드 압축 시작"""
+        with self._lock:
+            if self._compacting is not None:
+                return
+            if self._dead_bytes < self.COMPACT_MIN_BYTES or self._dead_bytes < self._live_bytes:
+                return
+            self._compacting = threading.Thread(target=self._compact_quietly,
+                                                name="renam-undo-compact", daemon=True)
+            self._compacting.start()
+
+    def _compact_quietly(self) -> None:
+        try:
+            self.compact()
+        except OSError:
+            # 압축 실패는 기록 자체에 영향 없음 (다음 기회에 다시 시도)
+            with self._lock:
+                self._compacting = None
+
+    # ==================== 내부 ====================
+
+    def _enforce_retention(self) -> None:
+        """보존 정책(개수/기간/크기)을 넘는 오래된 기록 삭제 (최신 기록 1개는 유지)"""
+        cutoff = (datetime.now() - self.max_age).isoformat() if self.max_age is not None else None
+        while len(self._records) > 1:
+            oldest_id, oldest = next(iter(self._records.items()))
+            expired = (
+                (self.max_logs is not None and len(self._records) > self.max_logs)
+                or (cutoff is not None and oldest.get("timestamp", "") < cutoff)
+                or (self.max_bytes is not None and self._live_bytes > self.max_bytes)
+            )
+            if not expired:
+                break
+            tombstone = {"type": "remove", "id": oldest_id}
+            self._dead_bytes += self._write(tombstone)
+            self._apply_remove(tombstone)
+
+    def _apply_remove(self, tombstone: Dict) -> None:
+        """삭제 표시를 메모리 색인에 반영"""
+        record_id = tombstone["id"]
+        record = self._records.get(record_id)
+        if record is None:
+            return
+
+        folders = tombstone.get("folders")
+        if folders is not None and "group" in record:
+            targets = set(folders)
+            remaining = [member for member in record["group"] if member["folder"] not in targets]
+            if remaining:
+                # 기록은 바꾸지 않고 새 객체로 교체 (압축 스냅샷과 공유되므로)
+                self._records[record_id] = dict(record, group=remaining)
+                return
+
+        del self._records[record_id]
+        size = self._sizes.pop(record_id, 0)
+        self._live_bytes -= size
+        self._dead_bytes += size
+
+    def _write(self, record: Dict) -> int:
+        """
+        레코드 한 줄 덧붙이기
+
+        Returns:
+            기록한 바이트 수
+
+        Raises:
+            IOError: 로그 저장 실패
+        """
+        data = self._encode(record).encode('utf-8')
+        try:
+            with open(self.path, 'a+b') as f:
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        # 중단된 기록이 남긴 잘린 줄과 이어 붙지 않도록 줄부터 끝냄
+                        f.write(b"\n")
+                        self._dead_bytes += 1
+                f.write(data)
+        except IOError as e:
+            raise IOError(f"로그 저장 실패: {str(e)}")
+        # 자신이 쓴 내용은 다시 읽을 필요 없음
+        self._stamp = self._file_stamp()
+        return len(data)
+
+    def _reload_if_changed(self) -> bool:
+        """파일이 마지막으로 본 상태와 다르면 메모리 기록을 버리고 다시 읽기 (잠금 안에서 호출)"""
+        if self._file_stamp() == self._stamp:
+            return False
+        self._records.clear()
+        self._sizes.clear()
+        self._live_bytes = 0
+        self._dead_bytes = 0
+        self._load()
+        self._stamp = self._file_stamp()
+        self.generation += 1
+        return True
+
+    @staticmethod
+    def _encode(record: Dict) -> str:
+        return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _file_size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _load(self) -> None:
+        """로그 파일 읽기 (예전 JSON 배열 형식이면 변환, 잘린 마지막 줄은 무시)"""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                head = f.read(1)
+                while head.isspace():
+                    head = f.read(1)
+                f.seek(0)
+                if head == '[':
+                    self._migrate(f)
+                    return
+                for line in f:
+                    self._load_line(line)
+        except (IOError, UnicodeDecodeError):
+            self._records.clear()
+
+    def _load_line(self, line: str) -> None:
+        size = len(line.encode('utf-8'))
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            self._dead_bytes += size  # 기록 도중 중단된 줄
+            return
+
+        if record.get("type") == "remove":
+            self._dead_bytes += size
+            self._apply_remove(record)
+        elif "id" in record:
+            self._records[record["id"]] = record
+            self._sizes[record["id"]] = size
+            self._live_bytes += size
+        else:
+            self._dead_bytes += size
+
+    def _migrate(self, f) -> None:
+        """예전 형식(JSON 배열) 로그를 추가 전용 형식으로 한 번 변환"""
+        try:
+            legacy = json.load(f)
+        except json.JSONDecodeError:
+            legacy = []
+        f.close()
+
+        temp_path = self.path.with_name(self.path.name + ".compact")
+        with open(temp_path, 'w', encoding='utf-8') as out:
+            for old in self._iter_legacy(legacy):
+                record = dict(old, type="op", id=uuid.uuid4().hex)
+                line = self._encode(record)
+                out.write(line)
+                self._records[record["id"]] = record
+                self._sizes[record["id"]] = len(line.encode('utf-8'))
+                self._live_bytes += self._sizes[record["id"]]
+        os.replace(temp_path, self.path)
+
+    @staticmethod
+    def _iter_legacy(legacy) -> Iterator[Dict]:
+        if not isinstance(legacy, list):
+            return
+        for old in legacy:
+            if isinstance(old, dict) and "folder" in old:
+                yield old
@@ -8,7 +8,9 @@ from gui.components.folder_list import FolderList
 from gui.components.sort_options import SortOptions
 from gui.components.pattern_input import PatternInput
 from gui.components.preview_table import PreviewTable
+from gui.components.preview_tree import PreviewTree
 from gui.components.action_buttons import ActionButtons
+from gui.components.undo_history_dialog import UndoHistoryDialog
 
 __all__ = [
     'FolderSelector',
@@ -16,5 +18,7 @@ __all__ = [
     'SortOptions',
     'PatternInput',
     'PreviewTable',
+    'PreviewTree',
     'ActionButtons',
+    'UndoHistoryDialog',
 ]
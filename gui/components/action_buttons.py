@@ -11,28 +11,40 @@ from gui.modern_style import ModernStyle
 class ActionButtons(ctk.CTkFrame):
     """
     액션 버튼 컴포넌트
-    책임: 실행, 되돌리기, 종료 버튼 표시 및 이벤트 처리
+    책임: 실행, 되돌리기, 기록, 종료 버튼 및 실행 진행 상황 표시, 이벤트 처리
     """
 
     def __init__(self, parent,
                  on_execute: Optional[Callable] = None,
+                 on_execute_every: Optional[Callable] = None,
                  on_undo: Optional[Callable] = None,
-                 on_quit: Optional[Callable] = None):
+                 on_history: Optional[Callable] = None,
+                 on_quit: Optional[Callable] = None,
+                 on_cancel: Optional[Callable] = None):
         """
         초기화
 
         Args:
             parent: 부모 위젯
             on_execute: 실행 버튼 클릭 시 호출될 콜백
+            on_execute_every: 모든 폴더 변경 버튼 클릭 시 호출될 콜백 (하위 폴더 모드)
             on_undo: 되돌리기 버튼 클릭 시 호출될 콜백
+            on_history: 기록 버튼 클릭 시 호출될 콜백 (여러 작업 한 번에 되돌리기)
             on_quit: 종료 버튼 클릭 시 호출될 콜백
+            on_cancel: 진행 중인 작업 취소 버튼 클릭 시 호출될 콜백
         """
         super().__init__(parent, fg_color="transparent")
         self.on_execute = on_execute
+        self.on_execute_every = on_execute_every
         self.on_undo = on_undo
+        self.on_history = on_history
         self.on_quit = on_quit
+        self.on_cancel = on_cancel
 
         self.undo_button = None  # 되돌리기 버튼 참조
+        self.history_button = None  # 기록 버튼 참조 (되돌리기 버튼과 같이 활성화)
+        self.execute_every_button = None  # 모든 폴더 변경 버튼 (하위 폴더 모드에서만 표시)
+        self.progress_frame = None  # 진행 상황 영역 (작업 중에만 표시)
 
         self._create_ui()
 
@@ -65,6 +77,23 @@ class ActionButtons(ctk.CTkFrame):
             corner_radius=ModernStyle.RADIUS['sm']
         ).pack(side="left", padx=(0, ModernStyle.SPACING['sm']))
 
+        # 모든 폴더 변경 버튼 (하위 폴더 모드에서만 표시)
+        self.execute_every_button = ctk.CTkButton(
+            container,
+            text="모든 폴더 변경",
+            font=ModernStyle.create_font('body', 'bold'),
+            width=120,
+            height=36,
+            command=lambda: self.on_execute_every() if self.on_execute_every else None,
+            cursor="hand2",
+            fg_color=ModernStyle.COLORS['button_secondary'],
+            text_color=ModernStyle.COLORS['text_primary'],
+            hover_color=ModernStyle.COLORS['button_secondary_hover'],
+            border_width=1,
+            border_color=ModernStyle.COLORS['border'],
+            corner_radius=ModernStyle.RADIUS['sm']
+        )
+
         # 되돌리기 버튼 (초기에는 비활성화)
         self.undo_button = ctk.CTkButton(
             container,
@@ -81,6 +110,25 @@ class ActionButtons(ctk.CTkFrame):
         )
         self.undo_button.pack(side="left", padx=ModernStyle.SPACING['sm'])
 
+        # 기록 버튼 (여러 작업을 한 번에 되돌리기, 초기에는 비활성화)
+        self.history_button = ctk.CTkButton(
+            container,
+            text="기록",
+            font=ModernStyle.create_font('body', 'bold'),
+            width=72,
+            height=36,
+            command=self._history_click_handler,
+            fg_color=ModernStyle.COLORS['button_secondary'],
+            text_color=ModernStyle.COLORS['text_disabled'],
+            hover_color=ModernStyle.COLORS['button_secondary'],
+            border_width=1,
+            border_color=ModernStyle.COLORS['border'],
+            corner_radius=ModernStyle.RADIUS['sm'],
+            state="disabled"
+        )
+        self.history_button.pack(side="left", padx=ModernStyle.SPACING['sm'])
+        self.execute_every_button.pack(side="left", padx=ModernStyle.SPACING['sm'])
+
         self.undo_enabled = False  # 상태 추적 변수
 
         # 우측: 종료 버튼
@@ -98,13 +146,97 @@ class ActionButtons(ctk.CTkFrame):
             corner_radius=ModernStyle.RADIUS['sm']
         ).pack(side="right")
 
+        # 하단: 진행 상황 (작업 중에만 표시)
+        self.progress_frame = ctk.CTkFrame(card, fg_color="transparent")
+
+        self.progress_bar = ctk.CTkProgressBar(
+            self.progress_frame,
+            height=8,
+            corner_radius=ModernStyle.RADIUS['sm'],
+            fg_color=ModernStyle.COLORS['background_secondary'],
+            progress_color=ModernStyle.COLORS['accent_blue']
+        )
+        self.progress_bar.pack(side="left", fill="x", expand=True)
+        self.progress_bar.set(0)
+
+        self.progress_label = ctk.CTkLabel(
+            self.progress_frame,
+            text="",
+            font=ModernStyle.create_font('caption'),
+            text_color=ModernStyle.COLORS['text_secondary'],
+            width=140
+        )
+        self.progress_label.pack(side="left", padx=ModernStyle.SPACING['sm'])
+
+        self.cancel_button = ctk.CTkButton(
+            self.progress_frame,
+            text="취소",
+            font=ModernStyle.create_font('caption', 'bold'),
+            width=64,
+            height=28,
+            command=lambda: self.on_cancel() if self.on_cancel else None,
+            cursor="hand2",
+            fg_color=ModernStyle.COLORS['button_secondary'],
+            text_color=ModernStyle.COLORS['text_primary'],
+            hover_color=ModernStyle.COLORS['button_secondary_hover'],
+            border_width=1,
+            border_color=ModernStyle.COLORS['border'],
+            corner_radius=ModernStyle.RADIUS['sm']
+        )
+        self.cancel_button.pack(side="right")
+
+    def show_execute_every(self, visible: bool):
+        """
+        모든 폴더 변경 버튼 표시 여부 설정
+
+        Args:
+            visible: 하위 폴더 모드이면 True
+        """
+        if visible:
+            self.execute_every_button.pack(side="left", padx=ModernStyle.SPACING['sm'])
+        else:
+            self.execute_every_button.pack_forget()
+
+    def show_progress(self):
+        """진행 상황 영역 표시 (작업 시작)"""
+        self.progress_bar.set(0)
+        self.progress_label.configure(text="준비 중...")
+        self.cancel_button.configure(state="normal", text="취소")
+        self.progress_frame.pack(fill="x", padx=ModernStyle.SPACING['lg'],
+                                 pady=(0, ModernStyle.SPACING['md']))
+
+    def set_progress(self, done: int, total: int):
+        """
+        진행 상황 갱신
+
+        Args:
+            done: 완료된 단계 수
+            total: 전체 단계 수
+        """
+        self.progress_bar.set(done / total if total else 1)
+        self.progress_label.configure(text=f"{done:,} / {total:,}")
+
+    def set_cancelling(self):
+        """취소 요청 후 (되돌리는 중) 표시"""
+        self.cancel_button.configure(state="disabled", text="취소 중")
+        self.progress_label.configure(text="되돌리는 중...")
+
+    def hide_progress(self):
+        """진행 상황 영역 숨김 (작업 종료)"""
+        self.progress_frame.pack_forget()
+
     def _undo_click_handler(self):
         """되돌리기 버튼 클릭 핸들러"""
         if self.undo_enabled and self.on_undo:
             self.on_undo()
 
+    def _history_click_handler(self):
+        """기록 버튼 클릭 핸들러"""
+        if self.undo_enabled and self.on_history:
+            self.on_history()
+
     def enable_undo(self):
-        """되돌리기 버튼 활성화"""
+        """되돌리기/기록 버튼 활성화"""
         if self.undo_button:
             self.undo_enabled = True
             self.undo_button.configure(
@@ -113,9 +245,14 @@ class ActionButtons(ctk.CTkFrame):
                 text_color=ModernStyle.COLORS['text_button'],
                 hover_color=ModernStyle.COLORS['button_warning_hover']
             )
+            self.history_button.configure(
+                state="normal",
+                text_color=ModernStyle.COLORS['text_primary'],
+                hover_color=ModernStyle.COLORS['button_secondary_hover']
+            )
 
     def disable_undo(self):
-        """되돌리기 버튼 비활성화"""
+        """되돌리기/기록 버튼 비활성화"""
         if self.undo_button:
             self.undo_enabled = False
             self.undo_button.configure(
@@ -124,3 +261,8 @@ class ActionButtons(ctk.CTkFrame):
                 text_color=ModernStyle.COLORS['text_disabled'],
                 hover_color=ModernStyle.COLORS['button_secondary']
             )
+            self.history_button.configure(
+                state="disabled",
+                text_color=ModernStyle.COLORS['text_disabled'],
+                hover_color=ModernStyle.COLORS['button_secondary']
+            )
@@ -3,10 +3,13 @@ Pattern Input Component
 파일명 패턴 입력 UI 컴포넌트 (단일 책임: 패턴 입력 UI)
 """
 
+import re
 import customtkinter as ctk
-from tkinter import StringVar
+from tkinter import StringVar, BooleanVar
 from typing import Optional, Callable
 from gui.modern_style import ModernStyle
+from core.name_generator import NameGenerator
+from core.name_substitution import NameSubstitution
 
 
 class PatternInput(ctk.CTkFrame):
@@ -15,16 +18,29 @@ class PatternInput(ctk.CTkFrame):
     책임: 파일명 패턴 입력 UI 표시 (Combobox + Entry)
     """
 
+    # "파일명_숫자" 모드로 표현 가능한 패턴 (prefix_{n})
+    PREFIX_PATTERN = re.compile(r'^([^{}]*)_\{n\}$')
+
     def __init__(self, parent, on_pattern_changed: Optional[Callable] = None):
         super().__init__(parent, fg_color="transparent")
         
         self.on_pattern_changed = on_pattern_changed
         self.mode_var = StringVar(value="숫자")
         self.prefix_var = StringVar(value="")
+        self.template_var = StringVar(value="{n}")
+        self.continuous_var = BooleanVar(value=False)
+        self.find_var = StringVar(value="")
+        self.replace_var = StringVar(value="")
+        self.ignore_case_var = BooleanVar(value=False)
         
         # 변경 감지를 위한 trace 추가
         self.mode_var.trace_add("write", lambda *args: self._notify_change())
         self.prefix_var.trace_add("write", lambda *args: self._notify_change())
+        self.template_var.trace_add("write", lambda *args: self._notify_change())
+        self.continuous_var.trace_add("write", lambda *args: self._notify_change())
+        self.find_var.trace_add("write", lambda *args: self._notify_change())
+        self.replace_var.trace_add("write", lambda *args: self._notify_change())
+        self.ignore_case_var.trace_add("write", lambda *args: self._notify_change())
         
         self._create_ui()
 
@@ -89,6 +105,36 @@ class PatternInput(ctk.CTkFrame):
             border_color=ModernStyle.COLORS['border'],
             hover_color=ModernStyle.COLORS['surface_hover'],
             command=self._on_mode_change
+        ).pack(side="left", padx=(0, ModernStyle.SPACING['xl']))
+
+        ctk.CTkRadioButton(
+            row1,
+            text="직접 입력",
+            variable=self.mode_var,
+            value="직접 입력",
+            font=ModernStyle.create_font('caption'),
+            text_color=ModernStyle.COLORS['text_primary'],
+            fg_color=ModernStyle.COLORS['accent_blue'],
+            border_color=ModernStyle.COLORS['border'],
+            hover_color=ModernStyle.COLORS['surface_hover'],
+            command=self._on_mode_change
+        ).pack(side="left")
+
+        # 두 번째 행 (찾아 바꾸기)
+        row2 = ctk.CTkFrame(pattern_options_frame, fg_color="transparent")
+        row2.pack(fill="x", pady=(0, ModernStyle.SPACING['xs']))
+
+        ctk.CTkRadioButton(
+            row2,
+            text="찾아 바꾸기",
+            variable=self.mode_var,
+            value="찾아 바꾸기",
+            font=ModernStyle.create_font('caption'),
+            text_color=ModernStyle.COLORS['text_primary'],
+            fg_color=ModernStyle.COLORS['accent_blue'],
+            border_color=ModernStyle.COLORS['border'],
+            hover_color=ModernStyle.COLORS['surface_hover'],
+            command=self._on_mode_change
         ).pack(side="left")
 
         # 2. 파일명 입력 (Entry)
@@ -114,12 +160,137 @@ class PatternInput(ctk.CTkFrame):
         )
         self.prefix_entry.pack(side="left")
 
+        # 3. 템플릿 입력 (직접 입력 모드에서만 표시)
+        self.template_frame = ctk.CTkFrame(input_frame, fg_color="transparent")
+
+        template_row = ctk.CTkFrame(self.template_frame, fg_color="transparent")
+        template_row.pack(fill="x")
+
+        ctk.CTkLabel(
+            template_row,
+            text="템플릿:",
+            font=ModernStyle.create_font('caption'),
+            text_color=ModernStyle.COLORS['text_secondary']
+        ).pack(side="left", padx=(0, ModernStyle.SPACING['sm']))
+
+        ctk.CTkEntry(
+            template_row,
+            textvariable=self.template_var,
+            font=ModernStyle.create_font('body'),
+            width=180,
+            corner_radius=ModernStyle.RADIUS['sm'],
+            border_color=ModernStyle.COLORS['border'],
+            fg_color=ModernStyle.COLORS['surface'],
+            text_color=ModernStyle.COLORS['text_primary']
+        ).pack(side="left")
+
+        ctk.CTkLabel(
+            self.template_frame,
+            text=NameGenerator.get_pattern_examples(),
+            font=ModernStyle.create_font('micro'),
+            text_color=ModernStyle.COLORS['text_tertiary'],
+            justify="left",
+            anchor="w",
+            wraplength=260
+        ).pack(fill="x", pady=(ModernStyle.SPACING['xs'], 0))
+
+        # 4. 찾아 바꾸기 입력 (찾아 바꾸기 모드에서만 표시)
+        self.replace_frame = ctk.CTkFrame(input_frame, fg_color="transparent")
+
+        for label_text, variable in (("찾기:", self.find_var), ("바꾸기:", self.replace_var)):
+            field_row = ctk.CTkFrame(self.replace_frame, fg_color="transparent")
+            field_row.pack(fill="x", pady=(0, ModernStyle.SPACING['xs']))
+
+            ctk.CTkLabel(
+                field_row,
+                text=label_text,
+                font=ModernStyle.create_font('caption'),
+                text_color=ModernStyle.COLORS['text_secondary'],
+                width=48,
+                anchor="w"
+            ).pack(side="left", padx=(0, ModernStyle.SPACING['sm']))
+
+            ctk.CTkEntry(
+                field_row,
+                textvariable=variable,
+                font=ModernStyle.create_font('body'),
+                width=180,
+                corner_radius=ModernStyle.RADIUS['sm'],
+                border_color=ModernStyle.COLORS['border'],
+                fg_color=ModernStyle.COLORS['surface'],
+                text_color=ModernStyle.COLORS['text_primary']
+            ).pack(side="left")
+
+        ctk.CTkCheckBox(
+            self.replace_frame,
+            text="대소문자 무시",
+            variable=self.ignore_case_var,
+            font=ModernStyle.create_font('caption'),
+            text_color=ModernStyle.COLORS['text_primary'],
+            fg_color=ModernStyle.COLORS['accent_blue'],
+            border_color=ModernStyle.COLORS['border'],
+            hover_color=ModernStyle.COLORS['accent_blue_dark'],
+            checkbox_width=18,
+            checkbox_height=18
+        ).pack(anchor="w")
+
+        ctk.CTkLabel(
+            self.replace_frame,
+            text="정규식 사용 | \\1, \\g<이름> 그룹 | \\g<1:03> 제로 패딩 | \\U \\L \\E \\u \\l 대소문자 변환",
+            font=ModernStyle.create_font('micro'),
+            text_color=ModernStyle.COLORS['text_tertiary'],
+            justify="left",
+            anchor="w",
+            wraplength=260
+        ).pack(fill="x", pady=(ModernStyle.SPACING['xs'], 0))
+
+        # 5. 폴더 간 연속 번호
+        self.options_frame = ctk.CTkFrame(input_frame, fg_color="transparent")
+        self.options_frame.pack(fill="x", pady=(ModernStyle.SPACING['sm'], 0))
+
+        ctk.CTkCheckBox(
+            self.options_frame,
+            text="폴더 간 연속 번호",
+            variable=self.continuous_var,
+            font=ModernStyle.create_font('caption'),
+            text_color=ModernStyle.COLORS['text_primary'],
+            fg_color=ModernStyle.COLORS['accent_blue'],
+            border_color=ModernStyle.COLORS['border'],
+            hover_color=ModernStyle.COLORS['accent_blue_dark'],
+            checkbox_width=18,
+            checkbox_height=18
+        ).pack(side="left")
+
+        # 6. 패턴 유효성 / 중복 상태 (미리보기 갱신 시 set_status 로 반영)
+        self.status_label = ctk.CTkLabel(
+            input_frame,
+            text="",
+            font=ModernStyle.create_font('micro'),
+            text_color=ModernStyle.COLORS['text_tertiary'],
+            justify="left",
+            anchor="w",
+            wraplength=260
+        )
+        self.status_label.pack(fill="x", pady=(ModernStyle.SPACING['xs'], 0))
+
         # 초기 상태 설정
         self._on_mode_change()
 
     def _on_mode_change(self, choice=None):
         """모드 변경 시 이벤트"""
         mode = self.mode_var.get()
+        frames = {
+            "직접 입력": self.template_frame,
+            "찾아 바꾸기": self.replace_frame,
+        }
+        visible = frames.get(mode, self.entry_frame)
+
+        # 현재 모드의 입력 영역만 표시
+        for frame in (self.entry_frame, self.template_frame, self.replace_frame):
+            if frame is not visible:
+                frame.pack_forget()
+        visible.pack(fill="x", pady=(ModernStyle.SPACING['sm'], 0),
+                     before=self.options_frame)
         if mode == "숫자":
             self.prefix_entry.configure(state="disabled")
         else:
@@ -140,8 +311,31 @@ class PatternInput(ctk.CTkFrame):
         elif mode == "파일명_숫자":
             prefix = self.prefix_var.get()
             return f"{prefix}_{{n}}"
+        elif mode == "직접 입력":
+            return self.template_var.get()
+        elif mode == "찾아 바꾸기":
+            # sed 스타일 치환식으로 변환 (구분자 '/' 와 그 앞/끝의 역슬래시는 이스케이프)
+            find = NameSubstitution.escape(self.find_var.get())
+            replace = NameSubstitution.escape(self.replace_var.get())
+            flags = "gi" if self.ignore_case_var.get() else "g"
+            return f"s/{find}/{replace}/{flags}"
         return "{n}"
 
+    def set_status(self, message: str, ok: bool = True):
+        """
+        패턴 상태 메시지 표시
+
+        Args:
+            message: 표시할 메시지 (빈 문자열이면 숨김)
+            ok: 정상 상태 여부 (False 면 경고 색상)
+        """
+        color = ModernStyle.COLORS['text_tertiary'] if ok else ModernStyle.COLORS['accent_red_dark']
+        self.status_label.configure(text=message, text_color=color)
+
+    def is_continuous(self) -> bool:
+        """폴더 간 연속 번호 사용 여부 반환"""
+        return self.continuous_var.get()
+
     def set_pattern(self, pattern: str):
         """
         패턴 설정
@@ -149,15 +343,25 @@ class PatternInput(ctk.CTkFrame):
         Args:
             pattern: 설정할 패턴 문자열 (예: "{n}", "image_{n}")
         """
-        if pattern == "{n}":
+        prefix_match = self.PREFIX_PATTERN.match(pattern)
+        if NameSubstitution.is_expression(pattern):
+            try:
+                find, replace, flags = NameSubstitution.split(pattern)
+            except ValueError:
+                find, replace, flags = "", "", "g"
+            self.mode_var.set("찾아 바꾸기")
+            self.find_var.set(NameSubstitution.unescape(find))
+            self.replace_var.set(NameSubstitution.unescape(replace))
+            self.ignore_case_var.set("i" in flags)
+        elif pattern == "{n}":
             self.mode_var.set("숫자")
             self.prefix_var.set("")
-        elif "_" in pattern and "{n}" in pattern:
+        elif prefix_match:
             # "prefix_{n}" 형식
-            prefix = pattern.split("_{n}")[0]
             self.mode_var.set("파일명_숫자")
-            self.prefix_var.set(prefix)
+            self.prefix_var.set(prefix_match.group(1))
         else:
-            # 기본값
-            self.mode_var.set("숫자")
-            self.prefix_var.set("")
+            # 그 외 토큰 조합은 템플릿으로 표시
+            self.mode_var.set("직접 입력")
+            self.template_var.set(pattern)
+        self._on_mode_change()
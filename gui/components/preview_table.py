@@ -4,18 +4,32 @@ Preview Table Component
 """
 
 import customtkinter as ctk
-from tkinter import Listbox, Scrollbar
-from typing import List, Optional, Callable
+from tkinter import Listbox
+from typing import Dict, List, Optional, Callable, Sequence
 from gui.modern_style import ModernStyle
 from models.file_item import FileItem
+from gui.preview_viewport import PreviewViewport
 
 
 class PreviewTable(ctk.CTkFrame):
     """
     미리보기 테이블 컴포넌트
     책임: 파일 목록 표시 및 순서 변경 UI
+
+    화면 높이만큼의 행 위젯(슬롯)만 만들어 두고, 스크롤하면 슬롯에 보여줄 데이터만 바꿉니다.
+    스크롤바는 전체 파일 수 기준으로 움직이므로, 파일 수와 상관없이 위젯 수는 일정합니다.
     """
 
+    ROW_HEIGHT = 32     # 행 하나의 높이 (px, 슬롯 수 계산 기준)
+    WHEEL_ROWS = 3      # 마우스 휠 한 칸에 스크롤할 행 수
+
+    # 행 배경 종류 -> 표 스타일 색 키
+    ROW_BACKGROUNDS = {
+        PreviewViewport.BACKGROUND_EVEN: 'row_bg',
+        PreviewViewport.BACKGROUND_ODD: 'row_bg_alt',
+        PreviewViewport.BACKGROUND_SELECTED: 'row_selected',
+    }
+
     def __init__(self, parent, on_move_up: Optional[Callable] = None,
                  on_move_down: Optional[Callable] = None,
                  on_remove: Optional[Callable] = None,
@@ -43,7 +57,20 @@ class PreviewTable(ctk.CTkFrame):
         # 다중 선택을 위한 변수
         self.selected_indices = set()  # 선택된 인덱스들
         self.last_selected_index = None  # 마지막 선택된 인덱스 (Shift 선택용)
-        self.row_widgets = [] # 위젯 리스트 초기화
+        self.row_widgets: List[Dict] = []  # 화면에 보이는 행 슬롯 (슬롯 k = 파일 top + k)
+
+        # 표시 중인 데이터 (슬롯에 필요한 행만 꺼내 씀)
+        self._items: List[FileItem] = []
+        self._new_names: Optional[Sequence[str]] = None
+        self._top = 0  # 첫 번째 슬롯에 보이는 파일 인덱스
+        self._scrollbar_shown = None  # 마지막으로 설정한 스크롤바 위치
+
+        # 행마다 다시 만들지 않도록 스타일/글꼴은 한 번만 준비 (변경 여부 -> 글꼴)
+        self._table_style = ModernStyle.get_table_style()
+        self._row_fonts = {
+            False: self._make_font('body', 'normal'),
+            True: self._make_font('body', 'bold'),
+        }
 
         self._create_ui()
 
@@ -78,65 +105,7 @@ class PreviewTable(ctk.CTkFrame):
         table_frame = ctk.CTkFrame(inner_container, fg_color="transparent")
         table_frame.pack(fill="both", expand=True)
 
-        # 테이블 헤더 (Grid 사용)
-        header_grid = ctk.CTkFrame(
-            table_frame,
-            fg_color=ModernStyle.COLORS['background_secondary'],
-            corner_radius=0,
-            height=40
-        )
-        header_grid.pack(fill="x", padx=1, pady=(1, 0))
-        
-        # Grid 설정 (비율 조정)
-        header_grid.grid_columnconfigure(0, weight=8)  # 원본 파일명
-        header_grid.grid_columnconfigure(1, weight=1)  # 화살표
-        header_grid.grid_columnconfigure(2, weight=1)  # 변경 파일명
-
-        ctk.CTkLabel(
-            header_grid,
-            text="원본 파일명",
-            font=ModernStyle.create_font('caption', 'bold'),
-            text_color=ModernStyle.COLORS['text_default'],
-            anchor="w"  # 왼쪽 정렬
-        ).grid(row=0, column=0, sticky="ew", padx=ModernStyle.SPACING['lg'], pady=ModernStyle.SPACING['sm'])
-
-        ctk.CTkLabel(
-            header_grid,
-            text="→",  # 화살표 추가
-            font=ModernStyle.create_font('caption', 'bold'),
-            text_color=ModernStyle.COLORS['text_tertiary'],
-            width=40
-        ).grid(row=0, column=1)
-
-        ctk.CTkLabel(
-            header_grid,
-            text="변경 파일명",
-            font=ModernStyle.create_font('caption', 'bold'),
-            text_color=ModernStyle.COLORS['text_default'],
-            anchor="w"  # 왼쪽 정렬
-        ).grid(row=0, column=2, sticky="ew", padx=ModernStyle.SPACING['lg'], pady=ModernStyle.SPACING['sm'])
-
-        # 파일 목록 (ScrollableFrame + Grid)
-        self.list_frame = ctk.CTkScrollableFrame(
-            table_frame,
-            fg_color="transparent",
-            corner_radius=0
-        )
-        self.list_frame.pack(fill="both", expand=True, padx=1, pady=(0, 1))
-        
-        # Grid 설정 (헤더와 동일하게)
-        self.list_frame.grid_columnconfigure(0, weight=8)
-        self.list_frame.grid_columnconfigure(1, weight=1)
-        self.list_frame.grid_columnconfigure(2, weight=4)
-
-        # 빈 상태 메시지
-        self.empty_label = ctk.CTkLabel(
-            self.list_frame,
-            text="표시할 파일이 없습니다.",
-            font=ModernStyle.create_font('body'),
-            text_color=ModernStyle.COLORS['text_tertiary']
-        )
-        self.empty_label.pack(pady=ModernStyle.SPACING['xl'])
+        self._create_table(table_frame)
 
         # 하단: 버튼들 (가로 배치)
         button_frame = ctk.CTkFrame(table_frame, fg_color="transparent")
@@ -206,6 +175,89 @@ class PreviewTable(ctk.CTkFrame):
             corner_radius=ModernStyle.RADIUS['sm']
         ).pack(side="left", padx=ModernStyle.SPACING['xs'])
 
+    @staticmethod
+    def _make_font(size_key: str, weight: str) -> ctk.CTkFont:
+        """ModernStyle 글꼴 튜플로 공유 CTkFont 생성 (여러 행이 같은 객체를 씀)"""
+        family, size, weight = ModernStyle.create_font(size_key, weight)
+        return ctk.CTkFont(family=family, size=size, weight=weight)
+
+    def _create_table(self, table_frame):
+        """
+        헤더와 행 목록 생성 (하위 클래스가 다른 렌더러로 교체하는 지점)
+
+        Args:
+            table_frame: 테이블 프레임
+        """
+        # 테이블 헤더 (Grid 사용)
+        header_grid = ctk.CTkFrame(
+            table_frame,
+            fg_color=ModernStyle.COLORS['background_secondary'],
+            corner_radius=0,
+            height=40
+        )
+        header_grid.pack(fill="x", padx=1, pady=(1, 0))
+        
+        # Grid 설정 (비율 조정)
+        header_grid.grid_columnconfigure(0, weight=8)  # 원본 파일명
+        header_grid.grid_columnconfigure(1, weight=1)  # 화살표
+        header_grid.grid_columnconfigure(2, weight=1)  # 변경 파일명
+
+        ctk.CTkLabel(
+            header_grid,
+            text="원본 파일명",
+            font=ModernStyle.create_font('caption', 'bold'),
+            text_color=ModernStyle.COLORS['text_default'],
+            anchor="w"  # 왼쪽 정렬
+        ).grid(row=0, column=0, sticky="ew", padx=ModernStyle.SPACING['lg'], pady=ModernStyle.SPACING['sm'])
+
+        ctk.CTkLabel(
+            header_grid,
+            text="→",  # 화살표 추가
+            font=ModernStyle.create_font('caption', 'bold'),
+            text_color=ModernStyle.COLORS['text_tertiary'],
+            width=40
+        ).grid(row=0, column=1)
+
+        ctk.CTkLabel(
+            header_grid,
+            text="변경 파일명",
+            font=ModernStyle.create_font('caption', 'bold'),
+            text_color=ModernStyle.COLORS['text_default'],
+            anchor="w"  # 왼쪽 정렬
+        ).grid(row=0, column=2, sticky="ew", padx=ModernStyle.SPACING['lg'], pady=ModernStyle.SPACING['sm'])
+
+        # 파일 목록 (보이는 행만 그리는 슬롯 + 전체 파일 수 기준 스크롤바)
+        list_container = ctk.CTkFrame(table_frame, fg_color="transparent", corner_radius=0)
+        list_container.pack(fill="both", expand=True, padx=1, pady=(0, 1))
+
+        self.scrollbar = ctk.CTkScrollbar(list_container, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.list_frame = ctk.CTkFrame(
+            list_container,
+            fg_color="transparent",
+            corner_radius=0
+        )
+        self.list_frame.pack(side="left", fill="both", expand=True)
+        # 슬롯 수는 화면 높이로 정함 (행이 프레임 크기를 늘리지 않도록)
+        self.list_frame.grid_propagate(False)
+        self.list_frame.bind("<Configure>", self._on_resize, add="+")
+        self._bind_wheel(self.list_frame)
+
+        # Grid 설정 (헤더와 동일하게)
+        self.list_frame.grid_columnconfigure(0, weight=8)
+        self.list_frame.grid_columnconfigure(1, weight=1)
+        self.list_frame.grid_columnconfigure(2, weight=4)
+
+        # 빈 상태 메시지 (행 grid 와 겹치지 않도록 place 사용)
+        self.empty_label = ctk.CTkLabel(
+            self.list_frame,
+            text="표시할 파일이 없습니다.",
+            font=ModernStyle.create_font('body'),
+            text_color=ModernStyle.COLORS['text_tertiary']
+        )
+        self._show_empty(True)
+
     def set_folder_title(self, folder_title: Optional[str]):
         if folder_title:
             text = f"미리보기 > {folder_title}"
@@ -215,120 +267,198 @@ class PreviewTable(ctk.CTkFrame):
         if self.title_label is not None:
             self.title_label.configure(text=text)
 
-    def update_preview(self, file_items: List[FileItem]):
+    def update_preview(self, file_items: List[FileItem],
+                       new_names: Optional[Sequence[str]] = None):
         """
-        미리보기 테이블 업데이트 (최적화: 위젯 재사용)
+        미리보기 테이블 업데이트 (화면에 보이는 행만 다시 그림)
+
+        Args:
+            file_items: 파일 아이템 리스트
+            new_names: 새 파일명 시퀀스 (NameView 등, 인덱스 접근 시 계산).
+                       None 이면 FileItem.new_name 사용
         """
+        self._items = file_items
+        self._new_names = new_names
+
+        self._show_empty(not file_items)
         if not file_items:
-            # 모든 위젯 숨기기
-            for row in self.row_widgets:
-                for widget in [row['orig'], row['arrow'], row['new']]:
-                    widget.grid_remove()
-            
-            if not hasattr(self, 'empty_label') or not self.empty_label.winfo_exists():
-                self.empty_label = ctk.CTkLabel(
-                    self.list_frame,
-                    text="표시할 파일이 없습니다.",
-                    font=ModernStyle.create_font('body'),
-                    text_color=ModernStyle.COLORS['text_tertiary']
-                )
-                self.empty_label.pack(pady=ModernStyle.SPACING['xl'])
-            else:
-                self.empty_label.pack(pady=ModernStyle.SPACING['xl'])
-            
             self.selected_indices.clear()
-            return
 
-        # 빈 상태 라벨 제거
-        if hasattr(self, 'empty_label') and self.empty_label.winfo_exists():
-            self.empty_label.pack_forget()
+        # 목록이 줄었으면 마지막 화면에 맞춰 스크롤 위치 보정
+        self._top = self._clamp_top(self._top)
+        self._render()
 
-        style = ModernStyle.get_table_style()
-        current_count = len(self.row_widgets)
-        target_count = len(file_items)
+    def _show_empty(self, show: bool):
+        """빈 상태 메시지 표시/숨김"""
+        if show:
+            self.empty_label.place(relx=0.5, y=ModernStyle.SPACING['xl'], anchor="n")
+        else:
+            self.empty_label.place_forget()
 
-        # 1. 부족한 위젯 추가
-        for i in range(current_count, target_count):
+    def see(self, index: int):
+        """
+        인덱스가 화면에 보이도록 스크롤
+
+        Args:
+            index: 파일 인덱스
+        """
+        self._scroll_to(PreviewViewport.follow(index, self._top, self._visible_rows()))
+
+    # ==================== 가상 스크롤 ====================
+
+    def _visible_rows(self) -> int:
+        """화면에 완전히 보이는 행 수"""
+        return PreviewViewport.visible_rows(self.list_frame.winfo_height(), self.ROW_HEIGHT)
+
+    def _clamp_top(self, top: int) -> int:
+        """스크롤 위치를 0 ~ (파일 수 - 보이는 행 수) 범위로 제한"""
+        return PreviewViewport.clamp_top(top, len(self._items), self._visible_rows())
+
+    def _scroll_to(self, top: int):
+        """첫 번째 슬롯에 보일 파일 인덱스 변경"""
+        top = self._clamp_top(top)
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _on_scrollbar(self, action: str, value: str, unit: Optional[str] = None):
+        """스크롤바 이동 ('moveto' 비율 또는 'scroll' 단위/페이지)"""
+        self._scroll_to(PreviewViewport.scroll_target(action, value, unit, self._top,
+                                                      len(self._items), self._visible_rows()))
+
+    def _on_wheel(self, event):
+        """마우스 휠 스크롤 (Windows/macOS 는 delta, Linux 는 Button-4/5)"""
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self._scroll_to(self._top - self.WHEEL_ROWS)
+        else:
+            self._scroll_to(self._top + self.WHEEL_ROWS)
+        return "break"  # 위젯 자체 스크롤(Treeview 등)은 막음
+
+    def _bind_wheel(self, widget):
+        """휠 이벤트 바인딩"""
+        widget.bind("<MouseWheel>", self._on_wheel, add="+")
+        widget.bind("<Button-4>", self._on_wheel, add="+")
+        widget.bind("<Button-5>", self._on_wheel, add="+")
+
+    def _on_resize(self, event=None):
+        """화면 높이가 바뀌면 슬롯 수 조정 (부분적으로 보이는 마지막 행 포함)"""
+        self._ensure_slots(PreviewViewport.slot_count(self.list_frame.winfo_height(), self.ROW_HEIGHT))
+        self._top = self._clamp_top(self._top)
+        self._render()
+
+    def _ensure_slots(self, count: int):
+        """슬롯이 count 개가 되도록 행 위젯 생성 (남는 슬롯은 _render 에서 숨김)"""
+        font = self._row_fonts[False]
+        for slot in range(len(self.row_widgets), count):
             # 원본 파일명
             lbl_orig = ctk.CTkLabel(
                 self.list_frame,
                 text="",
-                font=ModernStyle.create_font('body'),
+                height=self.ROW_HEIGHT - 2,
+                font=font,
                 text_color=ModernStyle.COLORS['text_primary'],
                 anchor="w",
                 corner_radius=4
             )
-            
+
             # 화살표
             lbl_arrow = ctk.CTkLabel(
                 self.list_frame,
                 text="→",
-                font=ModernStyle.create_font('body'),
+                height=self.ROW_HEIGHT - 2,
+                font=font,
                 text_color=ModernStyle.COLORS['text_tertiary'],
                 anchor="center"
             )
-            
+
             # 변경 파일명
             lbl_new = ctk.CTkLabel(
                 self.list_frame,
                 text="",
-                font=ModernStyle.create_font('body'),
+                height=self.ROW_HEIGHT - 2,
+                font=font,
                 text_color=ModernStyle.COLORS['text_primary'],
                 anchor="w",
                 corner_radius=4
             )
-            
-            # 이벤트 바인딩
+
+            # 이벤트 바인딩 (슬롯에 지금 보이는 파일 인덱스로 변환)
             for widget in [lbl_orig, lbl_arrow, lbl_new]:
-                widget.bind("<Button-1>", lambda e, idx=i: self._on_row_click(e, idx))
-            
+                widget.bind("<Button-1>", lambda e, s=slot: self._on_row_click(e, self._top + s))
+                self._bind_wheel(widget)
+
+            self.list_frame.grid_rowconfigure(slot, minsize=self.ROW_HEIGHT)
             self.row_widgets.append({
                 'orig': lbl_orig,
                 'arrow': lbl_arrow,
                 'new': lbl_new,
-                'bg': ''  # 나중에 설정됨
+                # 슬롯이 지금 보여주는 내용 (RowState, 숨김이면 None - 바뀐 것만 configure 하기 위한 사본)
+                'shown': None,
             })
 
-        # 2. 위젯 업데이트 및 배치
-        for i, item in enumerate(file_items):
-            row = self.row_widgets[i]
-            
-            # 배경색 결정
-            is_selected = i in self.selected_indices
-            base_bg = style['row_bg'] if i % 2 == 0 else style['row_bg_alt']
-            bg_color = style['row_selected'] if is_selected else base_bg
-            row['bg'] = base_bg  # 기본 배경색 저장
+    def _render(self):
+        """
+        슬롯마다 보여줄 파일을 채우고 스크롤바 갱신
+
+        슬롯별로 지금 보여주는 내용(row['shown'])과 비교해, 내용이나 선택 상태가 실제로 달라진
+        슬롯의 바뀐 위젯에만 configure 를 호출합니다. (한 항목 이동 = 두 행만 갱신)
+        """
+        style = self._table_style
+        states = PreviewViewport.slot_states(self._top, len(self.row_widgets), self._items,
+                                             self._new_names, self.selected_indices)
+        shown = [row['shown'] for row in self.row_widgets]
+
+        for slot in PreviewViewport.dirty_slots(shown, states):
+            row, state, old = self.row_widgets[slot], states[slot], shown[slot]
+            if state is None:
+                for widget in [row['orig'], row['arrow'], row['new']]:
+                    widget.grid_remove()
+                row['shown'] = None
+                continue
+
+            original, new_name, is_changed, background = state
+            bg_color = style[self.ROW_BACKGROUNDS[background]]
+            background_changed = old is None or old[3] != background
 
             # 원본 파일명 업데이트
-            row['orig'].configure(text=item.original_name, fg_color=bg_color)
-            row['orig'].grid(row=i, column=0, sticky="ew", padx=ModernStyle.SPACING['lg'], pady=1, ipady=5)
-            
+            if background_changed or old[0] != original:
+                row['orig'].configure(text=original, fg_color=bg_color)
+
             # 화살표 업데이트
-            row['arrow'].configure(fg_color=bg_color)
-            row['arrow'].grid(row=i, column=1, sticky="ew", padx=0, pady=1, ipady=5)
-            
+            if background_changed:
+                row['arrow'].configure(fg_color=bg_color)
+
             # 변경 파일명 업데이트
-            is_changed = item.original_name != item.new_name
-            text_color = ModernStyle.COLORS['accent_blue'] if is_changed else ModernStyle.COLORS['text_primary']
-            weight = 'bold' if is_changed else 'normal'
-            
-            row['new'].configure(
-                text=item.new_name, 
-                text_color=text_color, 
-                font=ModernStyle.create_font('body', weight),
-                fg_color=bg_color
-            )
-            row['new'].grid(row=i, column=2, sticky="ew", padx=ModernStyle.SPACING['lg'], pady=1, ipady=5)
+            if background_changed or old[1:3] != (new_name, is_changed):
+                text_color = ModernStyle.COLORS['accent_blue'] if is_changed else ModernStyle.COLORS['text_primary']
+                row['new'].configure(
+                    text=new_name,
+                    text_color=text_color,
+                    font=self._row_fonts[is_changed],
+                    fg_color=bg_color
+                )
 
-        # 3. 남는 위젯 숨기기
-        for i in range(target_count, len(self.row_widgets)):
-            row = self.row_widgets[i]
-            row['orig'].grid_forget()
-            row['arrow'].grid_forget()
-            row['new'].grid_forget()
+            # 슬롯 위치는 고정이므로 처음 보일 때만 배치
+            if old is None:
+                row['orig'].grid(row=slot, column=0, sticky="ew", padx=ModernStyle.SPACING['lg'], pady=1)
+                row['arrow'].grid(row=slot, column=1, sticky="ew", padx=0, pady=1)
+                row['new'].grid(row=slot, column=2, sticky="ew", padx=ModernStyle.SPACING['lg'], pady=1)
+            row['shown'] = state
+
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        """스크롤바 위치/크기를 (보이는 첫 행, 끝 행) / 전체 파일 수 비율로 설정 (바뀐 경우만)"""
+        position = PreviewViewport.scrollbar_position(self._top, len(self._items), self._visible_rows())
+        if position != self._scrollbar_shown:
+            self.scrollbar.set(*position)
+            self._scrollbar_shown = position
 
     def _on_row_click(self, event, index: int):
         """행 클릭 이벤트 (다중 선택 지원)"""
+        if index >= len(self._items):
+            return
+
         # Shift 키 확인 (범위 선택)
         if event.state & 0x0001:  # Shift
             if self.last_selected_index is not None:
@@ -355,23 +485,8 @@ class PreviewTable(ctk.CTkFrame):
         self._update_selection_highlight()
 
     def _update_selection_highlight(self):
-        """선택된 행들의 하이라이트 업데이트"""
-        style = ModernStyle.get_table_style()
-        for i, row in enumerate(self.row_widgets):
-            # 화면에 표시된 위젯만 업데이트
-            if not row['orig'].winfo_ismapped():
-                continue
-                
-            if i in self.selected_indices:
-                # 선택된 행
-                bg_color = style['row_selected']
-                for widget in [row['orig'], row['arrow'], row['new']]:
-                    widget.configure(fg_color=bg_color)
-            else:
-                # 선택되지 않은 행 (원래 배경색)
-                bg_color = row['bg']
-                for widget in [row['orig'], row['arrow'], row['new']]:
-                    widget.configure(fg_color=bg_color)
+        """선택된 행들의 하이라이트 업데이트 (선택 상태가 바뀐 슬롯만 다시 그림)"""
+        self._render()
 
     def get_selected_index(self) -> Optional[int]:
         """현재 선택된 항목의 인덱스 반환 (첫 번째 선택)"""
@@ -385,17 +500,19 @@ class PreviewTable(ctk.CTkFrame):
 
     def set_selection(self, index: int):
         """특정 인덱스 선택 (추가)"""
-        if 0 <= index < len(self.row_widgets):
+        if 0 <= index < len(self._items):
             self.selected_indices.add(index)
             self.last_selected_index = index
             self._update_selection_highlight()
 
     def set_selected_indices(self, indices: List[int]):
         """여러 인덱스 선택 (기존 선택 덮어쓰기)"""
-        valid_indices = {i for i in indices if 0 <= i < len(self.row_widgets)}
+        valid_indices = {i for i in indices if 0 <= i < len(self._items)}
         self.selected_indices = valid_indices
         if valid_indices:
             self.last_selected_index = min(valid_indices)
+            # 이동한 항목이 화면 밖으로 나갔으면 따라가기
+            self.see(self.last_selected_index)
         else:
             self.last_selected_index = None
         self._update_selection_highlight()
@@ -408,16 +525,7 @@ class PreviewTable(ctk.CTkFrame):
 
     def clear(self):
         """미리보기 초기화"""
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
-        
-        self.empty_label = ctk.CTkLabel(
-            self.list_frame,
-            text="표시할 파일이 없습니다.",
-            font=ModernStyle.create_font('body'),
-            text_color=ModernStyle.COLORS['text_tertiary']
-        )
-        self.empty_label.pack(pady=ModernStyle.SPACING['xl'])
-        self.row_widgets = []
         self.selected_indices.clear()
         self.last_selected_index = None
+        self._top = 0
+        self.update_preview([])
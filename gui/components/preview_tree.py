@@ -0,0 +1,158 @@
+"""
+Preview Tree Component
+ttk.Treeview 기반 미리보기 테이블 (단일 책임: 행당 Tcl 호출 1회로 파일 목록 미리보기 렌더링)
+"""
+
+import customtkinter as ctk
+from tkinter import ttk
+from gui.modern_style import ModernStyle
+from gui.components.preview_table import PreviewTable
+from gui.preview_viewport import PreviewViewport
+
+
+class PreviewTree(PreviewTable):
+    """
+    Treeview 미리보기 테이블 컴포넌트
+    책임: PreviewTable 과 같은 선택/이동/제거 API 를 유지하면서, 행을 Treeview 항목으로 그림
+
+    CTkLabel 은 configure 마다 자기 캔버스를 다시 그리지만, Treeview 행은 값과 태그를 한 번의
+    item() 호출로 바꿉니다. 가상 스크롤(슬롯 재사용)과 선택 관리는 PreviewTable 의 것을 그대로 씁니다.
+    """
+
+    STYLE_NAME = "Preview.Treeview"
+    HEADING_HEIGHT = 30  # 헤더 행 높이 (px, 보이는 행 수 계산용)
+
+    def _create_table(self, table_frame):
+        """
+        Treeview 헤더/행과 스크롤바 생성
+
+        Args:
+            table_frame: 테이블 프레임
+        """
+        self._configure_style()
+
+        list_container = ctk.CTkFrame(table_frame, fg_color="transparent", corner_radius=0)
+        list_container.pack(fill="both", expand=True, padx=1, pady=1)
+
+        self.scrollbar = ctk.CTkScrollbar(list_container, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        # 네이티브 선택은 끄고 PreviewTable 의 인덱스 기반 선택을 태그로 표시
+        self.tree = ttk.Treeview(
+            list_container,
+            columns=("orig", "arrow", "new"),
+            show="headings",
+            selectmode="none",
+            style=self.STYLE_NAME
+        )
+        self.tree.heading("orig", text="원본 파일명", anchor="w")
+        self.tree.heading("arrow", text="→")
+        self.tree.heading("new", text="변경 파일명", anchor="w")
+        self.tree.column("orig", anchor="w", stretch=True, width=300)
+        self.tree.column("arrow", anchor="center", stretch=False, width=40)
+        self.tree.column("new", anchor="w", stretch=True, width=300)
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize, add="+")
+        self.tree.bind("<Button-1>", self._on_tree_click)
+        self._bind_wheel(self.tree)
+
+        # 빈 상태 메시지는 Treeview 위에 겹쳐 표시
+        self.list_frame = list_container
+        self.empty_label = ctk.CTkLabel(
+            list_container,
+            text="표시할 파일이 없습니다.",
+            font=ModernStyle.create_font('body'),
+            text_color=ModernStyle.COLORS['text_tertiary'],
+            fg_color=ModernStyle.COLORS['surface']
+        )
+        self._show_empty(True)
+
+    def _configure_style(self):
+        """ModernStyle 색상/글꼴을 Treeview 스타일과 행 태그로 등록"""
+        style = ttk.Style(self)
+        table = ModernStyle.get_table_style()
+
+        style.configure(
+            self.STYLE_NAME,
+            rowheight=self.ROW_HEIGHT,
+            font=ModernStyle.create_font('body'),
+            background=table['row_bg'],
+            fieldbackground=table['row_bg'],
+            foreground=ModernStyle.COLORS['text_primary'],
+            borderwidth=0
+        )
+        style.configure(
+            f"{self.STYLE_NAME}.Heading",
+            font=ModernStyle.create_font('caption', 'bold'),
+            background=table['header_bg'],
+            foreground=ModernStyle.COLORS['text_default'],
+            relief="flat"
+        )
+        style.layout(self.STYLE_NAME, [('Treeview.treearea', {'sticky': 'nswe'})])  # 테두리 제거
+
+    def _configure_tags(self):
+        """행 태그 (배경은 even/odd/selected 중 하나, 변경된 이름은 changed 로 색/굵기)"""
+        table = ModernStyle.get_table_style()
+        for background, color_key in self.ROW_BACKGROUNDS.items():
+            self.tree.tag_configure(background, background=table[color_key])
+        self.tree.tag_configure(PreviewViewport.TAG_CHANGED, foreground=ModernStyle.COLORS['accent_blue'],
+                                font=ModernStyle.create_font('body', 'bold'))
+
+    def _show_empty(self, show: bool):
+        """빈 상태 메시지 표시/숨김 (Treeview 헤더 아래)"""
+        if show:
+            self.empty_label.place(in_=self.tree, relx=0.5,
+                                   y=self.HEADING_HEIGHT + ModernStyle.SPACING['xl'], anchor="n")
+        else:
+            self.empty_label.place_forget()
+
+    # ==================== 가상 스크롤 ====================
+
+    def _visible_rows(self) -> int:
+        """화면에 완전히 보이는 행 수 (헤더 제외)"""
+        return PreviewViewport.visible_rows(self.tree.winfo_height(), self.ROW_HEIGHT, self.HEADING_HEIGHT)
+
+    def _on_resize(self, event=None):
+        """화면 높이가 바뀌면 슬롯(Treeview 항목) 수 조정"""
+        self._ensure_slots(PreviewViewport.slot_count(self.tree.winfo_height(), self.ROW_HEIGHT,
+                                                      self.HEADING_HEIGHT))
+        self._top = self._clamp_top(self._top)
+        self._render()
+
+    def _ensure_slots(self, count: int):
+        """슬롯이 count 개가 되도록 Treeview 항목 생성 (항목 ID = 슬롯 번호, 처음 보일 때까지 분리)"""
+        if not self.row_widgets:
+            self._configure_tags()
+        for slot in range(len(self.row_widgets), count):
+            iid = str(slot)
+            self.tree.insert("", "end", iid=iid, values=("", "→", ""))
+            self.tree.detach(iid)
+            self.row_widgets.append({'iid': iid, 'shown': None})
+
+    def _render(self):
+        """슬롯마다 보여줄 파일을 채우고 스크롤바 갱신 (내용이 바뀐 행만 item() 1회)"""
+        states = PreviewViewport.slot_states(self._top, len(self.row_widgets), self._items,
+                                             self._new_names, self.selected_indices)
+        shown = [row['shown'] for row in self.row_widgets]
+
+        for slot in PreviewViewport.dirty_slots(shown, states):
+            row, state = self.row_widgets[slot], states[slot]
+            if state is None:
+                self.tree.detach(row['iid'])
+                row['shown'] = None
+                continue
+            if shown[slot] is None:
+                self.tree.move(row['iid'], "", slot)  # 분리했던 항목을 슬롯 위치에 다시 붙임
+            original, new_name = state[0], state[1]
+            self.tree.item(row['iid'], values=(original, "→", new_name), tags=PreviewViewport.row_tags(state))
+            row['shown'] = state
+
+        self._update_scrollbar()
+
+    def _on_tree_click(self, event):
+        """Treeview 클릭 → 슬롯 번호를 파일 인덱스로 바꿔 선택 처리"""
+        iid = self.tree.identify_row(event.y)
+        if iid:
+            self._on_row_click(event, self._top + int(iid))
+        return "break"
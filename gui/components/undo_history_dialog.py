@@ -0,0 +1,115 @@
+"""
+Undo History Dialog Component
+Undo 기록 목록 대화상자 (단일 책임: 되돌릴 시점 선택 UI)
+"""
+
+import customtkinter as ctk
+from typing import Callable, List, Optional, Tuple
+from gui.modern_style import ModernStyle
+
+
+class UndoHistoryDialog(ctk.CTkToplevel):
+    """
+    Undo 기록 대화상자
+    책임: 폴더의 변경 기록을 최신 순으로 보여주고, 선택한 시점 이전 상태로 되돌리기 요청
+    """
+
+    def __init__(self, parent, folder_name: str, entries: List[Tuple[str, int]],
+                 on_select: Optional[Callable] = None):
+        """
+        초기화
+
+        Args:
+            parent: 부모 윈도우
+            folder_name: 폴더(탭) 이름
+            entries: (기록 시각 ISO 문자열, 파일 수) 리스트 (최신 순)
+            on_select: 시점 선택 시 호출될 콜백 (timestamp: str) - 그 시점의 작업까지 모두 되돌림
+        """
+        super().__init__(parent)
+        self.folder_name = folder_name
+        self.entries = entries
+        self.on_select = on_select
+
+        self.title(f"'{folder_name}' 변경 기록")
+        self.geometry("420x360")
+        self.configure(fg_color=ModernStyle.COLORS['background'])
+        self.transient(parent)
+
+        self._create_ui()
+        self.grab_set()
+
+    def _create_ui(self):
+        """UI 생성"""
+        card = ctk.CTkFrame(
+            self,
+            **ModernStyle.get_card_style()
+        )
+        card.pack(fill="both", expand=True, padx=ModernStyle.SPACING['md'],
+                  pady=ModernStyle.SPACING['md'])
+
+        ctk.CTkLabel(
+            card,
+            text="되돌릴 시점을 선택하세요",
+            font=ModernStyle.create_font('body', 'bold'),
+            text_color=ModernStyle.COLORS['text_primary']
+        ).pack(anchor="w", padx=ModernStyle.SPACING['lg'], pady=(ModernStyle.SPACING['md'], 0))
+
+        ctk.CTkLabel(
+            card,
+            text="선택한 작업과 그 이후 작업을 한 번에 되돌립니다.",
+            font=ModernStyle.create_font('caption'),
+            text_color=ModernStyle.COLORS['text_secondary']
+        ).pack(anchor="w", padx=ModernStyle.SPACING['lg'], pady=(0, ModernStyle.SPACING['sm']))
+
+        list_container = ctk.CTkScrollableFrame(card, fg_color="transparent")
+        list_container.pack(fill="both", expand=True, padx=ModernStyle.SPACING['md'],
+                            pady=(0, ModernStyle.SPACING['md']))
+
+        for position, (timestamp, count) in enumerate(self.entries):
+            self._create_row(list_container, position, timestamp, count)
+
+    def _create_row(self, container, position: int, timestamp: str, count: int):
+        """
+        기록 한 줄 생성
+
+        Args:
+            container: 부모 컨테이너
+            position: 목록 내 위치 (0 이 최신)
+            timestamp: 기록 시각 (ISO 형식)
+            count: 파일 수
+        """
+        row = ctk.CTkFrame(container, fg_color="transparent")
+        row.pack(fill="x", pady=ModernStyle.SPACING['xs'])
+
+        # ISO 시각은 초 단위까지만 표시
+        label = timestamp.replace("T", " ")[:19]
+        steps = f" · 작업 {position + 1}개" if position else ""
+        ctk.CTkLabel(
+            row,
+            text=f"{label}  ({count:,}개 파일{steps})",
+            font=ModernStyle.create_font('caption'),
+            text_color=ModernStyle.COLORS['text_primary']
+        ).pack(side="left")
+
+        ctk.CTkButton(
+            row,
+            text="이 시점 전으로",
+            font=ModernStyle.create_font('caption', 'bold'),
+            width=96,
+            height=28,
+            command=lambda: self._select(timestamp),
+            cursor="hand2",
+            fg_color=ModernStyle.COLORS['button_secondary'],
+            text_color=ModernStyle.COLORS['text_primary'],
+            hover_color=ModernStyle.COLORS['button_secondary_hover'],
+            border_width=1,
+            border_color=ModernStyle.COLORS['border'],
+            corner_radius=ModernStyle.RADIUS['sm']
+        ).pack(side="right")
+
+    def _select(self, timestamp: str):
+        """시점 선택 - 대화상자를 닫고 콜백 호출"""
+        self.grab_release()
+        self.destroy()
+        if self.on_select:
+            self.on_select(timestamp)
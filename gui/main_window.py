@@ -6,13 +6,21 @@ GUI 메인 윈도우 (단일 책임: 컴포넌트 조립 및 이벤트 조정)
 from pathlib import Path
 import customtkinter as ctk
 from tkinter import messagebox
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from models.file_item import FileItem
 from core.sorter import FileSorter
 from core.name_generator import NameGenerator
+from core.name_substitution import NameSubstitution
 from core.file_operations import FileOperations
 from core.undo_manager import UndoManager
+from core.name_view import NameView
+from core.collision_index import CollisionIndex
+from core.duplicate_tracker import DuplicateTracker
+from core.rename_journal import RenameJournal
+from core.background_task import BackgroundTask
+from gui.refresh_scheduler import RefreshScheduler
+from core.snapshot import SnapshotReport
 
 from gui.modern_style import ModernStyle
 from gui.components import (
@@ -21,7 +29,9 @@ from gui.components import (
     SortOptions,
     PatternInput,
     PreviewTable,
-    ActionButtons
+    PreviewTree,
+    ActionButtons,
+    UndoHistoryDialog
 )
 
 
@@ -31,14 +41,30 @@ class RenamMainWindow:
     책임: UI 컴포넌트 조립 및 이벤트 조정 (오케스트레이션)
     """
 
-    def __init__(self, root: ctk.CTk):
+    # 백그라운드 작업 진행 상황 확인 주기 (ms)
+    POLL_INTERVAL_MS = 50
+
+    # 패턴 입력이 멈춘 뒤 전체 중복 검사를 실행할 때까지의 대기 시간 (ms)
+    STATUS_DELAY_MS = 150
+
+    # 미리보기 렌더러 (labels: CTkLabel 행, tree: ttk.Treeview 행 - 행당 Tcl 호출 1회)
+    PREVIEW_BACKENDS = {
+        'labels': PreviewTable,
+        'tree': PreviewTree,
+    }
+
+    def __init__(self, root: ctk.CTk, preview_backend: str = 'labels',
+                 durability: str = RenameJournal.DURABILITY_BATCH):
         """
         메인 윈도우 초기화
 
         Args:
             root: CustomTkinter 루트 윈도우
+            preview_backend: 미리보기 렌더러 (PREVIEW_BACKENDS 의 키)
+            durability: 이름 변경 저널 내구성 모드 (RenameJournal.DURABILITY_*)
         """
         self.root = root
+        self.preview_class = self.PREVIEW_BACKENDS[preview_backend]
         self.root.title("RENAM | 리넴")
         self.root.geometry("1150x700")  # 최적화된 사이즈
         self.root.resizable(False, False)  # 창 크기 고정
@@ -71,9 +97,18 @@ class RenamMainWindow:
         self.tab_data: dict = {}  # {tab_name: {'file_items': [], 'sort_mode': 1, 'pattern': '{n}'}}
         self.current_tab: Optional[str] = None
         self.subfolders: List[str] = []  # 하위 폴더 목록
+        self.name_view: Optional[NameView] = None  # 현재 탭의 새 파일명 (지연 계산)
+        self.duplicate_tracker = DuplicateTracker()  # 현재 탭의 새 파일명 중복 (증분 갱신)
+
+        # 미리보기 갱신 예약: 보이는 행은 다음 유휴 시점에, 전체 중복 검사는 입력이 멈춘 뒤 한 번
+        self.preview_refresh = RefreshScheduler(self.root, self._render_preview)
+        self.status_refresh = RefreshScheduler(self.root, self._refresh_status)
 
         # 비즈니스 로직 컴포넌트
         self.undo_manager = UndoManager()
+        self.journal = RenameJournal(durability=durability)  # 이름 변경 선기록 (중단 시 다음 실행에서 복구)
+        self.running_tasks: Dict[str, BackgroundTask] = {}  # 폴더(탭) 이름 -> 실행 중인 작업
+        self.quitting = False  # 종료 요청 후 작업 취소를 기다리는 중
 
         # UI 컴포넌트
         self.folder_selector: Optional[FolderSelector] = None
@@ -84,6 +119,33 @@ class RenamMainWindow:
         self.action_buttons: Optional[ActionButtons] = None
 
         self._setup_ui()
+        self._recover_interrupted_jobs()
+
+    def _recover_interrupted_jobs(self):
+        """이전 실행에서 중단된 이름 변경 작업 자동 복구 (가능하면 완료, 아니면 원래대로)"""
+        messages = []
+        for entry in self.journal.pending():
+            status, error_msg = FileOperations.recover_journal(entry)
+
+            if status in (RenameJournal.RECOVERED_COMMITTED, RenameJournal.ROLLED_FORWARD):
+                # 완료된 작업은 Undo 기록까지 남김 (이미 저장된 경우 제외)
+                last = self.undo_manager.get_last_operation()
+                if not (last and not self.undo_manager.is_group(last) and last["folder"] == str(entry.folder)
+                        and self._saved_names(last) == (entry.before, entry.after)):
+                    self.undo_manager.save_operation(entry.folder, entry.before, entry.after)
+                if status == RenameJournal.ROLLED_FORWARD:
+                    messages.append(f"'{entry.folder.name}': 중단된 변경을 마저 완료했습니다.")
+            elif status == RenameJournal.ROLLED_BACK:
+                messages.append(f"'{entry.folder.name}': 중단된 변경을 원래 이름으로 되돌렸습니다.")
+            else:
+                messages.append(f"'{entry.folder.name}': 자동 복구 실패 - {error_msg}")
+                entry.release()  # 저널은 남겨 다음 실행에서 다시 시도
+                continue
+
+            entry.discard()
+
+        if messages:
+            messagebox.showinfo("중단된 작업 복구", "\n".join(messages))
 
     def _setup_ui(self):
         """UI 전체 구성 (웹 스타일)"""
@@ -135,7 +197,7 @@ class RenamMainWindow:
         self.pattern_input.pack(fill="x")
 
         # 우측 패널 컴포넌트
-        self.preview_table = PreviewTable(
+        self.preview_table = self.preview_class(
             self.right_panel,
             on_move_up=self._on_move_up,
             on_move_down=self._on_move_down,
@@ -150,8 +212,11 @@ class RenamMainWindow:
         self.action_buttons = ActionButtons(
             main_container,
             on_execute=self._on_execute_all,
+            on_execute_every=self._on_execute_every_folder,
             on_undo=self._on_undo_all,
-            on_quit=self.root.quit
+            on_history=self._on_undo_history,
+            on_quit=self._on_quit,
+            on_cancel=self._on_cancel
         )
         # 초기에는 숨김 (폴더 선택 시 표시)
         # self.action_buttons.pack(fill="x", pady=(ModernStyle.SPACING['lg'], 0))
@@ -190,11 +255,13 @@ class RenamMainWindow:
             messagebox.showinfo("알림", "하위 폴더가 없습니다. 현재 폴더의 파일을 표시합니다.")
             self.folder_list.clear()
             # 하단 버튼 표시 (단일 폴더 모드)
+            self.action_buttons.show_execute_every(False)
             self.action_buttons.pack(fill="x", pady=(ModernStyle.SPACING['lg'], 0))
             self._scan_and_load_files()
             return
 
         # 하위 폴더가 있으면 하단 버튼은 "모든 폴더 일괄 변경" 용도
+        self.action_buttons.show_execute_every(True)
         self.action_buttons.pack(fill="x", pady=(ModernStyle.SPACING['lg'], 0))
 
         # 각 폴더의 데이터 초기화
@@ -213,13 +280,10 @@ class RenamMainWindow:
             except Exception as e:
                 messagebox.showerror("오류", f"{subfolder} 스캔 중 오류:\n{str(e)}")
 
-        # 각 폴더의 되돌리기 가능 여부 확인
-        operations = self.undo_manager.get_all_operations()
+        # 각 폴더의 되돌리기 가능 여부 확인 (일괄 변경 그룹 기록 포함)
         undo_states = {}
         for subfolder in self.subfolders:
-            folder_path = self.current_folder / subfolder
-            has_undo = any(Path(op["folder"]) == folder_path for op in operations)
-            undo_states[subfolder] = has_undo
+            undo_states[subfolder] = self.undo_manager.has_undo(self.current_folder / subfolder)
 
         # 폴더 리스트 설정
         self.folder_list.set_folders(self.subfolders, undo_states)
@@ -259,8 +323,7 @@ class RenamMainWindow:
             return
 
         # 현재 폴더의 undo 작업이 있는지 확인
-        operations = self.undo_manager.get_all_operations()
-        has_undo = any(Path(op["folder"]) == self.current_folder for op in operations)
+        has_undo = self.undo_manager.has_undo(self.current_folder)
 
         if has_undo:
             self.action_buttons.enable_undo()
@@ -274,8 +337,7 @@ class RenamMainWindow:
 
         # 현재 선택된 폴더의 undo 작업이 있는지 확인
         folder_path = self.current_folder / self.current_tab
-        operations = self.undo_manager.get_all_operations()
-        has_undo = any(Path(op["folder"]) == folder_path for op in operations)
+        has_undo = self.undo_manager.has_undo(folder_path)
 
         if has_undo:
             self.action_buttons.enable_undo()
@@ -313,6 +375,9 @@ class RenamMainWindow:
 
     def _on_sort_changed(self, mode=None):
         """정렬 규칙 변경 이벤트 핸들러"""
+        if self._is_busy(None):
+            return
+
         if self.file_items:
             self._apply_sort()
             # 현재 폴더에 정렬 모드 저장
@@ -350,8 +415,31 @@ class RenamMainWindow:
         except Exception as e:
             messagebox.showerror("정렬 오류", f"정렬 중 오류가 발생했습니다:\n{str(e)}")
 
-    def _update_preview(self, *args):
-        """미리보기 업데이트"""
+    def _update_preview(self, *args, changed: Optional[Tuple[int, int]] = None,
+                        removed: Optional[List[int]] = None):
+        """
+        미리보기 업데이트 예약 (한 번의 사용자 동작에서 여러 번 불려도 유휴 시점에 한 번만 그림)
+
+        Args:
+            changed: 순서가 바뀐 위치 구간 (시작, 끝) - 중복 상태 증분 갱신용
+            removed: 제거된 위치 목록 - 중복 상태 증분 갱신용
+        """
+        self.preview_refresh.request(changed, removed)
+
+    def _flush_preview(self):
+        """예약된 미리보기/중복 상태 갱신을 지금 실행 (최신 상태가 바로 필요할 때)"""
+        self.preview_refresh.flush()
+        self.status_refresh.flush()
+
+    def _render_preview(self, changed: Optional[Tuple[int, int]] = None,
+                        removed: Optional[List[int]] = None):
+        """
+        미리보기 갱신 (보이는 행만 그리고, 전체 중복 검사는 따로 예약)
+
+        Args:
+            changed: 순서가 바뀐 위치 구간 (시작, 끝)
+            removed: 제거된 위치 목록
+        """
         # 미리보기 타이틀에 현재 폴더/탭 이름 표시
         folder_title = None
         if self.subfolders and self.current_tab:
@@ -364,18 +452,137 @@ class RenamMainWindow:
 
         pattern = self.pattern_input.get_pattern()
 
-        for i, item in enumerate(self.file_items):
-            new_name = NameGenerator.generate(i + 1, pattern, item.ext)
-            item.new_name = new_name
+        # 새 파일명은 표시되는 행만 지연 계산 (전체 계산은 실행 시점)
+        self.name_view = self._build_name_view(self.current_tab, self.file_items, pattern)
 
         # 현재 폴더에 패턴 저장
         if self.current_tab and self.current_tab in self.tab_data:
             self.tab_data[self.current_tab]['pattern'] = pattern
 
-        self.preview_table.update_preview(self.file_items)
+        self.preview_table.update_preview(self.file_items, self.name_view)
+
+        # 전체 이름을 훑는 중복 검사는 입력이 이어지는 동안 미룸 (증분 갱신은 바로)
+        incremental = changed is not None or removed is not None
+        self.status_refresh.request(changed, removed, 0 if incremental else self.STATUS_DELAY_MS)
+
+    def _refresh_status(self, changed: Optional[Tuple[int, int]] = None,
+                        removed: Optional[List[int]] = None):
+        """예약된 패턴/중복 상태 갱신 (현재 패턴 기준)"""
+        self._refresh_pattern_status(self.pattern_input.get_pattern(), changed, removed)
+
+    def _refresh_pattern_status(self, pattern: str, changed: Optional[Tuple[int, int]] = None,
+                                removed: Optional[List[int]] = None):
+        """
+        패턴 유효성 및 중복 상태 표시
+
+        구조적으로 중복이 불가능한 패턴은 이름을 계산하지 않고,
+        그 외에는 이름별 개수 맵을 바뀐 위치만큼만 갱신합니다.
+
+        Args:
+            pattern: 파일명 패턴 또는 치환식
+            changed: 순서가 바뀐 위치 구간 (시작, 끝)
+            removed: 제거된 위치 목록
+        """
+        view = self.name_view
+        renamer = view.renamer
+        tracker = self.duplicate_tracker
+
+        if not NameGenerator.validate_pattern(pattern):
+            tracker.clear()
+            error = getattr(renamer, 'error', None)
+            kind = "치환식" if isinstance(renamer, NameSubstitution) else "패턴"
+            self.pattern_input.set_status(
+                f"⚠ {kind} 오류: {error}" if error else "⚠ 순번({n}, {000}) 또는 {orig} 토큰이 필요합니다.",
+                ok=False
+            )
+            return
+
+        if renamer.unique_by_construction or not view:
+            tracker.clear()
+        elif not tracker.active or (changed is None and removed is None):
+            tracker.reset(view.window(0, len(view)))
+        else:
+            if removed:
+                tracker.remove(removed)
+            # 순번을 쓰지 않는 패턴은 위치가 바뀌어도 이름이 그대로
+            if renamer.has_counter:
+                if removed:
+                    start, stop = min(removed), len(view)
+                else:
+                    start, stop = changed
+                tracker.update(start, view.window(start, stop))
+
+        if tracker.active and tracker.has_duplicates:
+            self.pattern_input.set_status(
+                f"⚠ 중복된 파일명 {len(tracker.duplicates())}개가 있습니다.", ok=False
+            )
+        else:
+            self.pattern_input.set_status("✓ 사용 가능한 패턴입니다.")
+
+    def _has_duplicate_names(self, file_items: List[FileItem], pattern: str,
+                             new_names: List[str]) -> bool:
+        """
+        새 파일명 중복 여부 (현재 탭이면 증분 관리 중인 상태 재사용)
+
+        Args:
+            file_items: 파일 아이템 리스트
+            pattern: 파일명 패턴 또는 치환식
+            new_names: 전체 새 파일명 리스트
+
+        Returns:
+            중복 여부
+        """
+        self._flush_preview()
+        view = self.name_view
+        if view is not None and view.items is file_items and pattern == self.pattern_input.get_pattern():
+            if view.renamer.unique_by_construction:
+                return False
+            if self.duplicate_tracker.active:
+                return self.duplicate_tracker.has_duplicates
+        return NameGenerator.check_duplicates(new_names)
+
+    def _build_name_view(self, folder_name: Optional[str], file_items: List[FileItem],
+                         pattern: str) -> NameView:
+        """
+        패턴을 컴파일하여 새 파일명 뷰 생성 (이름 계산은 하지 않음)
+
+        Args:
+            folder_name: 하위 폴더명 (연속 번호 오프셋 계산용)
+            file_items: 파일 아이템 리스트 (현재 순서)
+            pattern: 파일명 패턴 또는 치환식
+
+        Returns:
+            지연 계산 NameView
+        """
+        renamer = NameGenerator.compile(pattern)
+        return NameView(renamer, file_items, self._numbering_offset(folder_name))
+
+    def _numbering_offset(self, folder_name: Optional[str]) -> int:
+        """
+        폴더 간 연속 번호 사용 시 해당 폴더의 순번 시작 오프셋 계산
+
+        Args:
+            folder_name: 하위 폴더명
+
+        Returns:
+            앞선 하위 폴더들의 파일 수 합계 (연속 번호 미사용 시 0)
+        """
+        if not self.pattern_input.is_continuous() or folder_name not in self.tab_data:
+            return 0
+
+        offset = 0
+        for subfolder in self.subfolders:
+            if subfolder == folder_name:
+                break
+            if subfolder in self.tab_data:
+                offset += len(self.tab_data[subfolder]['file_items'])
+        return offset
 
     def _on_move_up(self):
         """항목 위로 이동 (블록 이동 알고리즘)"""
+        if self._is_busy(None):
+            return
+
         indices = self.preview_table.get_selected_indices()
         if not indices:
             messagebox.showinfo("알림", "이동할 항목을 선택하세요.")
@@ -399,7 +606,8 @@ class RenamMainWindow:
         if self.current_tab and self.current_tab in self.tab_data:
             self.tab_data[self.current_tab]['file_items'] = self.file_items
 
-        self._update_preview()
+        # 위치가 바뀐 구간: 삽입 위치 ~ 가장 아래 선택 항목
+        self._update_preview(changed=(target_idx, indices[-1] + 1))
 
         # 선택 상태 업데이트 (이동된 위치로)
         new_indices = list(range(target_idx, target_idx + len(selected_items)))
@@ -407,6 +615,9 @@ class RenamMainWindow:
 
     def _on_move_down(self):
         """항목 아래로 이동 (블록 이동 알고리즘)"""
+        if self._is_busy(None):
+            return
+
         indices = self.preview_table.get_selected_indices()
         if not indices:
             messagebox.showinfo("알림", "이동할 항목을 선택하세요.")
@@ -432,7 +643,8 @@ class RenamMainWindow:
         if self.current_tab and self.current_tab in self.tab_data:
             self.tab_data[self.current_tab]['file_items'] = self.file_items
 
-        self._update_preview()
+        # 위치가 바뀐 구간: 가장 위 선택 항목 ~ 이동된 블록 끝
+        self._update_preview(changed=(indices[0], target_idx + len(selected_items)))
 
         # 선택 상태 업데이트 (이동된 위치로)
         new_indices = list(range(target_idx, target_idx + len(selected_items)))
@@ -440,6 +652,9 @@ class RenamMainWindow:
 
     def _on_remove(self):
         """항목 제거 이벤트 핸들러"""
+        if self._is_busy(None):
+            return
+
         indices = self.preview_table.get_selected_indices()
         if not indices:
             messagebox.showinfo("알림", "제거할 항목을 선택하세요.")
@@ -453,11 +668,14 @@ class RenamMainWindow:
         if self.current_tab and self.current_tab in self.tab_data:
             self.tab_data[self.current_tab]['file_items'] = self.file_items
 
-        self._update_preview()
+        self._update_preview(removed=indices)
         self.preview_table.clear_selection()
 
     def _on_reset(self):
         """목록 초기화 이벤트 핸들러 (초기 상태로 복구)"""
+        if self._is_busy(None):
+            return
+
         if not self.file_items and not self.current_folder:
             return
             
@@ -477,6 +695,9 @@ class RenamMainWindow:
 
     def _execute_folder(self, folder_name: str):
         """특정 폴더의 파일명 변경 실행"""
+        if self._is_busy(folder_name):
+            return
+
         # 하위 폴더 모드인지 확인
         if folder_name in self.tab_data:
             # 하위 폴더 모드
@@ -492,19 +713,45 @@ class RenamMainWindow:
             messagebox.showwarning("경고", "파일이 없습니다.")
             return
 
-        # 패턴 적용하여 새 이름 생성 (최신 데이터 반영)
+        # 패턴 적용하여 새 이름 전체 계산 (최신 데이터 반영)
         if folder_name in self.tab_data:
             pattern = self.tab_data[folder_name]['pattern']
-            for i, item in enumerate(file_items):
-                new_name = NameGenerator.generate(i + 1, pattern, item.ext)
-                item.new_name = new_name
+        else:
+            pattern = self.pattern_input.get_pattern()
+        name_view = self._build_name_view(folder_name, file_items, pattern)
+        new_names = name_view.materialize()
 
-        # 중복 체크
-        new_names = [item.new_name for item in file_items]
-        if NameGenerator.check_duplicates(new_names):
+        # 중복 체크 (현재 탭은 미리보기에서 갱신해 둔 상태 재사용)
+        if self._has_duplicate_names(file_items, pattern, new_names):
             messagebox.showerror("오류", "중복된 파일명이 발생합니다. 패턴을 수정하세요.")
             return
 
+        # 스캔 이후 폴더가 바뀌었는지 검증 (목록 조회 1회, 충돌 검사에도 재사용)
+        try:
+            snapshot = FileOperations.validate_snapshot(folder_path, file_items)
+        except OSError as e:
+            messagebox.showerror("오류", f"폴더를 읽을 수 없습니다:\n{str(e)}")
+            return
+        if not self._check_snapshot(folder_name, file_items, snapshot):
+            return
+
+        # 폴더 내 다른 파일(미리보기 밖 파일 포함)과의 이름 충돌 검사
+        before_names = [item.original_name for item in file_items]
+        collision_strategy = CollisionIndex.STRATEGY_ABORT
+        collision = CollisionIndex(snapshot.names).resolve(before_names, new_names)
+
+        if collision.has_conflicts:
+            answer = messagebox.askyesnocancel(
+                "이름 충돌",
+                f"{len(collision.conflicts)}개 파일의 새 이름이 폴더 내 다른 파일과 겹칩니다.\n\n"
+                "예: 번호를 붙여 자동으로 피하기 (예: 1 (2).jpg)\n"
+                "아니오: 겹치는 파일은 건너뛰기\n"
+                "취소: 작업 중단"
+            )
+            if answer is None:
+                return
+            collision_strategy = CollisionIndex.STRATEGY_SUFFIX if answer else CollisionIndex.STRATEGY_SKIP
+
         # 확인
         result = messagebox.askyesno(
             "확인",
@@ -514,19 +761,182 @@ class RenamMainWindow:
         if not result:
             return
 
-        # Undo 데이터 준비
-        before_names = [item.original_name for item in file_items]
-        after_names = [item.new_name for item in file_items]
+        # 파일명 변경은 작업 스레드에서 실행 (UI 는 진행 상황만 주기적으로 확인)
+        batch = list(file_items)
+
+        def run(progress, cancel_event):
+            result = FileOperations.rename_files(
+                folder_path, batch, collision_strategy, self.journal, progress, cancel_event,
+                workers=FileOperations.PIPELINE_WORKERS
+            )
+            # 변경 직후 폴더 상태 (완료 처리 시 다른 프로그램의 변경 여부 확인용)
+            return result, FileOperations.folder_stamp(folder_path)
+
+        task = BackgroundTask(run, name=folder_name)
+        self.running_tasks[folder_name] = task
+        self.action_buttons.show_progress()
+        task.start()
+        self._poll_task(
+            task, lambda outcome: self._finish_execute(folder_name, folder_path, file_items, before_names,
+                                                       pattern, name_view.offset, *outcome)
+        )
+
+    def _check_snapshot(self, folder_name: str, file_items: List[FileItem],
+                        snapshot: SnapshotReport) -> bool:
+        """
+        스냅샷 검증 결과 확인 (바뀐 항목이 있으면 목록 보정 여부를 묻고 실행 중단)
+
+        Args:
+            folder_name: 폴더(탭) 이름
+            file_items: 검증한 파일 아이템 리스트
+            snapshot: FileOperations.validate_snapshot 결과
+
+        Returns:
+            그대로 실행해도 되는지
+        """
+        if not snapshot.writable:
+            messagebox.showerror("오류", f"'{folder_name}' 폴더에 쓰기 권한이 없습니다.")
+            return False
+        if not snapshot.has_drift:
+            return True
+
+        if messagebox.askyesno(
+            "폴더 변경 감지",
+            f"'{folder_name}' 폴더를 불러온 뒤 다른 프로그램이 내용을 바꿨습니다.\n\n"
+            f"{snapshot.summary()}\n\n"
+            "목록을 갱신하시겠습니까?\n(갱신 후 미리보기를 확인하고 다시 실행하세요)"
+        ):
+            self._apply_snapshot(folder_name, file_items, snapshot)
+        return False
+
+    def _apply_snapshot(self, folder_name: str, file_items: List[FileItem],
+                        snapshot: SnapshotReport):
+        """
+        바뀐 항목만 목록에 반영 (전체 재스캔 없이, 현재 정렬 규칙 재적용)
+
+        Args:
+            folder_name: 폴더(탭) 이름
+            file_items: 검증한 파일 아이템 리스트
+            snapshot: FileOperations.validate_snapshot 결과
+        """
+        refreshed = snapshot.apply(file_items)
+        if folder_name in self.tab_data:
+            self.tab_data[folder_name]['file_items'] = refreshed
+            if self.current_tab != folder_name:
+                return
+        self.file_items = refreshed
+        if refreshed:
+            self._apply_sort()
+        else:
+            self._update_preview()
+
+    def _poll_task(self, task: BackgroundTask, on_done: Callable):
+        """
+        백그라운드 작업 진행 상황 확인 (Tk after 로 반복 호출)
+
+        Args:
+            task: 실행 중인 작업
+            on_done: 완료 시 작업 결과를 받을 콜백 (UI 스레드에서 호출)
+        """
+        finished = task.poll()
+        self._refresh_progress()
+        if not finished:
+            self.root.after(self.POLL_INTERVAL_MS, lambda: self._poll_task(task, on_done))
+            return
+
+        # 여러 폴더를 묶은 작업은 폴더마다 같은 작업으로 등록되어 있음
+        for folder_name in [name for name, running in self.running_tasks.items() if running is task]:
+            del self.running_tasks[folder_name]
+        self._refresh_progress()
+        if task.error is not None:
+            messagebox.showerror("오류", f"예상치 못한 오류: {str(task.error)}")
+            return
+        on_done(task.result)
+
+    def _refresh_progress(self):
+        """실행 중인 모든 작업의 진행 상황 합계 표시"""
+        if not self.running_tasks:
+            self.action_buttons.hide_progress()
+            return
+        tasks = self._unique_tasks()
+        done = sum(task.progress[0] for task in tasks)
+        total = sum(task.progress[1] for task in tasks)
+        if any(task.cancelled for task in tasks):
+            self.action_buttons.set_cancelling()
+        elif total:
+            self.action_buttons.set_progress(done, total)
+
+    def _on_cancel(self):
+        """진행 중인 작업 취소 (실행된 변경은 되돌림)"""
+        for task in self._unique_tasks():
+            task.cancel()
+        self._refresh_progress()
+
+    def _unique_tasks(self) -> List[BackgroundTask]:
+        """실행 중인 작업 목록 (여러 폴더에 등록된 작업은 한 번만)"""
+        tasks = []
+        for task in self.running_tasks.values():
+            if all(task is not seen for seen in tasks):
+                tasks.append(task)
+        return tasks
+
+    def _is_busy(self, folder_name: Optional[str]) -> bool:
+        """
+        폴더에 실행 중인 작업이 있는지 확인 (있으면 안내 표시)
+
+        Args:
+            folder_name: 폴더(탭) 이름
+
+        Returns:
+            작업 중 여부
+        """
+        if self.quitting:
+            # 종료 요청 후 작업 취소를 기다리는 중에는 새 작업을 시작하지 않음
+            return True
+        if folder_name is None:
+            # 현재 보고 있는 탭 (단일 폴더 모드는 폴더 이름)
+            if self.subfolders and self.current_tab:
+                folder_name = self.current_tab
+            elif self.current_folder:
+                folder_name = self.current_folder.name
+        if folder_name in self.running_tasks:
+            messagebox.showinfo("알림", f"'{folder_name}' 폴더의 파일명 변경이 진행 중입니다.")
+            return True
+        return False
+
+    def _finish_execute(self, folder_name: str, folder_path: Path, file_items: List[FileItem],
+                        before_names: List[str], pattern: str, offset: int,
+                        result: Tuple[bool, str], stamp: Optional[int]):
+        """
+        파일명 변경 완료 처리 (UI 스레드)
 
-        # 파일명 변경 실행
-        success, error_msg = FileOperations.rename_files(folder_path, file_items)
+        Args:
+            folder_name: 폴더(탭) 이름
+            folder_path: 폴더 경로
+            file_items: 변경한 파일 아이템 리스트
+            before_names: 변경 전 파일명 리스트
+            pattern: 실행에 사용한 패턴 (Undo 기록 압축용)
+            offset: 전체 순번 시작 오프셋
+            result: rename_files 결과 (성공 여부, 오류 메시지)
+            stamp: 변경 직후 폴더 상태 (FileOperations.folder_stamp)
+        """
+        success, error_msg = result
 
         if not success:
             messagebox.showerror("오류", f"파일명 변경 중 오류가 발생했습니다:\n{error_msg}")
+            # 일부만 되돌려진 경우 목록을 실제 디스크 상태로 맞춤
+            if not self._matches_disk(folder_path, file_items):
+                self._rescan_folder(folder_name)
             return
 
+        # Undo 데이터 준비 (충돌 해결로 바뀐 이름 반영)
+        after_names = [item.original_name for item in file_items]
+
         # Undo 로그 저장
-        self.undo_manager.save_operation(folder_path, before_names, after_names)
+        self.undo_manager.save_operation(folder_path, before_names, after_names, pattern, offset,
+                                         FileItem.make_anchors(file_items))
+        # Undo 기록까지 저장되었으므로 저널 정리
+        self.journal.finish(folder_path)
 
         # 되돌리기 버튼 활성화
         if folder_name in self.tab_data:
@@ -536,29 +946,259 @@ class RenamMainWindow:
             # 단일 폴더 모드 - 하단 버튼 활성화
             self.action_buttons.enable_undo()
 
+        if error_msg:
+            # 이름 변경은 끝났지만 실행 후 검증 결과가 기대와 다름 (다른 프로그램의 동시 변경 등)
+            messagebox.showwarning(
+                "확인 필요",
+                f"'{folder_name}' 폴더의 파일명을 변경했지만 확인 결과가 기대와 다릅니다:\n{error_msg}"
+            )
+            self._rescan_folder(folder_name)
+            return
+
         messagebox.showinfo("완료", f"'{folder_name}' 폴더의 {len(file_items)}개 파일명이 변경되었습니다.")
 
-        # 해당 폴더 재스캔
-        self._rescan_folder(folder_name)
+        # 아이템은 실행한 계획대로 이미 갱신됨 - 다른 변경이 없으면 재스캔 생략
+        self._refresh_renamed_folder(folder_name, folder_path, stamp)
+
+    def _on_execute_every_folder(self):
+        """모든 폴더 변경 - 모든 하위 폴더를 먼저 계획한 뒤 폴더별로 병렬 실행"""
+        if not self.subfolders or not self.tab_data:
+            self._on_execute_all()
+            return
+        if self.running_tasks:
+            messagebox.showinfo("알림", "진행 중인 파일명 변경이 끝난 뒤 다시 시도하세요.")
+            return
+
+        # 현재 탭의 정렬/패턴 반영
+        self._save_current_folder_state()
+
+        # 1단계: 모든 폴더의 새 이름 계산 및 중복/충돌 검사 (하나라도 문제가 있으면 아무것도 바꾸지 않음)
+        jobs = []      # (폴더명, 폴더 경로, 파일 아이템 리스트, 변경 전 파일명 리스트)
+        patterns = []  # (패턴, 전체 순번 시작 오프셋) - Undo 기록 압축용
+        conflicts = 0
+        for folder_name in self.subfolders:
+            folder_info = self.tab_data.get(folder_name)
+            if not folder_info or not folder_info['file_items']:
+                continue
+            file_items = folder_info['file_items']
+            pattern = folder_info['pattern']
+            # 연속 번호 사용 시 앞선 폴더 파일 수만큼 오프셋 적용
+            name_view = self._build_name_view(folder_name, file_items, pattern)
+            new_names = name_view.materialize()
+
+            if self._has_duplicate_names(file_items, pattern, new_names):
+                messagebox.showerror("오류", f"'{folder_name}' 폴더에서 중복된 파일명이 발생합니다. "
+                                             "패턴을 수정하세요.")
+                return
+
+            folder_path = self.current_folder / folder_name
+            try:
+                snapshot = FileOperations.validate_snapshot(folder_path, file_items)
+            except OSError as e:
+                messagebox.showerror("오류", f"'{folder_name}' 폴더를 읽을 수 없습니다:\n{str(e)}")
+                return
+            if not self._check_snapshot(folder_name, file_items, snapshot):
+                return
+
+            before_names = [item.original_name for item in file_items]
+            collision = CollisionIndex(snapshot.names).resolve(before_names, new_names)
+            conflicts += len(collision.conflicts)
+            jobs.append((folder_name, folder_path, file_items, before_names))
+            patterns.append((pattern, name_view.offset))
+
+        if not jobs:
+            messagebox.showwarning("경고", "파일이 없습니다.")
+            return
+
+        collision_strategy = CollisionIndex.STRATEGY_ABORT
+        if conflicts:
+            answer = messagebox.askyesnocancel(
+                "이름 충돌",
+                f"{conflicts}개 파일의 새 이름이 폴더 내 다른 파일과 겹칩니다.\n\n"
+                "예: 번호를 붙여 자동으로 피하기 (예: 1 (2).jpg)\n"
+                "아니오: 겹치는 파일은 건너뛰기\n"
+                "취소: 작업 중단"
+            )
+            if answer is None:
+                return
+            collision_strategy = CollisionIndex.STRATEGY_SUFFIX if answer else CollisionIndex.STRATEGY_SKIP
+
+        total_files = sum(len(file_items) for _, _, file_items, _ in jobs)
+        result = messagebox.askyesno(
+            "확인",
+            f"{len(jobs)}개 폴더의 {total_files}개 파일명을 변경하시겠습니까?\n"
+            "이 작업은 실제 파일명을 변경하며, 한 번에 되돌릴 수 있도록 기록됩니다."
+        )
+        if not result:
+            return
+
+        # 2단계: 폴더끼리는 독립이므로 제한된 스레드 풀에서 병렬 실행
+        batches = [(folder_path, list(file_items)) for _, folder_path, file_items, _ in jobs]
+        parent = self.current_folder
+        def run(progress, cancel_event):
+            results = FileOperations.rename_folders(
+                batches, collision_strategy, self.journal, progress, cancel_event,
+                workers=FileOperations.PIPELINE_WORKERS
+            )
+            return results, [FileOperations.folder_stamp(folder_path) for folder_path, _ in batches]
+
+        task = BackgroundTask(run, name=parent.name)
+        for folder_name, _, _, _ in jobs:
+            self.running_tasks[folder_name] = task
+        self.action_buttons.show_progress()
+        task.start()
+        self._poll_task(task, lambda outcome: self._finish_execute_every(parent, jobs, patterns, *outcome))
+
+    def _finish_execute_every(self, parent: Path, jobs: List[Tuple[str, Path, List[FileItem], List[str]]],
+                              patterns: List[Tuple[str, int]],
+                              results: List[Tuple[bool, str]], stamps: List[Optional[int]]):
+        """
+        모든 폴더 변경 완료 처리 (UI 스레드)
+
+        Args:
+            parent: 부모 폴더
+            jobs: (폴더명, 폴더 경로, 파일 아이템 리스트, 변경 전 파일명 리스트) 리스트
+            patterns: (패턴, 전체 순번 시작 오프셋) 리스트 (jobs 와 같은 순서)
+            results: rename_folders 결과 (jobs 와 같은 순서)
+            stamps: 변경 직후 폴더 상태 (jobs 와 같은 순서)
+        """
+        members = []
+        member_patterns = []
+        member_anchors = []
+        failures = []
+        warnings = []
+        rescan = []
+        renamed = []
+        changed_files = 0
+        for (folder_name, folder_path, file_items, before_names), pattern, (success, error_msg), stamp in zip(
+                jobs, patterns, results, stamps):
+            if success:
+                members.append((folder_path, before_names, [item.original_name for item in file_items]))
+                member_patterns.append(pattern)
+                member_anchors.append(FileItem.make_anchors(file_items))
+                changed_files += len(file_items)
+                if error_msg:
+                    # 실행 후 검증 경고 → 실제 디스크 상태로 다시 읽음
+                    warnings.append(f"'{folder_name}': {error_msg}")
+                    self.folder_list.enable_undo(folder_name)
+                    rescan.append(folder_name)
+                else:
+                    renamed.append((folder_name, folder_path, stamp))
+            else:
+                failures.append(f"'{folder_name}': {error_msg}")
+                # 일부만 되돌려진 경우 목록을 실제 디스크 상태로 맞춤
+                if not self._matches_disk(folder_path, file_items):
+                    rescan.append(folder_name)
+
+        # 성공한 폴더를 하나의 그룹 기록으로 저장 (그룹 전체 또는 폴더별로 되돌리기 가능)
+        # 모두 실패했으면 되돌릴 것이 없으므로 빈 그룹 기록을 남기지 않음
+        if members:
+            self.undo_manager.save_group(parent, members, member_patterns, member_anchors)
+            # Undo 기록까지 저장되었으므로 저널 정리
+            for folder_path, _, _ in members:
+                self.journal.finish(folder_path)
+
+        if failures:
+            messagebox.showerror(
+                "오류",
+                f"{len(members)}개 폴더({changed_files}개 파일) 변경 완료, "
+                f"{len(failures)}개 폴더 실패:\n\n" + "\n".join(failures + warnings)
+            )
+        elif warnings:
+            messagebox.showwarning(
+                "확인 필요",
+                f"{len(members)}개 폴더의 {changed_files}개 파일명을 변경했지만 "
+                "일부 폴더의 확인 결과가 기대와 다릅니다:\n\n" + "\n".join(warnings)
+            )
+        else:
+            messagebox.showinfo("완료", f"{len(members)}개 폴더의 {changed_files}개 파일명이 변경되었습니다.")
+
+        # 변경된 폴더는 메모리 모델 그대로 사용, 실패 후 일부만 되돌려진 폴더는 재스캔
+        for folder_name, folder_path, stamp in renamed:
+            self.folder_list.enable_undo(folder_name)
+            self._refresh_renamed_folder(folder_name, folder_path, stamp)
+        for folder_name in rescan:
+            self._rescan_folder(folder_name)
+        self._update_bottom_undo_state()
+
+    def _undo_group(self, parent: Path, operation: Dict):
+        """
+        일괄 변경 그룹 전체 되돌리기 (폴더별 병렬 실행)
+
+        Args:
+            parent: 부모 폴더
+            operation: UndoManager 그룹 기록
+        """
+        members = operation["group"]
+        folder_names = [Path(member["folder"]).name for member in members]
+        if any(self._is_busy(folder_name) for folder_name in folder_names):
+            return
+
+        saved = [self._saved_names(member) for member in members]
+        if None in saved:
+            messagebox.showerror("오류", "Undo 기록이 손상되어 되돌릴 수 없습니다.")
+            return
+
+        jobs = [(Path(member["folder"]), before, after, self.undo_manager.get_anchors(member))
+                for member, (before, after) in zip(members, saved)]
+        task = BackgroundTask(
+            lambda progress, cancel_event: FileOperations.restore_folders(
+                jobs, progress, cancel_event, workers=FileOperations.PIPELINE_WORKERS
+            ),
+            name=parent.name
+        )
+        for folder_name in folder_names:
+            self.running_tasks[folder_name] = task
+        self.action_buttons.show_progress()
+        task.start()
+        self._poll_task(task, lambda results: self._finish_undo_group(operation, saved, results))
+
+    def _finish_undo_group(self, operation: Dict, saved: List[Tuple[List[str], List[str]]],
+                           results: List[Tuple[bool, str]]):
+        """
+        그룹 되돌리기 완료 처리 (UI 스레드)
+
+        Args:
+            operation: 되돌린 그룹 기록
+            saved: 항목별 (변경 전 파일명 리스트, 변경 후 파일명 리스트) (그룹 항목과 같은 순서)
+            results: restore_folders 결과 (그룹 항목과 같은 순서)
+        """
+        members = operation["group"]
+        restored = [Path(member["folder"]) for member, (success, _) in zip(members, results) if success]
+        failures = [f"'{Path(member['folder']).name}': {error_msg}"
+                    for member, (success, error_msg) in zip(members, results) if not success]
+
+        # 복구된 항목만 제거 (기록 ID 는 실행 중 다른 기록이 추가되어도 그대로)
+        self.undo_manager.remove_operation(operation["id"], restored)
+
+        if failures:
+            messagebox.showerror("오류", f"{len(restored)}개 폴더 복구 완료, "
+                                         f"{len(failures)}개 폴더 실패:\n\n" + "\n".join(failures))
+        else:
+            messagebox.showinfo("완료", f"{len(restored)}개 폴더의 파일명이 복구되었습니다.")
+
+        for member, (before, after), (success, _) in zip(members, saved, results):
+            folder_name = Path(member["folder"]).name
+            if success:
+                self._apply_restored_names(folder_name, before, after)
+            else:
+                self._rescan_folder(folder_name)
+        self._update_bottom_undo_state()
 
     def _undo_folder(self, folder_name: str):
         """특정 폴더의 되돌리기 실행"""
+        if self._is_busy(folder_name):
+            return
+
         # 해당 폴더의 가장 최근 작업 찾기
         folder_path = self.current_folder / folder_name if folder_name in self.tab_data else self.current_folder
 
-        # 해당 폴더의 작업이 있는지 확인
-        operations = self.undo_manager.get_all_operations()
-        last_op = None
-        last_op_index = None
-        for i, op in enumerate(reversed(operations)):
-            if Path(op["folder"]) == folder_path:
-                last_op = op
-                last_op_index = len(operations) - 1 - i
-                break
-
-        if not last_op:
+        # 해당 폴더의 작업이 있는지 확인 (일괄 변경 그룹의 항목 포함)
+        found = self.undo_manager.last_operation(folder_path)
+        if not found:
             messagebox.showinfo("알림", f"'{folder_name}' 폴더의 되돌릴 작업이 없습니다.")
             return
+        last_op_index, last_op = found
 
         # 확인
         result = messagebox.askyesno(
@@ -569,33 +1209,228 @@ class RenamMainWindow:
         if not result:
             return
 
-        # 복구 실행
-        success, error_msg = FileOperations.restore_files(
-            folder_path, last_op["before"], last_op["after"]
+        # 압축된 기록은 이때 파일명 리스트 복원
+        saved = self._saved_names(last_op)
+        if saved is None:
+            messagebox.showerror("오류", "Undo 기록이 손상되어 되돌릴 수 없습니다.")
+            return
+        before_names, after_names = saved
+        anchors = self.undo_manager.get_anchors(last_op)
+
+        # 복구 실행 (백그라운드 스레드 - 큰 폴더에서도 UI 가 멈추지 않음)
+        task = BackgroundTask(
+            lambda progress, cancel_event: FileOperations.restore_files(
+                folder_path, before_names, after_names, anchors, progress, cancel_event,
+                workers=FileOperations.PIPELINE_WORKERS
+            ),
+            name=folder_name
         )
+        self.running_tasks[folder_name] = task
+        self.action_buttons.show_progress()
+        task.start()
+        self._poll_task(task, lambda outcome: self._finish_undo_folder(
+            folder_name, folder_path, last_op_index, before_names, after_names, outcome
+        ))
+
+    def _finish_undo_folder(self, folder_name: str, folder_path: Path, operation_id: str,
+                            before_names: List[str], after_names: List[str], result: Tuple[bool, str]):
+        """
+        되돌리기 완료 처리 (UI 스레드)
 
+        Args:
+            folder_name: 폴더(탭) 이름
+            folder_path: 폴더 경로
+            operation_id: 되돌린 기록 ID
+            before_names: 되돌린 원래 파일명 리스트
+            after_names: 되돌리기 전 파일명 리스트
+            result: restore_files 결과 (성공 여부, 오류 메시지)
+        """
+        success, error_msg = result
         if not success:
             messagebox.showerror("오류", error_msg)
             return
 
-        # 해당 작업만 로그에서 제거
-        operations.pop(last_op_index)
-        self.undo_manager._save_logs(operations)
+        # 해당 작업만 로그에서 제거 (그룹 기록이면 이 폴더 항목만, 실행 중 다른 기록이 추가되어도 ID 는 그대로)
+        self.undo_manager.remove_operation(operation_id, [folder_path])
 
         # 해당 폴더에 더 이상 작업이 없으면 버튼 비활성화
-        has_more = any(Path(op["folder"]) == folder_path for op in operations)
-        if not has_more:
+        if not self.undo_manager.has_undo(folder_path):
             if folder_name in self.tab_data:
                 # 하위 폴더 모드
                 self.folder_list.disable_undo(folder_name)
             else:
                 # 단일 폴더 모드
                 self.action_buttons.disable_undo()
+        self._update_bottom_undo_state()
 
         messagebox.showinfo("완료", f"'{folder_name}' 폴더의 파일명이 복구되었습니다.")
 
-        # 해당 폴더 재스캔
-        self._rescan_folder(folder_name)
+        # 복구한 이름을 메모리 모델에 반영 (재스캔 생략)
+        self._apply_restored_names(folder_name, before_names, after_names)
+
+    def _undo_folder_to(self, folder_name: str, folder_path: Path, timestamp: str):
+        """
+        특정 시점 이후의 작업을 한 번에 되돌리기 (작업들을 순 변경 하나로 합성해 한 번만 실행)
+
+        Args:
+            folder_name: 폴더(탭) 이름
+            folder_path: 폴더 경로
+            timestamp: 되돌릴 가장 오래된 작업의 시각 (이 작업 포함)
+        """
+        if self._is_busy(folder_name):
+            return
+
+        operations = self.undo_manager.operations_since(folder_path, timestamp)
+        if not operations:
+            return
+        saved = [self._saved_names(member) for _, member in operations]
+        if None in saved:
+            messagebox.showerror("오류", "Undo 기록이 손상되어 되돌릴 수 없습니다.")
+            return
+        try:
+            before_names, after_names = UndoManager.compose(saved)
+            # 기록 후 다른 프로그램이 바꾼 이름도 찾도록 inode 기준을 합성 결과 순서로 맞춤
+            anchors = UndoManager.compose_anchors(
+                saved, [self.undo_manager.get_anchors(member) for _, member in operations], after_names
+            )
+        except ValueError as e:
+            messagebox.showerror("오류", f"기록을 합칠 수 없습니다:\n{str(e)}")
+            return
+
+        result = messagebox.askyesno(
+            "확인",
+            f"'{folder_name}' 폴더의 작업 {len(operations)}개를 되돌리시겠습니까?\n"
+            f"시간: {timestamp} 이후\n"
+            f"이름이 바뀌는 파일: {len(after_names)}개"
+        )
+        if not result:
+            return
+
+        task = BackgroundTask(
+            lambda progress, cancel_event: FileOperations.restore_files(
+                folder_path, before_names, after_names, anchors, progress, cancel_event,
+                workers=FileOperations.PIPELINE_WORKERS
+            ),
+            name=folder_name
+        )
+        self.running_tasks[folder_name] = task
+        self.action_buttons.show_progress()
+        task.start()
+        self._poll_task(task, lambda outcome: self._finish_undo_folder_to(
+            folder_name, folder_path, [operation_id for operation_id, _ in operations],
+            before_names, after_names, outcome
+        ))
+
+    def _finish_undo_folder_to(self, folder_name: str, folder_path: Path, operation_ids: List[str],
+                               before_names: List[str], after_names: List[str], result: Tuple[bool, str]):
+        """
+        여러 작업 되돌리기 완료 처리 (UI 스레드)
+
+        Args:
+            folder_name: 폴더(탭) 이름
+            folder_path: 폴더 경로
+            operation_ids: 되돌린 기록 ID 리스트
+            before_names: 되돌린 원래 파일명 리스트
+            after_names: 되돌리기 전 파일명 리스트
+            result: restore_files 결과 (성공 여부, 오류 메시지)
+        """
+        success, error_msg = result
+        if not success:
+            messagebox.showerror("오류", error_msg)
+            return
+
+        # 되돌린 작업만 로그에서 제거 (그룹 기록이면 이 폴더 항목만)
+        for operation_id in operation_ids:
+            self.undo_manager.remove_operation(operation_id, [folder_path])
+
+        if not self.undo_manager.has_undo(folder_path):
+            if folder_name in self.tab_data:
+                self.folder_list.disable_undo(folder_name)
+            else:
+                self.action_buttons.disable_undo()
+        self._update_bottom_undo_state()
+
+        messagebox.showinfo("완료", f"'{folder_name}' 폴더의 작업 {len(operation_ids)}개를 되돌렸습니다.")
+
+        # 복구한 이름을 메모리 모델에 반영 (재스캔 생략)
+        self._apply_restored_names(folder_name, before_names, after_names)
+
+    def _saved_names(self, member: Dict) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Undo 기록 항목의 파일명 리스트 복원
+
+        Args:
+            member: 폴더 항목
+
+        Returns:
+            (변경 전 파일명 리스트, 변경 후 파일명 리스트) 또는 None (기록 손상)
+        """
+        try:
+            return self.undo_manager.get_names(member)
+        except ValueError:
+            return None
+
+    def _matches_disk(self, folder_path: Path, file_items: List[FileItem]) -> bool:
+        """
+        목록의 파일이 모두 디스크에 있는지 확인 (디렉토리 목록 1회 조회)
+
+        Args:
+            folder_path: 폴더 경로
+            file_items: 파일 아이템 리스트
+
+        Returns:
+            모두 있으면 True (조회 실패 시 False)
+        """
+        try:
+            report = FileOperations.verify_folder(folder_path, [item.original_name for item in file_items])
+        except OSError:
+            return False
+        return not report.missing
+
+    def _refresh_renamed_folder(self, folder_name: str, folder_path: Path, stamp: Optional[int]):
+        """
+        이름 변경 후 목록 갱신 (아이템은 실행한 계획대로 이미 갱신되어 있음)
+
+        변경 직후와 지금의 디렉토리 수정 시각이 같으면 다른 프로그램의 변경이 없으므로
+        정렬만 다시 적용하고, 다르면 재스캔합니다.
+
+        Args:
+            folder_name: 폴더(탭) 이름
+            folder_path: 폴더 경로
+            stamp: 변경 직후 폴더 상태 (FileOperations.folder_stamp)
+        """
+        if stamp is None or FileOperations.folder_stamp(folder_path) != stamp:
+            self._rescan_folder(folder_name)
+            return
+        if folder_name not in self.tab_data or self.current_tab == folder_name:
+            # 현재 보고 있는 목록이면 정렬 규칙 재적용 (바뀐 이름 기준)
+            self._apply_sort()
+
+    def _apply_restored_names(self, folder_name: str, before_names: List[str],
+                              after_names: List[str]):
+        """
+        되돌리기 결과를 메모리 모델에 반영 (모델과 기록이 맞지 않으면 재스캔)
+
+        Args:
+            folder_name: 폴더(탭) 이름
+            before_names: 복구된 파일명 리스트
+            after_names: 복구 전 파일명 리스트
+        """
+        file_items = self.tab_data[folder_name]['file_items'] if folder_name in self.tab_data else self.file_items
+        restored = dict(zip(after_names, before_names))
+        matched = 0
+        for item in file_items:
+            name = restored.get(item.original_name)
+            if name is not None:
+                item.set_name(name)
+                matched += 1
+
+        if matched != len(restored):
+            # 목록에 없던 파일이 복구됨 (스캔 이후 바뀐 폴더)
+            self._rescan_folder(folder_name)
+            return
+        if folder_name not in self.tab_data or self.current_tab == folder_name:
+            self._apply_sort()
 
     def _rescan_folder(self, folder_name: str):
         """특정 폴더 재스캔"""
@@ -613,9 +1448,7 @@ class RenamMainWindow:
 
                 # 되돌리기 버튼 상태 업데이트
                 folder_path = self.current_folder / folder_name
-                operations = self.undo_manager.get_all_operations()
-                has_undo = any(Path(op["folder"]) == folder_path for op in operations)
-                if has_undo:
+                if self.undo_manager.has_undo(folder_path):
                     self.folder_list.enable_undo(folder_name)
                 else:
                     self.folder_list.disable_undo(folder_name)
@@ -626,6 +1459,28 @@ class RenamMainWindow:
             # 단일 폴더 모드
             self._scan_and_load_files()
 
+    def _on_quit(self):
+        """종료 (진행 중인 작업은 취소하고 되돌린 뒤 종료)"""
+        if self.running_tasks:
+            if self.quitting:
+                return
+            if not messagebox.askyesno("확인", "파일명 변경이 진행 중입니다.\n"
+                                               "작업을 취소(되돌리기)하고 종료하시겠습니까?"):
+                return
+            self.quitting = True
+            self._on_cancel()
+            # 작업 스레드가 되돌리기를 마칠 때까지 UI 스레드를 막지 않고 기다림
+            self._quit_when_idle()
+            return
+        self.root.quit()
+
+    def _quit_when_idle(self):
+        """실행 중인 작업이 모두 끝나면 종료 (Tk after 로 반복 확인 - 완료 처리는 _poll_task 가 담당)"""
+        if self.running_tasks:
+            self.root.after(self.POLL_INTERVAL_MS, self._quit_when_idle)
+            return
+        self.root.quit()
+
     def _on_execute_all(self):
         """하단 변경 버튼 - 현재 선택된 폴더 또는 단일 폴더 변경"""
         # 하위 폴더가 있는지 확인
@@ -657,9 +1512,52 @@ class RenamMainWindow:
             messagebox.showwarning("경고", "폴더를 선택해주세요.")
             return
 
+        # 현재 탭의 마지막 작업이 일괄 변경 그룹이면 그룹 전체 되돌리기 선택 가능
+        found = self.undo_manager.last_operation(self.current_folder / self.current_tab)
+        group = self.undo_manager.find_last_group(self.current_folder)
+        if found and group and found[0] == group[0] and len(group[1]["group"]) > 1:
+            answer = messagebox.askyesnocancel(
+                "되돌리기",
+                f"이 폴더의 마지막 작업은 {len(group[1]['group'])}개 폴더 일괄 변경입니다.\n"
+                f"시간: {group[1]['timestamp']}\n\n"
+                "예: 일괄 변경 전체 되돌리기\n"
+                "아니오: 현재 폴더만 되돌리기\n"
+                "취소: 작업 중단"
+            )
+            if answer is None:
+                return
+            if answer:
+                self._undo_group(self.current_folder, group[1])
+                return
+
         # 현재 탭의 폴더만 되돌리기
         self._undo_folder(self.current_tab)
 
+    def _on_undo_history(self):
+        """하단 기록 버튼 - 현재 폴더의 변경 기록에서 되돌릴 시점 선택"""
+        if self.subfolders and self.tab_data:
+            if not self.current_tab:
+                messagebox.showwarning("경고", "폴더를 선택해주세요.")
+                return
+            folder_name = self.current_tab
+            folder_path = self.current_folder / folder_name
+        elif self.current_folder:
+            folder_name = self.current_folder.name
+            folder_path = self.current_folder
+        else:
+            return
+
+        history = self.undo_manager.history(folder_path)
+        if not history:
+            messagebox.showinfo("알림", f"'{folder_name}' 폴더의 되돌릴 작업이 없습니다.")
+            return
+
+        entries = [(member["timestamp"], self.undo_manager.count_files(member)) for _, member in history]
+        UndoHistoryDialog(
+            self.root, folder_name, entries,
+            on_select=lambda timestamp: self._undo_folder_to(folder_name, folder_path, timestamp)
+        )
+
     def run(self):
         """애플리케이션 실행"""
         self.root.mainloop()
@@ -0,0 +1,225 @@
+"""
+Preview Viewport Module
+미리보기 가상 스크롤 계산 (단일 책임: 화면 높이/스크롤 위치로 슬롯 수와 슬롯별 표시 내용 결정)
+"""
+
+from typing import AbstractSet, List, Optional, Sequence, Tuple
+
+from models.file_item import FileItem
+
+# 슬롯 하나가 보여주는 내용: (원본 파일명, 새 파일명, 변경 여부, 배경 종류)
+RowState = Tuple[str, str, bool, str]
+
+
+class PreviewViewport:
+    """
+    미리보기 가상 스크롤 계산 클래스
+    책임: Tk 위젯 없이 슬롯 수, 스크롤 위치 보정, 슬롯별 표시 내용, 다시 그릴 슬롯 계산
+
+    미리보기는 화면 높이만큼의 슬롯만 만들고 슬롯 k 에 파일 top + k 를 보여줍니다.
+    PreviewTable(CTkLabel 슬롯)과 PreviewTree(Treeview 항목)가 같은 계산을 씁니다.
+    """
+
+    # 행 배경 종류 (PreviewTable 은 표 스타일 색으로, PreviewTree 는 태그 이름으로 사용)
+    BACKGROUND_EVEN = "even"
+    BACKGROUND_ODD = "odd"
+    BACKGROUND_SELECTED = "selected"
+    # 새 파일명이 원본과 다른 행의 태그 (PreviewTree)
+    TAG_CHANGED = "changed"
+
+    @staticmethod
+    def visible_rows(height: int, row_height: int, header: int = 0) -> int:
+        """
+        화면에 완전히 보이는 행 수
+
+        Args:
+            height: 목록 영역 높이 (px)
+            row_height: 행 높이 (px)
+            header: 목록 영역 안의 헤더 높이 (px)
+
+        Returns:
+            행 수 (최소 1)
+        """
+        return max(1, (height - header) // row_height)
+
+    @staticmethod
+    def slot_count(height: int, row_height: int, header: int = 0) -> int:
+        """
+        필요한 슬롯 수 (부분적으로 보이는 마지막 행 포함)
+
+        Args:
+            height: 목록 영역 높이 (px)
+            row_height: 행 높이 (px)
+            header: 목록 영역 안의 헤더 높이 (px)
+
+        Returns:
+            슬롯 수 (최소 1)
+        """
+        return max(1, (height - header) // row_height + 1)
+
+    @staticmethod
+    def clamp_top(top: int, count: int, visible: int) -> int:
+        """
+        스크롤 위치를 0 ~ (파일 수 - 보이는 행 수) 범위로 제한
+
+        Args:
+            top: 첫 번째 슬롯에 보일 파일 인덱스
+            count: 전체 파일 수
+            visible: 보이는 행 수
+
+        Returns:
+            보정한 위치
+        """
+        return max(0, min(top, count - visible))
+
+    @staticmethod
+    def follow(index: int, top: int, visible: int) -> int:
+        """
+        인덱스가 화면에 보이도록 하는 최소 이동 위치 (see)
+
+        Args:
+            index: 보여야 할 파일 인덱스
+            top: 현재 위치
+            visible: 보이는 행 수
+
+        Returns:
+            새 위치 (이미 보이면 그대로)
+        """
+        if index < top:
+            return index
+        if index >= top + visible:
+            return index - visible + 1
+        return top
+
+    @staticmethod
+    def scroll_target(action: str, value: str, unit: Optional[str], top: int,
+                      count: int, visible: int) -> int:
+        """
+        스크롤바 명령을 새 위치로 변환 (보정 전)
+
+        Args:
+            action: 'moveto' (비율) 또는 'scroll' (단위/페이지)
+            value: 비율 또는 이동 수
+            unit: 'units' / 'pages' (scroll 일 때)
+            top: 현재 위치
+            count: 전체 파일 수
+            visible: 보이는 행 수
+
+        Returns:
+            새 위치
+        """
+        if action == "moveto":
+            return round(float(value) * count)
+        if action == "scroll":
+            step = visible if unit == "pages" else 1
+            return top + int(value) * step
+        return top
+
+    @staticmethod
+    def scrollbar_position(top: int, count: int, visible: int) -> Tuple[float, float]:
+        """
+        스크롤바 위치/크기 (보이는 첫 행, 끝 행) / 전체 파일 수
+
+        Args:
+            top: 현재 위치
+            count: 전체 파일 수
+            visible: 보이는 행 수
+
+        Returns:
+            (시작 비율, 끝 비율)
+        """
+        if count == 0:
+            return (0.0, 1.0)
+        end = min(count, top + visible)
+        return (top / count, end / count)
+
+    @staticmethod
+    def slot_indices(top: int, slots: int, count: int) -> List[Optional[int]]:
+        """
+        슬롯별로 보여줄 파일 인덱스
+
+        Args:
+            top: 첫 번째 슬롯에 보일 파일 인덱스
+            slots: 슬롯 수
+            count: 전체 파일 수
+
+        Returns:
+            슬롯별 파일 인덱스 리스트 (파일이 없는 슬롯은 None - 숨김)
+        """
+        return [top + slot if top + slot < count else None for slot in range(slots)]
+
+    # ==================== 슬롯 내용 ====================
+
+    @staticmethod
+    def row_state(index: int, original: str, new_name: str, selected: bool) -> RowState:
+        """
+        파일 하나를 보여줄 내용
+
+        Args:
+            index: 파일 인덱스 (짝/홀 배경)
+            original: 원본 파일명
+            new_name: 새 파일명
+            selected: 선택 여부
+
+        Returns:
+            (원본 파일명, 새 파일명, 변경 여부, 배경 종류)
+        """
+        if selected:
+            background = PreviewViewport.BACKGROUND_SELECTED
+        else:
+            background = PreviewViewport.BACKGROUND_EVEN if index % 2 == 0 else PreviewViewport.BACKGROUND_ODD
+        return (original, new_name, original != new_name, background)
+
+    @staticmethod
+    def slot_states(top: int, slots: int, items: List[FileItem], new_names: Optional[Sequence[str]],
+                    selected: AbstractSet[int]) -> List[Optional[RowState]]:
+        """
+        슬롯별로 보여줄 내용 (보이는 행의 새 파일명만 계산)
+
+        Args:
+            top: 첫 번째 슬롯에 보일 파일 인덱스
+            slots: 슬롯 수
+            items: 파일 아이템 리스트
+            new_names: 새 파일명 시퀀스 (None 이면 FileItem.new_name)
+            selected: 선택된 파일 인덱스 집합
+
+        Returns:
+            슬롯별 RowState 리스트 (파일이 없는 슬롯은 None - 숨김)
+        """
+        states: List[Optional[RowState]] = []
+        for i in PreviewViewport.slot_indices(top, slots, len(items)):
+            if i is None:
+                states.append(None)
+                continue
+            item = items[i]
+            new_name = new_names[i] if new_names is not None else item.new_name
+            states.append(PreviewViewport.row_state(i, item.original_name, new_name, i in selected))
+        return states
+
+    @staticmethod
+    def dirty_slots(shown: List[Optional[RowState]], states: List[Optional[RowState]]) -> List[int]:
+        """
+        다시 그려야 하는 슬롯 (지금 보여주는 내용과 달라진 슬롯만)
+
+        Args:
+            shown: 슬롯별로 지금 보여주는 내용 (숨긴 슬롯은 None)
+            states: 슬롯별로 보여줄 내용
+
+        Returns:
+            슬롯 번호 리스트
+        """
+        return [slot for slot, (old, new) in enumerate(zip(shown, states)) if old != new]
+
+    @staticmethod
+    def row_tags(state: RowState) -> tuple:
+        """
+        Treeview 행 태그 (배경 태그 1개 + 변경 여부)
+
+        Args:
+            state: 행 내용
+
+        Returns:
+            태그 튜플
+        """
+        background, is_changed = state[3], state[2]
+        return (background, PreviewViewport.TAG_CHANGED) if is_changed else (background,)
@@ -0,0 +1,119 @@
+"""
+Refresh Scheduler Module
+갱신 요청 합치기 (단일 책임: 짧은 시간에 몰린 갱신 요청을 콜백 1회로 묶기)
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class RefreshScheduler:
+    """
+    갱신 예약 클래스
+    책임: 갱신이 필요하다고 표시만 해 두고, Tk 이벤트 루프가 한가할 때(또는 입력이 멈춘 뒤) 한 번만 실행
+
+    요청마다 붙는 증분 정보(changed: 순서가 바뀐 구간, removed: 제거된 위치)는 합쳐서 전달합니다.
+    순서 변경 구간끼리는 구간을 넓혀 합치고, 제거가 섞이면 위치 기준이 달라지므로
+    전체 갱신(changed=None, removed=None)으로 전달합니다.
+
+    widget 은 Tk 의 after / after_idle / after_cancel 을 가진 객체입니다.
+    """
+
+    def __init__(self, widget, callback: Callable[[Optional[Tuple[int, int]], Optional[List[int]]], None]):
+        """
+        Args:
+            widget: 예약에 쓸 Tk 위젯 (보통 루트 윈도우)
+            callback: 갱신 함수 (changed, removed)
+        """
+        self.widget = widget
+        self.callback = callback
+
+        self._timer: Any = None      # 예약된 after / after_idle ID
+        self._immediate = False      # 예약이 after_idle(바로 다음 유휴 시점)인지
+        self._full = False           # 합친 결과가 전체 갱신인지
+        self._changed: Optional[Tuple[int, int]] = None
+        self._removed: Optional[List[int]] = None
+
+    @property
+    def pending(self) -> bool:
+        """실행을 기다리는 갱신이 있는지"""
+        return self._timer is not None
+
+    def request(self, changed: Optional[Tuple[int, int]] = None,
+                removed: Optional[List[int]] = None, delay_ms: int = 0) -> None:
+        """
+        갱신 요청 (이미 예약되어 있으면 증분 정보만 합침)
+
+        Args:
+            changed: 순서가 바뀐 위치 구간 (시작, 끝)
+            removed: 제거된 위치 목록
+            delay_ms: 0 이면 다음 유휴 시점, 아니면 마지막 요청 후 이 시간(ms) 동안 요청이 없을 때 실행
+        """
+        self._merge(changed, removed)
+
+        if delay_ms <= 0:
+            if self._timer is not None and self._immediate:
+                return
+            self._cancel_timer()
+            self._timer = self.widget.after_idle(self._run)
+            self._immediate = True
+            return
+
+        if self._timer is not None and self._immediate:
+            return  # 곧 실행되는 갱신에 이번 요청도 포함됨
+        # 입력이 이어지는 동안에는 실행을 계속 미룸 (debounce)
+        self._cancel_timer()
+        self._timer = self.widget.after(delay_ms, self._run)
+        self._immediate = False
+
+    def flush(self) -> bool:
+        """
+        예약된 갱신을 지금 실행 (최신 상태가 바로 필요할 때)
+
+        Returns:
+            실행했는지 (예약된 갱신이 없으면 False)
+        """
+        if self._timer is None:
+            return False
+        self._cancel_timer()
+        self._run()
+        return True
+
+    def cancel(self) -> None:
+        """예약된 갱신 취소"""
+        self._cancel_timer()
+        self._reset_hints()
+
+    # ==================== 내부 ====================
+
+    def _merge(self, changed: Optional[Tuple[int, int]], removed: Optional[List[int]]) -> None:
+        """증분 정보 합치기 (합칠 수 없으면 전체 갱신)"""
+        if changed is None and removed is None:
+            self._full = True
+        if self._full:
+            self._changed = self._removed = None
+            return
+
+        if self._timer is None:  # 첫 요청
+            self._changed = changed
+            self._removed = list(removed) if removed is not None else None
+        elif removed is None and self._removed is None:
+            self._changed = (min(self._changed[0], changed[0]), max(self._changed[1], changed[1]))
+        else:
+            self._full = True
+            self._changed = self._removed = None
+
+    def _run(self) -> None:
+        self._timer = None
+        changed, removed = self._changed, self._removed
+        self._reset_hints()
+        self.callback(changed, removed)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self.widget.after_cancel(self._timer)
+            self._timer = None
+
+    def _reset_hints(self) -> None:
+        self._full = False
+        self._changed = None
+        self._removed = None
@@ -3,8 +3,16 @@ File Item Data Model
 파일 정보를 담는 데이터 모델 (단일 책임: 데이터 표현)
 """
 
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+
+
+# 파일 동일성 지문: (inode, 크기, 수정 시각 ns)
+Fingerprint = Tuple[int, int, int]
+
+# 이름과 무관한 파일 식별 기준 (Undo 용): (장치 번호, 파일별 inode 리스트)
+Anchors = Tuple[int, List[int]]
 
 
 class FileItem:
@@ -13,12 +21,13 @@ class FileItem:
     책임: 파일 메타데이터 저장 및 접근
     """
 
-    def __init__(self, filepath: Path):
+    def __init__(self, filepath: Path, stat: Optional[os.stat_result] = None):
         """
         파일 아이템 초기화
 
         Args:
             filepath: 파일 경로 (Path 객체)
+            stat: 이미 조회한 파일 정보 (없으면 새로 조회)
         """
         self.original_path = filepath
         self.original_name = filepath.name
@@ -26,7 +35,55 @@ class FileItem:
         self.new_name = ""
         self.order = 0
         self.ext = filepath.suffix.lower()
-        self.stat = filepath.stat()
+        self.stat = stat if stat is not None else filepath.stat()
+        self.fingerprint = FileItem.make_fingerprint(self.stat)  # 스캔 시점 지문 (변경 감지용)
+        self.dimensions: Optional[Tuple[int, int]] = None  # 이미지 크기 (필요할 때만 조회)
+
+    @staticmethod
+    def make_fingerprint(stat: os.stat_result) -> Fingerprint:
+        """
+        파일 정보로 동일성 지문 생성
+
+        이름 변경은 inode/크기/수정 시각을 바꾸지 않으므로 리넴 자신의 변경 후에도 유지됩니다.
+
+        Args:
+            stat: 파일 정보
+
+        Returns:
+            (inode, 크기, 수정 시각 ns)
+        """
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def make_anchors(items: List["FileItem"]) -> Optional[Anchors]:
+        """
+        스캔 시점 정보로 파일 식별 기준 생성 (이름이 바뀌어도 같은 파일을 찾기 위한 값)
+
+        Args:
+            items: 파일 아이템 리스트 (같은 폴더)
+
+        Returns:
+            (장치 번호, 파일별 inode 리스트) 또는 None (inode 를 알 수 없는 플랫폼/파일 시스템)
+        """
+        if not items:
+            return None
+        device = items[0].stat.st_dev
+        inodes = [item.fingerprint[0] for item in items]
+        if not all(inodes) or any(item.stat.st_dev != device for item in items):
+            return None
+        return (device, inodes)
+
+    def set_name(self, name: str) -> None:
+        """
+        디스크에서 이름이 바뀐 뒤 아이템 정보 갱신 (지문/이미지 크기 등 캐시는 유지)
+
+        Args:
+            name: 새 파일명 (같은 폴더)
+        """
+        self.original_path = self.original_path.parent / name
+        self.original_name = name
+        self.display_name = name
+        self.ext = self.original_path.suffix.lower()
 
     def to_dict(self) -> Dict:
         """
@@ -5,6 +5,8 @@ Renam 핵심 로직 테스트 스크립트 (리팩토링 버전)
 클린코드 원칙 적용 후 모듈별 테스트
 """
 
+import struct
+import tempfile
 from pathlib import Path
 from typing import List
 
@@ -15,6 +17,16 @@ from core.file_operations import FileOperations
 from core.undo_manager import UndoManager
 
 
+def _make_files(folder: Path, names: List[str]) -> List[FileItem]:
+    """테스트용 빈 이미지 파일 생성 후 FileItem 리스트 반환"""
+    items = []
+    for name in names:
+        path = folder / name
+        path.write_bytes(b"")
+        items.append(FileItem(path))
+    return items
+
+
 def test_file_operations():
     """파일 작업 모듈 테스트"""
     print("=" * 60)
@@ -127,6 +139,1271 @@ def test_name_generator():
     print(f"   {has_dup}: {'❌ 중복 있음' if NameGenerator.check_duplicates(has_dup) else '✅ 중복 없음'}")
 
 
+def test_name_template():
+    """파일명 템플릿(토큰) 모듈 테스트"""
+    print("\n" + "=" * 60)
+    print("🧩 NameTemplate 모듈 테스트")
+    print("=" * 60)
+
+    from core.name_rules import NameRules
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp) / "trip"
+        folder.mkdir()
+        items = _make_files(folder, ["a.jpg", "b.png", "c.jpg"])
+
+        # PNG 헤더 (IHDR: 640x480)
+        png = b'\x89PNG\r\n\x1a\n' + struct.pack('>I', 13) + b'IHDR' + struct.pack('>II', 640, 480)
+        (folder / "b.png").write_bytes(png)
+
+        cases = [
+            ("{parent}_{000}", ["trip_001.jpg", "trip_002.png", "trip_003.jpg"]),
+            ("{orig}-{n:10:5}", ["a-10.jpg", "b-15.png", "c-20.jpg"]),
+            ("{ext}_{gn}", ["jpg_1.jpg", "png_1.png", "jpg_2.jpg"]),
+        ]
+        for pattern, expected in cases:
+            names = NameGenerator.compile(pattern).render_all(items)
+            print(f"   '{pattern}': {names} {'✅' if names == expected else '❌'}")
+            assert names == expected
+
+        # 연속 번호 (앞 폴더에 5개 파일이 있다고 가정)
+        names = NameGenerator.compile("{n}").render_all(items, offset=5)
+        print(f"   연속 번호 offset=5: {names}")
+        assert names == ["6.jpg", "7.png", "8.jpg"]
+
+        # 이미지 크기 토큰은 사용할 때만 조회
+        template = NameGenerator.compile("{w}x{h}_{n}")
+        assert "dimensions" in template.needs
+        names = template.render_all(items)
+        print(f"   크기 토큰: {names}")
+        assert names[1] == "640x480_2.png"
+        assert NameGenerator.compile("{n}").needs == set()
+
+        # 알 수 없는 토큰은 그대로 유지되고 검증에서 무효 처리
+        assert NameGenerator.generate(3, "x_{foo}_{n}", ".jpg") == "x_{foo}_3.jpg"
+        assert not NameGenerator.validate_pattern("{foo}_{n}")
+        assert NameGenerator.validate_pattern("{orig}_edit")
+        print("   ✅ 토큰 검증 완료")
+
+        # 경로 구분자를 만드는 패턴은 하위 폴더 이동이 되므로 무효
+        assert not NameGenerator.validate_pattern("{date:%Y/%m}_{n}")
+        assert not NameGenerator.validate_pattern("a/{n}")
+        assert NameGenerator.validate_pattern("{date:%Y-%m}_{n}")
+        assert NameRules.invalid_reason("a/b.jpg") == "사용할 수 없는 문자 '/'"
+        assert NameRules.invalid_reason("") == "빈 이름"
+        assert NameRules.find_invalid(["a.jpg", "..", "b\0.jpg"]) == [(1, "빈 이름"), (2, "사용할 수 없는 문자 NUL")]
+
+        # 검증을 거치지 않은 이름도 실행 직전에 막고, 파일은 그대로 둠
+        items[0].new_name = "a/b.jpg"
+        items[1].new_name = "x.png"
+        success, msg = FileOperations.rename_files(folder, items)
+        print(f"   구분자 포함 이름 거부: {msg.splitlines()[-1].strip()}")
+        assert not success and "a.jpg → 'a/b.jpg'" in msg
+        assert sorted(p.name for p in folder.iterdir()) == ["a.jpg", "b.png", "c.jpg"]
+        print("   ✅ 경로 구분자 거부 완료")
+
+
+def test_name_substitution():
+    """정규식 찾아 바꾸기(치환식) 모듈 테스트"""
+    print("\n" + "=" * 60)
+    print("🔁 NameSubstitution 모듈 테스트")
+    print("=" * 60)
+
+    from unittest import mock
+
+    with tempfile.TemporaryDirectory() as tmp:
+        items = _make_files(Path(tmp), ["shot_final_v2.JPG", "IMG_7.png", "2024-01-31 trip.jpg"])
+
+        # (치환식, 확인할 아이템 인덱스, 기대 결과)
+        cases = [
+            (r"s/_final_v\d+//g", 0, "shot.JPG"),
+            (r"s/IMG_(\d+)/img_\g<1:03>/", 1, "img_007.png"),
+            (r"s/(\d{4})-(\d\d)-(\d\d)/\3.\2.\1/", 2, "31.01.2024 trip.jpg"),
+            (r"s/^(\w)(\w+)/\U\1\E\2/", 0, "Shot_final_v2.JPG"),
+        ]
+        for expression, index, expected in cases:
+            result = NameGenerator.compile(expression).render_all(items)[index]
+            print(f"   {expression}: {result} {'✅' if result == expected else '❌'}")
+            assert result == expected
+
+        # 바꾸기 문자열만 바뀌면 매칭 결과를 재사용
+        first = NameGenerator.compile(r"s/(\d+)/<\1>/g")
+        second = NameGenerator.compile(r"s/(\d+)/[\1]/g")
+        assert first._matcher is second._matcher
+        assert second.render_all(items)[1] == "IMG_[7].png"
+
+        # 잘못된 치환식은 무효 처리되고 원본 이름 유지
+        assert not NameGenerator.validate_pattern(r"s/(/x/")
+        assert not NameGenerator.validate_pattern(r"s/a/\2/")
+        assert NameGenerator.compile(r"s/(/x/").render_all(items)[0] == "shot_final_v2.JPG"
+        # 's_' 로 시작하는 일반 패턴은 치환식이 아님
+        assert NameGenerator.validate_pattern("s_{n}")
+        # 바꾸기 결과에 '/' 가 들어가면 하위 폴더 이동이 되므로 무효
+        assert not NameGenerator.validate_pattern(r"s/_/\//")
+        assert not NameGenerator.validate_pattern("s#_#/#")
+        # 구분자 세 개를 갖춘 전체 형식만 치환식 (s 로 시작하는 템플릿은 그대로)
+        from core.name_substitution import NameSubstitution, _StemMatcher
+        for pattern in ("s#{n}", "s_{000}", "s|{n}|x", "s#a#b#{n}"):
+            assert not NameSubstitution.is_expression(pattern), pattern
+        assert NameGenerator.compile("s#{n}").render_all(items)[1] == "s#2.png"
+        assert NameSubstitution.is_expression(r"s/a\/b/c/") and NameSubstitution.is_expression("s|a|b|gi")
+        assert not NameGenerator.validate_pattern("s/a/b/x")  # 형식은 치환식, 플래그 오류
+
+        # 찾아 바꾸기 입력란 <-> 치환식 왕복 (구분자 앞/끝 역슬래시 포함)
+        for find, replace in [("a/b", "x"), ("a\\/b", "c/"), ("end\\", "\\"), ("\\d+", "\\1\\\\"),
+                              ("", "")]:
+            expression = f"s/{NameSubstitution.escape(find)}/{NameSubstitution.escape(replace)}/g"
+            parts = NameSubstitution.split(expression)
+            assert parts[2] == "g", expression
+            assert (NameSubstitution.unescape(parts[0]), NameSubstitution.unescape(parts[1])) == (find, replace)
+        assert NameSubstitution.escape("\\d+") == "\\d+"  # 그 밖의 이스케이프는 그대로
+
+        # 매칭 결과 캐시는 최근 사용 순으로 크기 제한
+        matcher = _StemMatcher("a", "")
+        with mock.patch.object(_StemMatcher, "CACHE_SIZE", 2):
+            for stem in ("a1", "a2", "a1", "a3"):
+                matcher.split(stem)
+        assert list(matcher._cache) == ["a1", "a3"]
+        print("   ✅ 치환식 검증 완료")
+
+
+def test_name_view():
+    """새 파일명 지연 계산 뷰 테스트"""
+    print("\n" + "=" * 60)
+    print("👁️  NameView 모듈 테스트")
+    print("=" * 60)
+
+    from core.name_view import NameView
+
+    with tempfile.TemporaryDirectory() as tmp:
+        items = _make_files(Path(tmp), [f"{i}.jpg" for i in range(100)])
+        view = NameView(NameGenerator.compile("IMG_{000}"), items, offset=10)
+
+        # 접근한 행만 계산
+        assert view[0] == "IMG_011.jpg" and view[99] == "IMG_110.jpg"
+        assert view.window(5, 7) == ["IMG_016.jpg", "IMG_017.jpg"]
+        assert len(view._cache) == 4 and items[0].new_name == ""
+        print(f"   지연 계산: {len(view._cache)}/{len(view)}개 행만 계산 ✅")
+
+        # 실행 시 전체 계산 + FileItem.new_name 반영
+        names = view.materialize()
+        assert names[-1] == items[-1].new_name == "IMG_110.jpg"
+        print(f"   전체 계산: {len(names)}개 ✅")
+
+
+def test_collision_index():
+    """디스크 이름 충돌 인덱스 테스트"""
+    print("\n" + "=" * 60)
+    print("🧱 CollisionIndex 모듈 테스트")
+    print("=" * 60)
+
+    from core.collision_index import CollisionIndex
+
+    # 배치 밖 파일: notes.txt, 2.jpg (미리보기에서 제거됨)
+    index = CollisionIndex(["a.jpg", "b.jpg", "c.jpg", "2.jpg", "notes.txt"], case_insensitive=True)
+    sources = ["a.jpg", "b.jpg", "c.jpg"]
+    targets = ["1.jpg", "2.jpg", "NOTES.TXT"]
+
+    result = index.resolve(sources, targets)
+    print(f"   충돌 검출: {result.conflicts}")
+    assert result.conflicts == [1, 2]
+
+    result = index.resolve(sources, targets, CollisionIndex.STRATEGY_SUFFIX)
+    print(f"   자동 번호: {result.targets}")
+    assert result.targets == ["1.jpg", "2 (2).jpg", "NOTES (2).TXT"]
+
+    result = index.resolve(sources, targets, CollisionIndex.STRATEGY_SKIP)
+    print(f"   건너뛰기: {result.targets}")
+    assert result.targets == ["1.jpg", "b.jpg", "c.jpg"] and result.skipped == [1, 2]
+
+    # 배치 안 원본 이름(순환 이동)과 대소문자만 바뀌는 경우는 충돌 아님
+    assert not index.resolve(["a.jpg", "b.jpg"], ["b.jpg", "A.JPG"]).has_conflicts
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        items = _make_files(folder, ["a.jpg", "b.jpg"])
+        (folder / "1.jpg.bak").write_bytes(b"")
+        (folder / "2.jpg").write_bytes(b"")  # 배치 밖 이미지
+        items[0].new_name, items[1].new_name = "1.jpg", "2.jpg"
+
+        success, msg = FileOperations.rename_files(folder, items)
+        print(f"   충돌 시 중단: {msg}")
+        assert not success and (folder / "a.jpg").exists()
+
+        success, _ = FileOperations.rename_files(folder, items, CollisionIndex.STRATEGY_SUFFIX)
+        assert success and (folder / "2 (2).jpg").exists() and (folder / "2.jpg").exists()
+        print("   ✅ 충돌 해결 후 변경 완료")
+
+
+def test_duplicate_tracker():
+    """새 파일명 중복 증분 추적 테스트"""
+    print("\n" + "=" * 60)
+    print("🔁 DuplicateTracker 모듈 테스트")
+    print("=" * 60)
+
+    from core.duplicate_tracker import DuplicateTracker
+
+    # 구조적으로 중복이 불가능한 패턴은 이름 계산 없이 판정
+    for pattern, expected in [("{n}", True), ("IMG_{000}", True), ("{parent}_{n}_{orig}", True),
+                              ("{n}{n}", False), ("{orig}_{n}", False), ("{n:1:0}", False),
+                              ("{gn}", False), ("{n}1", False)]:
+        unique = NameGenerator.compile(pattern).unique_by_construction
+        print(f"   {pattern:22s} → 중복 불가: {unique}")
+        assert unique == expected, pattern
+    assert not NameGenerator.compile("s/a/b/").unique_by_construction
+
+    tracker = DuplicateTracker()
+    tracker.reset(["a.jpg", "b.jpg", "c.jpg"])
+    assert not tracker.has_duplicates
+
+    tracker.update(1, ["a.jpg"])
+    print(f"   구간 갱신 후 중복: {tracker.duplicates()}")
+    assert tracker.has_duplicates and tracker.duplicates() == ["a.jpg"]
+
+    tracker.remove([0])
+    assert not tracker.has_duplicates and len(tracker) == 2
+
+    tracker.update(0, ["c.jpg", "c.jpg"])
+    assert tracker.duplicates() == ["c.jpg"]
+    tracker.update(1, ["d.jpg"])
+    assert not tracker.has_duplicates
+    print("   ✅ 이동/제거/변경 증분 반영")
+
+    # 대소문자를 구분하지 않는 볼륨: 디스크 충돌 검사(CollisionIndex)와 같은 키로 중복 판정
+    tracker = DuplicateTracker(case_insensitive=True)
+    tracker.reset(["IMG.jpg", "b.jpg", "img.JPG"])
+    assert tracker.duplicates() == ["IMG.jpg"]
+    tracker.update(2, ["c.jpg"])
+    assert not tracker.has_duplicates
+    tracker = DuplicateTracker(case_insensitive=False)
+    tracker.reset(["IMG.jpg", "img.JPG"])
+    assert not tracker.has_duplicates
+    assert NameGenerator.check_duplicates(["A.jpg", "a.jpg"], case_insensitive=True)
+    assert not NameGenerator.check_duplicates(["A.jpg", "a.jpg"], case_insensitive=False)
+    print("   ✅ 대소문자 무시 볼륨 중복 판정")
+
+
+def test_rename_planner():
+    """최소 이름 변경 계획 테스트"""
+    print("\n" + "=" * 60)
+    print("🧭 RenamePlanner 모듈 테스트")
+    print("=" * 60)
+
+    from core.rename_planner import RenamePlanner
+
+    # 체인: c→d, b→c, a→b (끝에서부터 직접 변경), 고정점 x 는 건너뜀
+    plan = RenamePlanner.plan(["a", "b", "c", "x"], ["b", "c", "d", "x"])
+    print(f"   체인: {plan.chains}")
+    assert plan.chains == [[("c", "d"), ("b", "c"), ("a", "b")]] and plan.unchanged == 1
+
+    # 순환: 임시 이름 하나로 끊음 (3개 순환 → 4단계)
+    plan = RenamePlanner.plan(["1.jpg", "2.jpg", "3.jpg"], ["2.jpg", "3.jpg", "1.jpg"])
+    print(f"   순환: {plan.steps}")
+    assert len(plan) == 4 and RenamePlanner.is_temp_name(plan.steps[0][1])
+
+    # 대소문자만 바뀌는 변경은 대소문자 무시 볼륨에서도 직접 변경
+    plan = RenamePlanner.plan(["a.jpg"], ["A.jpg"], key=str.casefold)
+    assert plan.steps == [("a.jpg", "A.jpg")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        items = _make_files(folder, ["1.jpg", "2.jpg", "3.jpg", "keep.jpg"])
+        for item, name in zip(items, ["2.jpg", "3.jpg", "1.jpg", "keep.jpg"]):
+            item.original_path.write_bytes(item.original_name.encode())
+            item.new_name = name
+        success, msg = FileOperations.rename_files(folder, items)
+        assert success, msg
+        assert sorted(p.name for p in folder.iterdir()) == ["1.jpg", "2.jpg", "3.jpg", "keep.jpg"]
+        assert (folder / "2.jpg").read_bytes() == b"1.jpg"
+
+        # 되돌리기도 같은 계획으로 (순환 포함)
+        success, msg = FileOperations.restore_files(
+            folder, ["1.jpg", "2.jpg", "3.jpg"], ["2.jpg", "3.jpg", "1.jpg"]
+        )
+        assert success, msg
+        assert (folder / "1.jpg").read_bytes() == b"1.jpg"
+        print("   ✅ 순환 변경 및 복구 완료")
+
+
+def test_rename_journal():
+    """선기록 저널 및 중단 작업 복구 테스트"""
+    print("\n" + "=" * 60)
+    print("📒 RenameJournal 모듈 테스트")
+    print("=" * 60)
+
+    from core.rename_journal import RenameJournal
+    from core.rename_planner import RenamePlanner
+    from core.rename_engine import RenameEngine
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp) / "photos"
+        folder.mkdir()
+        journal = RenameJournal(Path(tmp) / "journal", RenameJournal.DURABILITY_DIRECTORY)
+
+        # 정상 실행: 완료 기록 후 finish 로 저널 삭제
+        items = _make_files(folder, ["a.jpg", "b.jpg"])
+        items[0].new_name, items[1].new_name = "b.jpg", "a.jpg"
+        success, msg = FileOperations.rename_files(folder, items, journal=journal)
+        assert success, msg
+        journal.finish(folder)
+        assert journal.pending() == []
+
+        # 순환 중간(임시 이름 상태)에서 중단된 작업 → 남은 단계 실행
+        before, after = ["a.jpg", "b.jpg"], ["b.jpg", "a.jpg"]
+        plan = RenamePlanner.plan(before, after)
+        entry = journal.begin(folder, before, after, plan)
+        source, target = plan.steps[0]
+        (folder / source).rename(folder / target)  # 체크포인트 기록 전에 중단
+
+        # 소유 인스턴스가 살아 있는 동안에는 다른 인스턴스가 건너뜀
+        entry.close()
+        assert RenameJournal(Path(tmp) / "journal").pending() == []
+        entry.release()  # 프로세스 종료와 같음 (잠금 해제, 저널 유지)
+
+        restarted = RenameJournal(Path(tmp) / "journal")
+        pending = restarted.pending()
+        # 복구 중인 저널도 또 다른 인스턴스는 건너뜀
+        assert RenameJournal(Path(tmp) / "journal").pending() == []
+        assert len(pending) == 1 and not pending[0].committed
+        status, _ = FileOperations.recover_journal(pending[0])
+        print(f"   임시 이름에서 중단 → {status}")
+        assert status == RenameJournal.ROLLED_FORWARD
+        assert sorted(p.name for p in folder.iterdir()) == ["a.jpg", "b.jpg"]
+        pending[0].discard()
+        assert sorted(p.name for p in (Path(tmp) / "journal").iterdir()) == []
+
+        # 남은 단계의 원본이 사라졌으면 실행된 단계를 되돌림
+        before, after = ["a.jpg", "b.jpg"], ["c.jpg", "d.jpg"]
+        plan = RenamePlanner.plan(before, after)
+        entry = journal.begin(folder, before, after, plan)
+        with RenameEngine.open(folder) as engine:
+            FileOperations._rename_steps(engine, plan.steps[:1])
+        entry.mark_done(0)
+        entry.release()
+        remaining_source = plan.steps[1][0]
+        (folder / remaining_source).rename(folder / "moved_elsewhere.jpg")
+
+        recovered = RenameJournal(Path(tmp) / "journal").pending()[0]
+        status, _ = FileOperations.recover_journal(recovered)
+        print(f"   원본 유실 → {status}")
+        assert status == RenameJournal.ROLLED_BACK
+        recovered.discard()
+        assert (folder / plan.steps[0][0]).exists()
+        print("   ✅ 중단 작업 복구 완료")
+
+        # batch 모드: 계획 기록 후 + 체크포인트 묶음마다 fsync (none 모드는 fsync 없음)
+        import os
+        from unittest import mock
+        before, after = ["x.jpg", "y.jpg", "z.jpg"], ["1.jpg", "2.jpg", "3.jpg"]
+        plan = RenamePlanner.plan(before, after)
+        for durability, expected in ((RenameJournal.DURABILITY_BATCH, 1 + 2), (RenameJournal.DURABILITY_NONE, 0)):
+            batch_journal = RenameJournal(Path(tmp) / "journal", durability)
+            with mock.patch.object(RenameJournal, "CHECKPOINT_SYNC_STEPS", 2), \
+                    mock.patch.object(os, "fsync") as fsync:
+                entry = batch_journal.begin(folder, before, after, plan)
+                for step in range(4):
+                    entry.mark_done(step % 3)
+            assert fsync.call_count == expected, (durability, fsync.call_count)
+            batch_journal.finish(folder)
+        print("   ✅ 체크포인트 묶음 fsync 완료")
+
+        # 실행 후 실패(검증 오류): 완료 대기 목록에서 빠지고 잠금이 풀려 다른 인스턴스가 이어받음
+        items = _make_files(folder, ["v.jpg"])
+        items[0].new_name = "w.jpg"
+        with mock.patch.object(FileOperations, "_verify", side_effect=OSError("listdir failed")):
+            success, _ = FileOperations.rename_files(folder, items, journal=journal)
+        assert not success and journal._active == {}
+        pending = RenameJournal(Path(tmp) / "journal").pending()
+        assert len(pending) == 1 and pending[0].committed
+        pending[0].discard()
+        print("   ✅ 실패 시 저널 잠금 해제 완료")
+
+
+def test_rename_rollback():
+    """실행 중 실패 시 롤백 테스트"""
+    print("\n" + "=" * 60)
+    print("⏪ 실패 시 롤백 테스트")
+    print("=" * 60)
+
+    import os
+    from unittest import mock
+
+    original_rename = os.rename
+
+    def failing_rename(*fail_at):
+        calls = []
+
+        def rename(source, target, **kwargs):
+            calls.append(target)
+            if len(calls) in fail_at:
+                raise PermissionError("테스트용 실패")
+            return original_rename(source, target, **kwargs)
+        return rename
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        names = ["1.jpg", "2.jpg", "3.jpg", "4.jpg"]
+        items = _make_files(folder, names)
+        for item, name in zip(items, ["2.jpg", "3.jpg", "4.jpg", "5.jpg"]):
+            item.new_name = name
+
+        # 3번째 이름 변경에서 실패 → 앞의 2단계를 역순으로 되돌림
+        with mock.patch.object(os, "rename", failing_rename(3)):
+            success, msg = FileOperations.rename_files(folder, items)
+        print(f"   전체 롤백: {msg.splitlines()[-1]}")
+        assert not success and "모두 원래 이름" in msg
+        assert sorted(p.name for p in folder.iterdir()) == names
+        assert [item.original_name for item in items] == names
+
+        # 되돌리는 도중에도 실패 → 부분 복구로 보고
+        with mock.patch.object(os, "rename", failing_rename(3, 4)):
+            success, msg = FileOperations.rename_files(folder, items)
+        print(f"   부분 롤백: {msg.splitlines()[-1]}")
+        assert not success and "되돌리지 못했습니다" in msg
+        print("   ✅ 실패 유형별 보고")
+
+
+def test_rename_engine():
+    """디렉토리 fd 이름 변경 엔진 테스트"""
+    print("\n" + "=" * 60)
+    print("⚙️ RenameEngine 모듈 테스트")
+    print("=" * 60)
+
+    from core.rename_engine import RenameEngine, PathRenameEngine
+
+    print(f"   dir_fd 지원: {RenameEngine.supports_dir_fd()}")
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp) / "album"
+        folder.mkdir()
+        (folder / "a.jpg").write_bytes(b"abc")
+
+        for engine_class in {type(RenameEngine.open(folder)), PathRenameEngine}:
+            with engine_class(folder) as engine:
+                engine.rename("a.jpg", "b.jpg")
+                assert engine.listdir() == ["b.jpg"] and engine.writable()
+                with engine.scandir() as entries:
+                    assert [entry.stat().st_size for entry in entries] == [3]  # 항목 stat 도 같은 폴더 기준
+                engine.sync()
+                engine.rename("b.jpg", "a.jpg")
+
+        if RenameEngine.supports_dir_fd():
+            # 배치 도중 폴더 이름이 바뀌어도 같은 폴더를 계속 가리킴
+            with RenameEngine.open(folder) as engine:
+                moved = folder.rename(Path(tmp) / "album_moved")
+                engine.rename("a.jpg", "b.jpg")
+            assert (moved / "b.jpg").exists()
+        print("   ✅ 엔진별 이름 변경/조회 완료")
+
+
+def test_pipelined_rename():
+    """체인 단위 병렬 실행 (지연 주입으로 네트워크 드라이브 흉내) 테스트"""
+    print("\n" + "=" * 60)
+    print("🚀 병렬 이름 변경 테스트")
+    print("=" * 60)
+
+    import time
+    from core.rename_engine import RenameEngine, LatencyInjectingEngine
+    from core.rename_planner import RenamePlanner
+    from core.file_operations import RenameExecutionError
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        # 독립된 변경 40개 + 순환 1개 (x ↔ y, 체인 안 순서 유지 필요)
+        sources = [f"a{i}.jpg" for i in range(40)] + ["x.jpg", "y.jpg"]
+        targets = [f"n{i}.jpg" for i in range(40)] + ["y.jpg", "x.jpg"]
+        _make_files(folder, sources)
+        (folder / "x.jpg").write_bytes(b"x")
+
+        elapsed = {}
+        for workers, (before, after) in ((1, (sources, targets)), (8, (targets, sources))):
+            plan = RenamePlanner.plan(before, after)
+            with LatencyInjectingEngine(RenameEngine.open(folder), latency=0.01) as engine:
+                start = time.perf_counter()
+                FileOperations.apply_plan(folder, plan, engine=engine, workers=workers)
+                elapsed[workers] = time.perf_counter() - start
+            assert sorted(p.name for p in folder.iterdir()) == sorted(after)
+        assert (folder / "x.jpg").read_bytes() == b"x"
+        print(f"   순차 {elapsed[1]:.2f}s / 병렬(8) {elapsed[8]:.2f}s")
+        assert elapsed[8] < elapsed[1] / 2
+
+        # 한 체인이 실패하면 모든 스레드가 멈추고 실행된 단계를 전부 되돌림
+        class FailingEngine(LatencyInjectingEngine):
+            def rename(self, source, target):
+                if target == "n20.jpg":
+                    raise PermissionError("테스트용 실패")
+                super().rename(source, target)
+
+        plan = RenamePlanner.plan(sources, targets)
+        with FailingEngine(RenameEngine.open(folder), latency=0.001) as engine:
+            try:
+                FileOperations.apply_plan(folder, plan, engine=engine, workers=8)
+                assert False, "실패가 전달되어야 함"
+            except RenameExecutionError as e:
+                assert e.rolled_back
+        assert sorted(p.name for p in folder.iterdir()) == sorted(sources)
+        print("   ✅ 병렬 실행 / 실패 시 전체 롤백 완료")
+
+
+def test_background_task():
+    """백그라운드 실행 / 진행 상황 / 취소 테스트"""
+    print("\n" + "=" * 60)
+    print("🧵 BackgroundTask 모듈 테스트")
+    print("=" * 60)
+
+    from core.background_task import BackgroundTask
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        names = [f"{i}.jpg" for i in range(1, 6)]
+        items = _make_files(folder, names)
+        for item in items:
+            item.new_name = "new_" + item.original_name
+
+        # 첫 단계 보고 시점에 취소 → 다음 단계 전에 멈추고 되돌림
+        def run(progress, cancel_event):
+            def report(done, total):
+                progress(done, total)
+                cancel_event.set()
+            return FileOperations.rename_files(folder, items, progress=report, cancel_event=cancel_event)
+
+        task = BackgroundTask(run, name="test")
+        task.start()
+        assert task.join(timeout=5)
+        success, msg = task.result
+        print(f"   취소 결과: {msg.splitlines()[0]} / 진행 {task.progress}")
+        assert not success and "취소" in msg and task.progress == (1, 5)
+        assert sorted(p.name for p in folder.iterdir()) == names
+
+        task = BackgroundTask(lambda progress, cancel_event: FileOperations.rename_files(
+            folder, items, progress=progress, cancel_event=cancel_event))
+        task.start()
+        assert task.join(timeout=5) and task.result == (True, "")
+        assert task.progress == (5, 5)
+
+        # 되돌리기(Undo)도 같은 방식으로 진행 상황 보고 / 취소 (취소 시 되돌리기 전 상태 유지)
+        new_names = [item.original_name for item in items]
+        def run_undo(progress, cancel_event):
+            def report(done, total):
+                progress(done, total)
+                cancel_event.set()
+            return FileOperations.restore_files(folder, names, new_names, progress=report, cancel_event=cancel_event)
+
+        task = BackgroundTask(run_undo, name="undo")
+        task.start()
+        assert task.join(timeout=5)
+        assert not task.result[0] and task.progress == (1, 5)
+        assert sorted(p.name for p in folder.iterdir()) == sorted(new_names)
+
+        task = BackgroundTask(lambda progress, cancel_event: FileOperations.restore_files(
+            folder, names, new_names, progress=progress, cancel_event=cancel_event))
+        task.start()
+        assert task.join(timeout=5) and task.result == (True, "")
+        assert task.progress == (5, 5)
+        assert sorted(p.name for p in folder.iterdir()) == names
+        print("   ✅ 백그라운드 실행 완료")
+
+
+def test_rename_folders():
+    """여러 폴더 병렬 변경 / 그룹 Undo 테스트"""
+    print("\n" + "=" * 60)
+    print("🗂️  폴더 병렬 변경 / 그룹 Undo 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        parent = Path(tmp)
+        jobs, members, originals = [], [], {}
+        for f in range(3):
+            folder = parent / f"sub{f}"
+            folder.mkdir()
+            names = [f"{chr(97 + i)}.jpg" for i in range(4)]
+            items = _make_files(folder, names)
+            # 연속 번호 (폴더마다 앞선 폴더의 파일 수만큼 이어서)
+            for i, item in enumerate(items):
+                item.new_name = f"{f * 4 + i + 1}.jpg"
+            jobs.append((folder, items))
+            originals[folder] = names
+
+        # 한 폴더는 배치 밖 파일과 충돌 → 그 폴더만 실패, 나머지는 영향 없음
+        (parent / "sub1" / "6.jpg").write_bytes(b"")
+        reports = []
+        results = FileOperations.rename_folders(jobs, progress=lambda d, t: reports.append((d, t)),
+                                                max_workers=2)
+        print(f"   결과: {[ok for ok, _ in results]}")
+        assert [ok for ok, _ in results] == [True, False, True]
+        assert sorted(p.name for p in (parent / "sub2").iterdir()) == ["10.jpg", "11.jpg", "12.jpg", "9.jpg"]
+        assert "6.jpg" in sorted(p.name for p in (parent / "sub1").iterdir())
+        assert reports and reports[-1][0] == reports[-1][1]
+
+        # 성공한 폴더만 하나의 그룹 기록으로 저장
+        manager = UndoManager(log_file=parent / "undo.json")
+        for (folder, items), (ok, _) in zip(jobs, results):
+            if ok:
+                members.append((folder, originals[folder], [item.original_name for item in items]))
+        manager.save_group(parent, members)
+        index, member = manager.last_operation(parent / "sub2")
+        assert member["after"][0] == "9.jpg" and "timestamp" in member
+        assert not manager.has_undo(parent / "sub1")
+
+        # 그룹 전체 병렬 복구
+        index, group = manager.find_last_group(parent)
+        reports = []
+        restored = FileOperations.restore_folders(
+            [(Path(m["folder"]), m["before"], m["after"]) for m in group["group"]],
+            progress=lambda d, t: reports.append((d, t)))
+        assert all(ok for ok, _ in restored)
+        assert reports[-1] == (8, 8)
+        for folder, _ in jobs:
+            if folder.name != "sub1":
+                assert sorted(p.name for p in folder.iterdir()) == originals[folder]
+
+        # 항목별 제거 → 모두 제거되면 그룹 기록 삭제
+        manager.remove_operation(index, [parent / "sub0"])
+        assert manager.has_undo(parent / "sub2") and not manager.has_undo(parent / "sub0")
+        manager.remove_operation(index, [parent / "sub2"])
+        assert not manager.has_operations()
+        print("   ✅ 그룹 기록 저장 / 병렬 복구 / 항목 제거 완료")
+
+
+def test_validate_snapshot():
+    """스캔 이후 폴더 변경 감지 / 목록 보정 테스트"""
+    print("\n" + "=" * 60)
+    print("🔍 스냅샷 검증 테스트")
+    print("=" * 60)
+
+    import os
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        names = ["a.jpg", "b.jpg", "c.jpg", "d.jpg", "e.jpg"]
+        items = _make_files(folder, names)
+
+        report = FileOperations.validate_snapshot(folder, items)
+        assert not report.has_drift and report.writable
+        assert sorted(report.names) == names
+
+        # 삭제 / 다른 프로그램의 이름 변경 / 내용 변경 / 교체 / 추가
+        (folder / "a.jpg").unlink()
+        (folder / "b.jpg").rename(folder / "b2.jpg")
+        os.utime(folder / "c.jpg", ns=(0, 10 ** 9))
+        (folder / "d.tmp").write_bytes(b"other")
+        os.replace(folder / "d.tmp", folder / "d.jpg")
+        (folder / "new.png").write_bytes(b"")
+        (folder / "notes.txt").write_bytes(b"")
+
+        report = FileOperations.validate_snapshot(folder, items)
+        print("   " + report.summary().replace("\n", " / "))
+        assert report.missing == [0] and report.moved == {1: "b2.jpg"}
+        assert report.modified == [2] and report.replaced == [3] and report.added == ["new.png"]
+
+        # 재스캔 없이 목록 보정 → 다시 검증하면 변경 없음
+        refreshed = report.apply(items)
+        assert [item.original_name for item in refreshed] == ["b2.jpg", "c.jpg", "d.jpg", "e.jpg", "new.png"]
+        assert not FileOperations.validate_snapshot(folder, refreshed).has_drift
+
+        # 리넴 자신의 이름 변경은 지문을 바꾸지 않음
+        for item in refreshed:
+            item.new_name = "x_" + item.original_name
+        assert FileOperations.rename_files(folder, refreshed) == (True, "")
+        assert not FileOperations.validate_snapshot(folder, refreshed).has_drift
+        print("   ✅ 변경 분류 / 목록 보정 완료")
+
+
+def test_model_after_rename():
+    """재스캔 없이 실행 결과를 메모리 모델에 반영하는지 테스트"""
+    print("\n" + "=" * 60)
+    print("🧠 이름 변경 후 모델 갱신 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        items = _make_files(folder, ["a.jpg", "b.png"])
+        items[0].dimensions = (640, 480)
+        fingerprints = [item.fingerprint for item in items]
+        for item, name in zip(items, ["1.jpg", "2.jpg"]):
+            item.new_name = name
+
+        stamp = FileOperations.folder_stamp(folder)
+        assert FileOperations.rename_files(folder, items) == (True, "")
+        after = FileOperations.folder_stamp(folder)
+        assert after is not None and after != stamp
+
+        # 이름/경로/확장자는 갱신, 지문과 캐시된 메타데이터는 유지
+        assert [item.display_name for item in items] == ["1.jpg", "2.jpg"]
+        assert items[1].ext == ".jpg" and items[1].original_path == folder / "2.jpg"
+        assert [item.fingerprint for item in items] == fingerprints
+        assert items[0].dimensions == (640, 480)
+        assert FileOperations.folder_stamp(folder) == after
+        print("   ✅ 모델 갱신 / 폴더 상태 확인 완료")
+
+
+def test_verify_folder():
+    """실행 후 목록 1회 조회 검증 테스트"""
+    print("\n" + "=" * 60)
+    print("✔️  실행 후 검증 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        names = [f"{i}.jpg" for i in range(1000)]
+        items = _make_files(folder, names)
+        for item in items:
+            item.new_name = "v_" + item.original_name
+        # 검증 문제가 없으면 메시지 없음
+        assert FileOperations.rename_files(folder, items) == (True, "")
+
+        expected = [item.original_name for item in items]
+        report = FileOperations.verify_folder(folder, expected, names)
+        assert report.ok and report.summary() == ""
+
+        # 최종 이름 누락 / 원래 이름 잔존 / 임시 이름 잔존
+        (folder / "v_5.jpg").unlink()
+        (folder / "7.jpg").write_bytes(b"")
+        (folder / "__renam_temp_0__.jpg").write_bytes(b"")
+        report = FileOperations.verify_folder(folder, expected, names)
+        print("   " + report.summary().replace("\n", " / "))
+        assert report.missing == ["v_5.jpg"] and report.leftover == ["7.jpg"]
+        assert report.temp == ["__renam_temp_0__.jpg"] and not report.ok
+        print("   ✅ 누락 / 잔존 / 임시 이름 검출 완료")
+
+
+def test_undo_store():
+    """추가 전용 Undo 저장소 (삭제 표시 / 압축 / 보존 정책 / 예전 형식 변환) 테스트"""
+    print("\n" + "=" * 60)
+    print("🗄️  UndoStore 모듈 테스트")
+    print("=" * 60)
+
+    import json
+    from datetime import datetime, timedelta
+    from core.undo_store import UndoStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / "undo_log.json"
+
+        # 예전 형식 (JSON 배열) → 처음 열 때 변환
+        log.write_text(json.dumps([{"folder": "/a", "before": ["1.jpg"], "after": ["x.jpg"],
+                                    "timestamp": "2020-01-01T00:00:00"}]), encoding="utf-8")
+        manager = UndoManager(log_file=log, max_logs=None)
+        assert manager.has_undo(Path("/a"))
+        assert not log.read_text(encoding="utf-8").startswith("[")
+
+        # 추가/삭제는 파일 끝에 덧붙이기만 함
+        size = log.stat().st_size
+        first = manager.save_operation(Path("/b"), ["1.jpg"], ["y.jpg"])
+        group = manager.save_group(Path("/p"), [(Path("/p/1"), ["a"], ["b"]), (Path("/p/2"), ["c"], ["d"])])
+        assert log.read_text(encoding="utf-8").count("\n") == 3 and log.stat().st_size > size
+        manager.remove_operation(first)
+        manager.remove_operation(group, [Path("/p/1")])
+        assert not manager.has_undo(Path("/b")) and not manager.has_undo(Path("/p/1"))
+        assert manager.last_operation(Path("/p/2"))[0] == group
+
+        # 다시 열어도 같은 상태 (잘린 마지막 줄은 무시)
+        with open(log, "a", encoding="utf-8") as f:
+            f.write('{"type": "op", "id": "broken", "fol')
+        reopened = UndoManager(log_file=log, max_logs=None)
+        assert [op["folder"] for op in reopened.get_all_operations()] == ["/a", "/p"]
+        assert reopened.find_last_group(Path("/p"))[1]["group"][0]["folder"] == "/p/2"
+
+        # 잘린 줄 뒤에 추가해도 새 기록은 온전한 줄로 남음
+        appended = reopened.save_operation(Path("/c"), ["1.jpg"], ["z.jpg"])
+        assert UndoManager(log_file=log, max_logs=None).last_operation(Path("/c"))[0] == appended
+        reopened.remove_operation(appended)
+
+        # 압축: 살아 있는 기록만 남김
+        reopened.store.compact()
+        lines = log.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert [op["folder"] for op in UndoManager(log_file=log).get_all_operations()] == ["/a", "/p"]
+
+        # 보존 정책: 기간 / 크기 (최신 기록 1개는 유지)
+        store = UndoStore(Path(tmp) / "age.jsonl", max_logs=None, max_age=timedelta(days=30))
+        store.append({"folder": "/old", "timestamp": (datetime.now() - timedelta(days=60)).isoformat()})
+        store.append({"folder": "/new", "timestamp": datetime.now().isoformat()})
+        assert [r["folder"] for r in store.records()] == ["/new"]
+
+        store = UndoStore(Path(tmp) / "size.jsonl", max_logs=None, max_bytes=1000)
+        for i in range(5):
+            store.append({"folder": f"/{i}", "after": ["x" * 300]})
+        assert [r["folder"] for r in store.records()] == ["/3", "/4"]
+
+        # 죽은 기록이 쌓이면 백그라운드 압축
+        store.COMPACT_MIN_BYTES = 1
+        store.remove(store.records()[0]["id"])
+        store.wait_compaction()
+        assert len((Path(tmp) / "size.jsonl").read_text(encoding="utf-8").splitlines()) == 1
+        print("   ✅ 추가 전용 기록 / 삭제 표시 / 압축 / 보존 정책 / 변환 완료")
+
+
+def test_undo_cache():
+    """Undo 기록 메모리 캐시 (로그 파일이 바뀐 경우에만 다시 읽기) 테스트"""
+    print("\n" + "=" * 60)
+    print("🧠 Undo 캐시 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / "undo_log.json"
+        first = UndoManager(log_file=log, max_logs=None)
+        second = UndoManager(log_file=log, max_logs=None)
+
+        # 자신이 쓴 기록은 다시 읽지 않음
+        first.save_operation(Path("/a"), ["1.jpg"], ["x.jpg"])
+        generation = first.store.generation
+        for _ in range(100):
+            assert first.has_undo(Path("/a"))
+        assert first.store.generation == generation
+
+        # 다른 인스턴스의 기록은 파일이 바뀐 것을 보고 다시 읽음
+        assert second.has_undo(Path("/a"))
+        generation = second.store.generation
+        assert not second.has_undo(Path("/b"))
+        assert second.store.generation == generation
+
+        operation_id, member = second.last_operation(Path("/a"))
+        assert member["after"] == ["x.jpg"]
+        second.remove_operation(operation_id)
+        assert not first.has_undo(Path("/a"))
+
+        # 다시 읽은 직후의 추가도 색인에 반영
+        second.save_operation(Path("/b"), ["2.jpg"], ["y.jpg"])
+        first.save_operation(Path("/c"), ["3.jpg"], ["z.jpg"])
+        assert first.has_undo(Path("/b")) and first.has_undo(Path("/c"))
+        assert second.has_undo(Path("/c"))
+        print("   ✅ 자신의 기록은 캐시 사용 / 다른 인스턴스 기록은 다시 읽기 완료")
+
+
+def test_undo_codec():
+    """Undo 기록 압축 (정렬 이름 압축 / 순열 / 패턴 재현) 테스트"""
+    print("\n" + "=" * 60)
+    print("🗜️  Undo 기록 압축 테스트")
+    print("=" * 60)
+
+    import json
+    import random
+    from core.undo_codec import UndoCodec
+
+    folder = Path("/photos/trip")
+    # 이름순에서 일부만 옮긴 순서 (날짜순 정렬 / 수동 이동 등)
+    before = [f"DSC_{i:05d}.jpg" for i in range(2000)]
+    rng = random.Random(7)
+    for _ in range(20):
+        before.insert(rng.randrange(len(before)), before.pop(rng.randrange(len(before))))
+    pattern = "{parent}_{0000}"
+    after = NameGenerator.compile(pattern).render_all([FileItem(folder / name, Path(__file__).stat())
+                                                       for name in before], 10)
+
+    # 패턴으로 재현 가능하면 변경 후 이름은 저장하지 않음
+    fields = UndoCodec.encode(folder, before, after, pattern, 10)
+    packed = fields["packed"]
+    assert "pattern" in packed and "after" not in packed and "order" in packed
+    plain_size = len(json.dumps({"before": before, "after": after}))
+    packed_size = len(json.dumps(fields))
+    print(f"   원본 {plain_size} bytes → 압축 {packed_size} bytes")
+    assert packed_size * 10 < plain_size
+    assert UndoCodec.decode(folder, dict(fields, folder=str(folder))) == (before, after)
+
+    # 재현할 수 없으면(충돌 회피로 바뀐 이름 / 파일 정보가 필요한 패턴) 변경 후 이름을 압축 저장
+    changed = list(after)
+    changed[3] = "other (2).jpg"
+    fields = UndoCodec.encode(folder, before, changed, pattern, 10)
+    assert "after" in fields["packed"] and UndoCodec.decode(folder, fields) == (before, changed)
+    fields = UndoCodec.encode(folder, before, after, "{date}_{n}", 0)
+    assert "pattern" not in fields["packed"] and UndoCodec.decode(folder, fields)[1] == after
+
+    shuffled = list(before)
+    rng.shuffle(shuffled)
+    assert UndoCodec.decode(folder, UndoCodec.encode(folder, shuffled, after)) == (shuffled, after)
+
+    # 정렬 순서 그대로면 순열 생략, 파일 수가 적으면 리스트 그대로
+    assert "order" not in UndoCodec.encode(folder, sorted(before), after)["packed"]
+    assert UndoCodec.encode(folder, ["a.jpg"], ["1.jpg"]) == {"before": ["a.jpg"], "after": ["1.jpg"]}
+
+    # 손상된 기록은 ValueError
+    broken = {"packed": {"names": "!!!", "after": ""}, "count": 3}
+    try:
+        UndoCodec.decode(folder, broken)
+        assert False, "손상된 기록을 복원함"
+    except ValueError:
+        pass
+
+    # UndoManager 저장/조회 (다시 열어도 같은 이름 복원)
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / "undo_log.json"
+        manager = UndoManager(log_file=log)
+        manager.save_operation(folder, before, after, pattern, 10)
+        manager.save_group(Path("/photos"), [(folder, before, after)], [(pattern, 10)])
+        reopened = UndoManager(log_file=log)
+        _, member = reopened.last_operation(folder)
+        assert reopened.get_names(member) == (before, after)
+        operation = reopened.get_all_operations()[0]
+        assert reopened.get_names(operation) == (before, after)
+        assert log.stat().st_size * 10 < plain_size * 2
+    print("   ✅ 이름 압축 / 순열 / 패턴 재현 / 손상 감지 완료")
+
+
+def test_undo_history():
+    """여러 작업을 하나의 순 변경으로 합성해 한 번에 되돌리기 테스트"""
+    print("\n" + "=" * 60)
+    print("⏪ 여러 작업 되돌리기 테스트")
+    print("=" * 60)
+
+    # 한 작업 안의 순환, 이후 작업에서 바뀌지 않은 파일, 원래 이름으로 돌아온 파일
+    assert UndoManager.compose([(["a", "b"], ["b", "a"])]) == (["a", "b"], ["b", "a"])
+    assert UndoManager.compose([(["1", "2"], ["2", "1"]), (["x", "y"], ["1", "2"])]) == (["x", "y"], ["2", "1"])
+    assert UndoManager.compose([(["b"], ["a"]), (["a"], ["b"])]) == ([], [])
+    try:
+        UndoManager.compose([(["q"], ["p"]), (["r"], ["q"]), (["s"], ["p"])])
+        assert False, "이어지지 않는 기록을 합성함"
+    except ValueError:
+        pass
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        _make_files(folder, ["a.jpg", "b.jpg", "c.jpg", "d.jpg"])
+        manager = UndoManager(log_file=folder / "undo_log.json", max_logs=None)
+
+        steps = [
+            (["a.jpg", "b.jpg", "c.jpg", "d.jpg"], ["1.jpg", "2.jpg", "3.jpg", "d.jpg"]),
+            (["1.jpg", "2.jpg", "3.jpg"], ["2.jpg", "3.jpg", "1.jpg"]),  # 순환
+            (["2.jpg", "d.jpg"], ["x.jpg", "e.jpg"]),
+            (["e.jpg"], ["d.jpg"]),                                      # 원래 이름으로 복귀
+        ]
+        timestamps = []
+        for before, after in steps:
+            ok, _ = FileOperations.restore_files(folder, after, before)  # before -> after 로 변경
+            assert ok
+            manager.save_operation(folder, before, after)
+            timestamps.append(manager.last_operation(folder)[1]["timestamp"])
+
+        history = manager.history(folder)
+        assert [member["after"] for _, member in history] == [after for _, after in reversed(steps)]
+
+        # 두 번째 작업 시점까지 되돌리기 → 첫 번째 작업 직후 상태
+        operations = manager.operations_since(folder, timestamps[1])
+        assert len(operations) == 3
+        before, after = UndoManager.compose([manager.get_names(member) for _, member in operations])
+        assert "d.jpg" not in after  # 원래 이름으로 돌아온 파일은 건너뜀
+        ok, error_msg = FileOperations.restore_files(folder, before, after)
+        assert ok, error_msg
+        for operation_id, _ in operations:
+            manager.remove_operation(operation_id, [folder])
+        assert sorted(p.name for p in folder.glob("*.jpg")) == ["1.jpg", "2.jpg", "3.jpg", "d.jpg"]
+        assert len(manager.history(folder)) == 1
+
+        # 남은 작업 되돌리기 → 처음 상태
+        before, after = UndoManager.compose([manager.get_names(member) for _, member in manager.history(folder)])
+        assert FileOperations.restore_files(folder, before, after)[0]
+        assert sorted(p.name for p in folder.glob("*.jpg")) == ["a.jpg", "b.jpg", "c.jpg", "d.jpg"]
+    print("   ✅ 작업 합성 / 순환 / 복귀 파일 건너뛰기 / 한 번에 되돌리기 완료")
+
+
+def test_undo_anchors():
+    """inode 기준 되돌리기 (변경 후 다른 프로그램이 바꾼 이름도 복구) 테스트"""
+    print("\n" + "=" * 60)
+    print("⚓ inode 기준 되돌리기 테스트")
+    print("=" * 60)
+
+    import os
+    from core.rename_engine import RenameEngine
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp) / "photos"
+        folder.mkdir()
+        names = [f"IMG_{i:03d}.jpg" for i in range(20)]
+        items = _make_files(folder, names)
+        anchors = FileItem.make_anchors(items)
+        if anchors is None:
+            print("   ⏭️  inode 를 지원하지 않는 파일 시스템 - 건너뜀")
+            return
+
+        for item, name in zip(items, reversed(names)):
+            item.new_name = name  # 순서 뒤집기 (순환 포함)
+        ok, _ = FileOperations.rename_files(folder, items)
+        assert ok
+        after = [item.original_name for item in items]
+
+        # 압축 기록에도 inode 저장
+        manager = UndoManager(log_file=Path(tmp) / "undo_log.json")
+        manager.save_operation(folder, names, after, anchors=anchors)
+        _, member = UndoManager(log_file=Path(tmp) / "undo_log.json").last_operation(folder)
+        assert "packed" in member and manager.get_anchors(member) == anchors
+
+        # 다른 프로그램이 두 파일 이름을 바꾼 뒤 되돌리기
+        os.rename(folder / after[0], folder / "edited.jpg")
+        os.rename(folder / after[1], folder / "temp.jpg")
+
+        # 목록 1회 조회로 inode -> 현재 이름
+        with RenameEngine.open(folder) as engine:
+            listing = engine.listdir_inodes()
+        resolved = FileOperations._resolve_anchors(listing, after, anchors[1])
+        assert resolved[:2] == ["edited.jpg", "temp.jpg"] and resolved[2:] == after[2:]
+
+        ok, error_msg = FileOperations.restore_files(folder, names, after, manager.get_anchors(member))
+        assert ok, error_msg
+        assert sorted(p.name for p in folder.iterdir()) == names
+        for name in names:
+            assert (folder / name).read_bytes() == b""
+
+        # 장치가 다르면 이름으로만 찾음
+        items = [FileItem(folder / name) for name in names[:2]]
+        for item, name in zip(items, ["a.jpg", "b.jpg"]):
+            item.new_name = name
+        assert FileOperations.rename_files(folder, items)[0]
+        os.rename(folder / "a.jpg", folder / "c.jpg")
+        device, inodes = FileItem.make_anchors(items)
+        ok, _ = FileOperations.restore_files(folder, names[:2], ["a.jpg", "b.jpg"], (device + 1, inodes))
+        assert ok and (folder / "c.jpg").exists() and (folder / names[1]).exists()
+
+        # 여러 작업을 합성해 되돌릴 때도 inode 를 합성 결과 순서로 맞춰 전달
+        folder = Path(tmp) / "steps"
+        folder.mkdir()
+        _make_files(folder, ["a.jpg", "b.jpg", "c.jpg"])
+        saved, step_anchors = [], []
+        for before, after in ((["a.jpg", "b.jpg", "c.jpg"], ["1.jpg", "2.jpg", "c.jpg"]),
+                              (["1.jpg", "2.jpg", "c.jpg"], ["2.jpg", "1.jpg", "3.jpg"])):
+            items = [FileItem(folder / name) for name in before]
+            step_anchors.insert(0, FileItem.make_anchors(items))
+            for item, name in zip(items, after):
+                item.new_name = name
+            assert FileOperations.rename_files(folder, items)[0]
+            saved.insert(0, (before, after))  # 최신 순
+        os.rename(folder / "3.jpg", folder / "edited.jpg")
+
+        before, after = UndoManager.compose(saved)
+        composed = UndoManager.compose_anchors(saved, step_anchors, after)
+        assert composed is not None and len(composed[1]) == len(after)
+        assert UndoManager.compose_anchors(saved, [None, step_anchors[1]], after) is None  # 기준 없는 파일
+        ok, error_msg = FileOperations.restore_files(folder, before, after, composed)
+        assert ok, error_msg
+        assert sorted(p.name for p in folder.iterdir()) == ["a.jpg", "b.jpg", "c.jpg"]
+    print("   ✅ inode 로 현재 이름 찾기 / 바뀐 이름 복구 / 장치 확인 / 합성 기록 완료")
+
+
+def test_file_lock():
+    """프로세스 간 잠금 (폴더 작업 / 공유 Undo 기록) 테스트"""
+    print("\n" + "=" * 60)
+    print("🔒 FileLock 모듈 테스트")
+    print("=" * 60)
+
+    import threading
+    from core.file_lock import FileLock, FileLockTimeout
+    from core.undo_store import UndoStore
+
+    if not FileLock.supported():
+        print("   ⏭️  프로세스 간 잠금을 지원하지 않는 플랫폼 - 건너뜀")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 같은 파일을 다른 객체(= 다른 인스턴스)가 잡으면 제한 시간 후 실패
+        path = Path(tmp) / "shared.lock"
+        holder = FileLock(path, timeout=0)
+        with holder:
+            with holder:  # 같은 스레드는 중첩 가능
+                pass
+            try:
+                FileLock(path, timeout=0.1).acquire()
+                assert False, "잠금이 겹치면 FileLockTimeout 이어야 합니다"
+            except FileLockTimeout as e:
+                assert e.path == path
+        with FileLock(path, timeout=0):
+            pass  # 해제 후에는 바로 획득
+
+        # 폴더 잠금: 다른 인스턴스가 작업 중이면 기다리다 실패 (파일은 그대로)
+        folder = Path(tmp) / "photos"
+        folder.mkdir()
+        items = _make_files(folder, ["a.jpg", "b.jpg"])
+        for item, name in zip(items, ["b.jpg", "a.jpg"]):
+            item.new_name = name
+        timeout = FileOperations.FOLDER_LOCK_TIMEOUT
+        FileOperations.FOLDER_LOCK_TIMEOUT = 0.1
+        try:
+            with FileLock(folder):
+                ok, error_msg = FileOperations.rename_files(folder, items)
+                assert not ok and "사용 중" in error_msg
+                ok, _ = FileOperations.restore_files(folder, ["a.jpg"], ["b.jpg"])
+                assert not ok
+        finally:
+            FileOperations.FOLDER_LOCK_TIMEOUT = timeout
+        assert sorted(p.name for p in folder.iterdir()) == ["a.jpg", "b.jpg"]
+        assert not any(p.name.endswith(".lock") for p in folder.iterdir())
+        assert FileOperations.rename_files(folder, items)[0]
+
+        # 같은 Undo 기록을 쓰는 두 인스턴스가 동시에 추가해도 줄이 섞이거나 사라지지 않음
+        log = Path(tmp) / "undo_log.json"
+        stores = [UndoStore(log, max_logs=None), UndoStore(log, max_logs=None)]
+
+        def append_many(store: UndoStore, tag: str):
+            for i in range(50):
+                store.append({"folder": f"/{tag}/{i}", "before": ["a"], "after": ["b"]})
+
+        threads = [threading.Thread(target=append_many, args=(store, tag))
+                   for store, tag in zip(stores, ["x", "y"])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(log.read_text(encoding="utf-8").splitlines()) == 100
+        for store in stores:
+            store.refresh()
+            assert len(store.records()) == 100
+        assert len(UndoStore(log, max_logs=None).records()) == 100
+    print("   ✅ 잠금 제한 시간 / 폴더 작업 직렬화 / 공유 Undo 기록 동시 추가 완료")
+
+
+def test_refresh_scheduler():
+    """미리보기 갱신 요청 합치기 (유휴 시점 / debounce / 증분 정보 병합) 테스트"""
+    print("\n" + "=" * 60)
+    print("⏱️  RefreshScheduler 모듈 테스트")
+    print("=" * 60)
+
+    from gui.refresh_scheduler import RefreshScheduler
+
+    class FakeRoot:
+        """Tk after 흉내 (run_idle / advance 로 시간 진행)"""
+        def __init__(self):
+            self.now = 0
+            self.jobs = {}
+            self.next_id = 0
+
+        def after(self, delay, func):
+            self.next_id += 1
+            self.jobs[self.next_id] = (self.now + delay, func)
+            return self.next_id
+
+        def after_idle(self, func):
+            return self.after(0, func)
+
+        def after_cancel(self, job):
+            self.jobs.pop(job, None)
+
+        def advance(self, ms):
+            self.now += ms
+            for job, (due, func) in sorted(self.jobs.items(), key=lambda kv: kv[1][0]):
+                if due <= self.now and job in self.jobs:
+                    del self.jobs[job]
+                    func()
+
+    root = FakeRoot()
+    calls = []
+    scheduler = RefreshScheduler(root, lambda changed, removed: calls.append((changed, removed)))
+
+    # 한 동작에서 여러 번 요청 → 유휴 시점에 1회 (전체 갱신이 섞이면 전체)
+    scheduler.request()
+    scheduler.request(changed=(3, 5))
+    assert scheduler.pending and not calls
+    root.advance(0)
+    assert calls == [(None, None)] and not scheduler.pending
+
+    # 순서 변경 구간끼리는 넓혀서 합침, 제거가 섞이면 전체 갱신
+    calls.clear()
+    scheduler.request(changed=(3, 5))
+    scheduler.request(changed=(1, 4))
+    root.advance(0)
+    scheduler.request(removed=[2, 7])
+    root.advance(0)
+    scheduler.request(removed=[1])
+    scheduler.request(changed=(0, 2))
+    root.advance(0)
+    assert calls == [((1, 5), None), (None, [2, 7]), (None, None)]
+
+    # debounce: 입력이 이어지는 동안 미루고, 멈춘 뒤 1회
+    calls.clear()
+    for _ in range(10):
+        scheduler.request(delay_ms=150)
+        root.advance(100)
+    assert not calls
+    root.advance(150)
+    assert calls == [(None, None)]
+
+    # debounce 중에 온 순서 변경 구간도 합쳐서 1회
+    calls.clear()
+    scheduler.request(changed=(4, 6), delay_ms=150)
+    root.advance(100)
+    scheduler.request(changed=(2, 3), delay_ms=150)
+    root.advance(100)
+    assert not calls
+    root.advance(50)
+    assert calls == [((2, 6), None)]
+
+    # 유휴 예약이 있으면 debounce 요청은 그 갱신에 포함, debounce 중 즉시 요청은 유휴 시점으로 앞당김
+    calls.clear()
+    scheduler.request(changed=(1, 1))
+    scheduler.request(changed=(5, 5), delay_ms=150)
+    root.advance(0)
+    assert calls == [((1, 5), None)] and not root.jobs
+    scheduler.request(delay_ms=150)
+    scheduler.request()
+    root.advance(0)
+    assert calls == [((1, 5), None), (None, None)] and not root.jobs
+
+    # 바로 필요하면 flush, 취소하면 실행 안 함
+    calls.clear()
+    scheduler.request(delay_ms=150)
+    assert scheduler.flush() and calls == [(None, None)] and not scheduler.flush()
+    scheduler.request(changed=(0, 1))
+    scheduler.cancel()
+    root.advance(1000)
+    assert calls == [(None, None)] and not root.jobs
+    print("   ✅ 요청 합치기 / 증분 정보 병합 / debounce / flush 완료")
+
+
+def test_preview_viewport():
+    """미리보기 가상 스크롤 계산 (슬롯 수 / 스크롤 위치 / 슬롯별 내용 / 다시 그릴 슬롯) 테스트"""
+    print("\n" + "=" * 60)
+    print("🪟 PreviewViewport 모듈 테스트")
+    print("=" * 60)
+
+    from gui.preview_viewport import PreviewViewport as V
+
+    # 높이 100px, 행 32px → 완전히 보이는 행 3개 + 걸친 행 1개 = 슬롯 4개
+    assert V.visible_rows(100, 32) == 3 and V.slot_count(100, 32) == 4
+    assert V.visible_rows(0, 32) == 1 and V.slot_count(0, 32) == 1  # 배치 전(높이 0)에도 1개
+    # Treeview 는 헤더(30px)가 목록 영역 안에 있음 → 헤더를 뺀 높이로 계산
+    assert V.visible_rows(130, 32, header=30) == 3 and V.slot_count(130, 32, header=30) == 4
+    assert V.slot_count(20, 32, header=30) == 1
+
+    # 스크롤 위치는 마지막 화면까지만, 목록이 줄면 보정
+    assert V.clamp_top(8, 10, 3) == 7 and V.clamp_top(-2, 10, 3) == 0 and V.clamp_top(5, 2, 3) == 0
+
+    # 슬롯 → 파일 인덱스 (파일이 없는 슬롯은 숨김)
+    assert V.slot_indices(7, 4, 10) == [7, 8, 9, None]
+    assert V.slot_indices(0, 4, 0) == [None] * 4
+
+    # 스크롤바 명령 / 보이게 스크롤 / 스크롤바 비율
+    assert V.scroll_target("moveto", "0.5", None, 0, 10, 3) == 5
+    assert V.scroll_target("scroll", "1", "pages", 2, 10, 3) == 5
+    assert V.scroll_target("scroll", "-1", "units", 2, 10, 3) == 1
+    assert V.follow(9, 0, 3) == 7 and V.follow(1, 4, 3) == 1 and V.follow(5, 4, 3) == 4
+    assert V.scrollbar_position(7, 10, 3) == (0.7, 1.0) and V.scrollbar_position(0, 0, 3) == (0.0, 1.0)
+    print("   ✅ 슬롯 수 / 위치 보정 / 슬롯 대응 / 스크롤바 계산 완료")
+
+    # 슬롯별 내용: 선택 > 짝/홀 배경, 새 파일명은 보이는 행만 계산
+    with tempfile.TemporaryDirectory() as tmp:
+        items = _make_files(Path(tmp), [f"{i}.jpg" for i in range(6)])
+        names = [f"{i}.jpg" if i % 3 else f"n{i}.jpg" for i in range(6)]
+        requested = []
+
+        class Names:
+            def __getitem__(self, i):
+                requested.append(i)
+                return names[i]
+
+        states = V.slot_states(4, 3, items, Names(), {5})
+        assert states == [("4.jpg", "4.jpg", False, V.BACKGROUND_EVEN),
+                          ("5.jpg", "5.jpg", False, V.BACKGROUND_SELECTED), None]
+        assert requested == [4, 5]
+
+        # 다시 그릴 슬롯: 두 항목 자리 바꿈 → 두 슬롯, 선택 이동 → 두 슬롯, 변화 없음 → 없음
+        shown = V.slot_states(0, 4, items, names, set())
+        assert V.dirty_slots(shown, V.slot_states(0, 4, items, names, set())) == []
+        swapped = [items[1], items[0]] + items[2:]
+        assert V.dirty_slots(shown, V.slot_states(0, 4, swapped, [names[1], names[0]] + names[2:], set())) == [0, 1]
+        assert V.dirty_slots(V.slot_states(0, 4, items, names, {1}), V.slot_states(0, 4, items, names, {2})) == [1, 2]
+        assert V.dirty_slots(shown, V.slot_states(0, 4, items[:2], names, set())) == [2, 3]  # 목록 축소 → 숨김
+
+        # Treeview 태그: 배경 태그 + 변경 여부
+        assert V.row_tags(shown[0]) == (V.BACKGROUND_EVEN, V.TAG_CHANGED) and V.row_tags(shown[1]) == (V.BACKGROUND_ODD,)
+    print("   ✅ 슬롯 내용 / 다시 그릴 슬롯 / 행 태그 완료")
+
+
 def test_undo_manager():
     """Undo 관리 모듈 테스트"""
     print("\n" + "=" * 60)
@@ -169,8 +1446,9 @@ def test_undo_manager():
     removed = manager.remove_last_operation()
     print(f"   제거 결과: {'✅ 성공' if removed else '❌ 실패'}")
 
-    # 정리
+    # 정리 (잠금 파일은 다른 인스턴스가 잡고 있을 수 있어 저장소가 지우지 않음)
     manager.clear_all()
+    test_log.with_name(test_log.name + ".lock").unlink(missing_ok=True)
     print("   ✅ 테스트 로그 삭제 완료")
 
 
@@ -222,6 +1500,29 @@ def main():
         test_integration(file_items)
 
     test_name_generator()
+    test_name_template()
+    test_name_substitution()
+    test_name_view()
+    test_collision_index()
+    test_duplicate_tracker()
+    test_rename_planner()
+    test_rename_journal()
+    test_rename_rollback()
+    test_rename_engine()
+    test_pipelined_rename()
+    test_background_task()
+    test_rename_folders()
+    test_validate_snapshot()
+    test_model_after_rename()
+    test_verify_folder()
+    test_undo_store()
+    test_undo_cache()
+    test_undo_codec()
+    test_undo_history()
+    test_undo_anchors()
+    test_file_lock()
+    test_refresh_scheduler()
+    test_preview_viewport()
     test_undo_manager()
 
     print("\n" + "=" * 60)